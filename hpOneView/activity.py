@@ -225,10 +225,7 @@ class activity(object):
 
     @deprecated
     def download_audit_logs(self, filename):
-        body = self._con.get(uri['audit-logs-download'])
-        f = open(filename, 'wb')
-        f.write(body)
-        f.close()
+        self._con.download(uri['audit-logs-download'], filename)
         return
 
     ###########################################################################
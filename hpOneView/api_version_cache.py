@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*
+
+"""
+api_version_cache.py
+~~~~~~~~~~~~~~
+
+This module implements the cache of the API versions supported by each appliance, so connections do not check them
+on every login.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from future import standard_library
+
+standard_library.install_aliases()
+
+__title__ = 'api_version_cache'
+__version__ = '0.0.1'
+__copyright__ = '(C) Copyright (2012-2016) Hewlett Packard Enterprise ' \
+                ' Development LP'
+__license__ = 'MIT'
+__status__ = 'Development'
+
+###
+# (C) Copyright (2012-2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from hpOneView.session_store import write_private_file
+
+DEFAULT_VERSION_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.hpOneView', 'versions')
+DEFAULT_VERSION_CACHE_TTL = 3600
+
+
+class ApiVersionCache(object):
+    """
+    Keeps the response of /rest/version of each appliance for a TTL.
+
+    The versions are kept in memory, shared by all the connections of the process, and optionally in a directory
+    shared with other processes.
+    """
+    _versions = {}
+    _lock = threading.Lock()
+
+    def __init__(self, path=None, ttl=DEFAULT_VERSION_CACHE_TTL):
+        """
+        Args:
+            path: Optional directory of the version files.
+            ttl: Seconds a version is used before it is checked again.
+        """
+        self._path = path
+        self._ttl = ttl
+
+    def get(self, host):
+        """
+        Gets the versions supported by an appliance.
+
+        Args:
+            host: Appliance address.
+
+        Returns:
+            dict: Response of /rest/version, or None when it is not cached or expired.
+        """
+        with self._lock:
+            version, expires = self._versions.get(host, (None, 0))
+        if version is not None and time.time() < expires:
+            return version
+        if not self._path:
+            return None
+
+        try:
+            with open(self.__get_file_name(host)) as version_file:
+                cached = json.load(version_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if time.time() >= cached.get('expires', 0):
+            return None
+        with self._lock:
+            self._versions[host] = (cached['version'], cached['expires'])
+        return cached['version']
+
+    def store(self, host, version):
+        """
+        Caches the versions supported by an appliance.
+
+        Args:
+            host: Appliance address.
+            version: Response of /rest/version.
+        """
+        expires = time.time() + self._ttl
+        with self._lock:
+            self._versions[host] = (version, expires)
+        if not self._path:
+            return
+
+        write_private_file(self._path, self.__get_file_name(host),
+                           json.dumps({'host': host, 'version': version, 'expires': expires}))
+
+    @classmethod
+    def clear(cls):
+        """
+        Removes the versions kept in memory.
+        """
+        with cls._lock:
+            cls._versions.clear()
+
+    def __get_file_name(self, host):
+        return os.path.join(self._path, hashlib.sha256(host.encode('utf-8')).hexdigest() + '.json')
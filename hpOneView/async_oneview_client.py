@@ -0,0 +1,458 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+"""
+async_oneview_client.py
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module implements an asyncio client for HPE OneView REST API. It requires Python 3.4 or later.
+
+Every call returns an awaitable. Requests run on a bounded thread pool that shares the keep-alive connections of a
+single connection object, and all the tasks in flight are tracked by one polling thread that queries their states
+in bulk, so thousands of pending tasks do not hold one thread each.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from future import standard_library
+
+standard_library.install_aliases()
+
+__title__ = 'AsyncOneViewClient'
+__version__ = '0.0.1'
+__copyright__ = '(C) Copyright (2012-2016) Hewlett Packard Enterprise ' \
+                ' Development LP'
+__license__ = 'MIT'
+__status__ = 'Development'
+
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from hpOneView.exceptions import HPOneViewTimeout, HPOneViewUnknownType
+from hpOneView.oneview_client import OneViewClient
+from hpOneView.resources.resource import ResourceClient, RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED
+from hpOneView.resources.task_monitor import TaskMonitor, TASK_PENDING_STATES, MSG_INVALID_TASK, MSG_TIMEOUT, \
+    UNLIMITED_TIMEOUT, MAX_POLLING_INTERVAL
+
+DEFAULT_MAX_WORKERS = 10
+
+MSG_GENERATOR_NOT_SUPPORTED = '%s yields items as pages are received, which would block the event loop. Use get_all ' \
+                              'instead.'
+
+logger = logging.getLogger(__name__)
+
+
+class TaskPoller(object):
+    """
+    Tracks any number of tasks from a single thread, fetching their states in bulk on every polling round.
+    """
+
+    def __init__(self, task_monitor):
+        self._task_monitor = task_monitor
+        self._lock = threading.Lock()
+        self._waiters = {}
+        self._thread = None
+
+    def submit(self, task, timeout=-1, fetch_resource=True):
+        """
+        Starts tracking a task.
+
+        Args:
+            task: task dict
+            timeout: timeout in seconds
+            fetch_resource: If False, the URI of the associated resource is the result instead of the resource.
+
+        Returns:
+            concurrent.futures.Future: Resolved with the same result returned by TaskMonitor.wait_for_task.
+        """
+        if not task or 'uri' not in task:
+            raise HPOneViewUnknownType(MSG_INVALID_TASK)
+
+        future = Future()
+        deadline = None if timeout == UNLIMITED_TIMEOUT else time.time() + timeout
+
+        with self._lock:
+            self._waiters.setdefault(task['uri'], []).append((future, fetch_resource, timeout, deadline))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.__run, name='oneview-task-poller')
+                self._thread.daemon = True
+                self._thread.start()
+
+        return future
+
+    def __run(self):
+        i = 0
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._thread = None
+                    return
+                task_uris = list(self._waiters)
+
+            try:
+                tasks, errors = self._task_monitor.get_tasks(task_uris)
+            except Exception as e:
+                # The round is retried after a longer interval, so a transient error only fails the tasks whose
+                # timeout expires meanwhile
+                logger.warning('Polling of %d tasks failed: %s. Retrying...' % (len(task_uris), e))
+                tasks, errors = [], {}
+
+            for task in tasks:
+                if task.get('taskState') not in TASK_PENDING_STATES:
+                    self.__complete(task)
+
+            for task_uri, error in errors.items():
+                self.__fail(task_uri, error)
+
+            self.__expire_waiters()
+
+            with self._lock:
+                if not self._waiters:
+                    continue
+
+            i = i + 1 if i < MAX_POLLING_INTERVAL else MAX_POLLING_INTERVAL
+            time.sleep(i)
+
+    def __complete(self, task):
+        with self._lock:
+            waiters = self._waiters.pop(task.get('uri'), [])
+
+        for future, fetch_resource, timeout, deadline in waiters:
+            try:
+                future.set_result(self._task_monitor.get_task_response(task, fetch_resource))
+            except Exception as e:
+                future.set_exception(e)
+
+    def __fail(self, task_uri, error):
+        with self._lock:
+            waiters = self._waiters.pop(task_uri, [])
+
+        for future, fetch_resource, timeout, deadline in waiters:
+            future.set_exception(error)
+
+    def __expire_waiters(self):
+        now = time.time()
+        expired = []
+        with self._lock:
+            for task_uri, waiters in list(self._waiters.items()):
+                expired += [waiter for waiter in waiters if waiter[3] is not None and waiter[3] < now]
+                waiters = [waiter for waiter in waiters if waiter[3] is None or waiter[3] >= now]
+                if waiters:
+                    self._waiters[task_uri] = waiters
+                else:
+                    del self._waiters[task_uri]
+
+        for future, fetch_resource, timeout, deadline in expired:
+            future.set_exception(HPOneViewTimeout(MSG_TIMEOUT % str(timeout)))
+
+
+class AsyncTaskMonitor(object):
+    """
+    asyncio counterpart of TaskMonitor.
+    """
+
+    def __init__(self, con, loop):
+        self._loop = loop
+        self._poller = TaskPoller(TaskMonitor(con))
+
+    def wait_for_task(self, task, timeout=-1, fetch_resource=True):
+        """
+        Wait for task execution and return associated resource.
+
+        Args:
+            task: task dict
+            timeout: timeout in seconds
+            fetch_resource: If False, the URI of the associated resource is returned instead of the resource.
+
+        Returns:
+            asyncio.Future: Associated resource when creating or updating; True when deleting.
+        """
+        return asyncio.wrap_future(self._poller.submit(task, timeout, fetch_resource), loop=self._loop)
+
+
+class AsyncResourceClient(object):
+    """
+    asyncio counterpart of ResourceClient. Every method returns an asyncio.Future.
+    """
+
+    def __init__(self, con, uri, loop, executor, task_monitor):
+        self._connection = con
+        self._uri = uri
+        self._client = ResourceClient(con, uri)
+        self._loop = loop
+        self._executor = executor
+        self._task_monitor = task_monitor
+
+    def get(self, id_or_uri):
+        """
+        Args:
+            id_or_uri: Can be either the resource ID or the resource URI.
+
+        Returns:
+             asyncio.Future: The requested resource.
+        """
+        return self.__run(self._client.get, id_or_uri)
+
+    def get_all(self, start=0, count=-1, filter='', query='', sort='', view='', fields='', uri=None):
+        """
+        Gets all items according with the given arguments. See ResourceClient.get_all.
+
+        Returns:
+            asyncio.Future: A list of items matching the specified filter.
+        """
+        return self.__run(self._client.get_all, start, count, filter=filter, query=query, sort=sort, view=view,
+                          fields=fields, uri=uri)
+
+    def create(self, resource, uri=None, timeout=-1, custom_headers=None):
+        """
+        Makes a POST request to create a resource and waits for its task without holding a thread.
+
+        Args:
+            resource (dict): Object to create.
+            uri: Can be either the resource ID or the resource URI.
+            timeout: Timeout in seconds.
+            custom_headers: Allows set specific HTTP headers.
+
+        Returns:
+            asyncio.Future: Created resource.
+        """
+        if not resource:
+            raise ValueError(RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED)
+
+        request = self.__run(self._connection.post, uri or self._uri, resource, custom_headers=custom_headers)
+        return self.__wait_for_task(request, timeout)
+
+    def update(self, resource, uri=None, force=False, timeout=-1, custom_headers=None):
+        """
+        Makes a PUT request to update a resource and waits for its task without holding a thread.
+
+        Args:
+            resource (dict): Object to update.
+            uri: Can be either the resource ID or the resource URI.
+            force: If set to true, the operation completes despite any problems with network connectivity or errors
+                on the resource itself.
+            timeout: Timeout in seconds.
+            custom_headers: Allows set specific HTTP headers.
+
+        Returns:
+            asyncio.Future: Updated resource.
+        """
+        if not resource:
+            raise ValueError(RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED)
+
+        uri = uri or resource['uri']
+        if force:
+            uri += '?force=True'
+
+        request = self.__run(self._connection.put, uri, resource, custom_headers=custom_headers)
+        return self.__wait_for_task(request, timeout)
+
+    def delete(self, resource, force=False, timeout=-1, custom_headers=None):
+        """
+        Makes a DELETE request and waits for its task without holding a thread.
+
+        Args:
+            resource: Resource dict, ID or URI.
+            force: If set to true, the operation completes despite any problems with network connectivity or errors
+                on the resource itself.
+            timeout: Timeout in seconds.
+            custom_headers: Allows set specific HTTP headers.
+
+        Returns:
+            asyncio.Future: True when the resource was deleted.
+        """
+        if not resource:
+            raise ValueError(RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED)
+
+        uri = resource.get('uri') if isinstance(resource, dict) else self._client.build_uri(resource)
+        if not uri:
+            raise HPOneViewUnknownType(RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED)
+        if force:
+            uri += '?force=True'
+
+        request = self.__run(self._connection.delete, uri, custom_headers=custom_headers)
+        return self.__wait_for_task(request, timeout, no_task_result=True)
+
+    def __run(self, function, *args, **kwargs):
+        return self._loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
+
+    def __wait_for_task(self, request, timeout, no_task_result=None):
+        result = asyncio.Future(loop=self._loop)
+
+        def on_task_done(task_future):
+            if result.done():
+                return
+            if task_future.exception():
+                result.set_exception(task_future.exception())
+            else:
+                result.set_result(task_future.result())
+
+        def on_response(request_future):
+            if request_future.cancelled():
+                result.cancel()
+                return
+            if request_future.exception():
+                result.set_exception(request_future.exception())
+                return
+
+            task, body = request_future.result()
+            if not task:
+                result.set_result(no_task_result if no_task_result is not None else body)
+                return
+
+            self._task_monitor.wait_for_task(task, timeout).add_done_callback(on_task_done)
+
+        request.add_done_callback(on_response)
+        return result
+
+
+class AsyncResource(object):
+    """
+    Wraps a OneViewClient resource client, so each of its methods returns an asyncio.Future.
+
+    Each call runs on a thread of the executor until it returns. Methods that wait for a task, like create, update
+    and delete, hold their thread until the task completes, so use AsyncOneViewClient.resource_client to wait for
+    many tasks without holding a thread per task. Methods that yield items page by page, like iter_all, are not
+    supported, since consuming them would block the event loop.
+    """
+
+    def __init__(self, resource, loop, executor):
+        self._resource = resource
+        self._loop = loop
+        self._executor = executor
+
+    def __getattr__(self, name):
+        attribute = getattr(self._resource, name)
+        if not callable(attribute):
+            return attribute
+        if name.startswith('iter_') or inspect.isgeneratorfunction(attribute):
+            raise AttributeError(MSG_GENERATOR_NOT_SUPPORTED % name)
+
+        @functools.wraps(attribute)
+        def run_in_executor(*args, **kwargs):
+            return self._loop.run_in_executor(self._executor, functools.partial(attribute, *args, **kwargs))
+
+        return run_in_executor
+
+
+class AsyncOneViewClient(object):
+    """
+    asyncio client for HPE OneView REST API.
+
+    Exposes the same resource properties as OneViewClient, with every method returning an asyncio.Future. Their
+    methods that wait for a task hold a thread of the executor until the task completes: only resource_client creates,
+    updates and deletes resources while their tasks are tracked by the shared poller.
+
+    The constructor does not block the event loop: the login is deferred to the first request, which runs on the
+    executor. Use login to log in right away, e.g. to check the credentials.
+    """
+
+    def __init__(self, config, loop=None, max_workers=DEFAULT_MAX_WORKERS):
+        self.__loop = loop or asyncio.get_event_loop()
+        self.__executor = ThreadPoolExecutor(max_workers)
+        self.__credentials = config['credentials']
+        self.__client = OneViewClient(dict(config, deferred_login=True))
+        self.__task_monitor = AsyncTaskMonitor(self.__client.connection, self.__loop)
+        self.__resources = {}
+
+    @classmethod
+    def from_json_file(cls, file_name, loop=None, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Construct AsyncOneViewClient using a json file.
+
+        Args:
+            file_name: json full path.
+            loop: asyncio event loop.
+            max_workers: Maximum number of requests in flight.
+
+        Returns:
+            AsyncOneViewClient:
+        """
+        with open(file_name) as json_data:
+            config = json.load(json_data)
+
+        return cls(config, loop=loop, max_workers=max_workers)
+
+    @property
+    def connection(self):
+        """
+        Gets the underlying HPE OneView connection shared by all the requests.
+
+        Returns:
+            connection:
+        """
+        return self.__client.connection
+
+    @property
+    def task_monitor(self):
+        """
+        Gets the AsyncTaskMonitor.
+
+        Returns:
+            AsyncTaskMonitor:
+        """
+        return self.__task_monitor
+
+    def login(self):
+        """
+        Logs in on the executor, instead of on the first request.
+
+        Returns:
+            asyncio.Future: Resolved when the login completes.
+        """
+        return self.__loop.run_in_executor(self.__executor,
+                                           functools.partial(self.__client.connection.login, self.__credentials))
+
+    def resource_client(self, uri):
+        """
+        Gets an AsyncResourceClient for the given resource URI.
+
+        Args:
+            uri: Resource collection URI, e.g. '/rest/server-profiles'.
+
+        Returns:
+            AsyncResourceClient:
+        """
+        return AsyncResourceClient(self.__client.connection, uri, self.__loop, self.__executor, self.__task_monitor)
+
+    def close(self):
+        """
+        Waits for the requests in flight and closes the pooled connections.
+        """
+        self.__executor.shutdown(wait=True)
+        self.__client.connection.close_connections()
+
+    def __getattr__(self, name):
+        if name.startswith('_') or not isinstance(getattr(OneViewClient, name, None), property):
+            raise AttributeError(name)
+
+        if name not in self.__resources:
+            self.__resources[name] = AsyncResource(getattr(self.__client, name), self.__loop, self.__executor)
+        return self.__resources[name]
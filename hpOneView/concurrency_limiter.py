@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*
+
+"""
+concurrency_limiter.py
+~~~~~~~~~~~~~~
+
+This module implements the governors of the number of requests sent at the same time to an appliance.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from future import standard_library
+
+standard_library.install_aliases()
+
+__title__ = 'concurrency_limiter'
+__version__ = '0.0.1'
+__copyright__ = '(C) Copyright (2012-2016) Hewlett Packard Enterprise ' \
+                ' Development LP'
+__license__ = 'MIT'
+__status__ = 'Development'
+
+###
+# (C) Copyright (2012-2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import threading
+import time
+
+DEFAULT_INITIAL_LIMIT = 4
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 64
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_LATENCY_TOLERANCE = 2.0
+# Weight of each response when the baseline latency drifts up, so it follows slow changes of the appliance load
+BASELINE_LATENCY_DRIFT = 0.01
+OVERLOAD_STATUSES = (429, 503)
+
+
+class TokenBucket(object):
+    """
+    Static cap of the request rate: up to 'burst' requests at once, refilled at 'rate' requests per second.
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate: Requests per second.
+            burst: Maximum number of requests sent back to back. Defaults to the rate, with a minimum of 1.
+        """
+        self._rate = float(rate)
+        self._burst = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self._burst
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Takes a token, waiting for the bucket to refill when it is empty.
+        """
+        while True:
+            with self._lock:
+                now = time.time()
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+class AIMDLimiter(object):
+    """
+    Adaptive limit of the requests in flight, using additive increase and multiplicative decrease.
+
+    The limit grows by about one request per round of requests while their latency stays close to the lowest latency
+    seen, holds while the latency rises, and is cut by the decrease factor when the appliance reports it is overloaded
+    (429 or 503) or a request times out. Requests sent before a decrease do not decrease it again, so a burst of
+    failures counts as a single overload.
+    """
+
+    def __init__(self, initial_limit=DEFAULT_INITIAL_LIMIT, min_limit=DEFAULT_MIN_LIMIT, max_limit=DEFAULT_MAX_LIMIT,
+                 decrease_factor=DEFAULT_DECREASE_FACTOR, latency_tolerance=DEFAULT_LATENCY_TOLERANCE,
+                 token_bucket=None):
+        """
+        Args:
+            initial_limit: Requests in flight allowed at start.
+            min_limit: Lowest limit reached when backing off.
+            max_limit: Highest limit reached when growing.
+            decrease_factor: Factor applied to the limit on overload.
+            latency_tolerance: Ratio to the baseline latency under which the latency is considered flat.
+            token_bucket: Optional TokenBucket also capping the request rate.
+        """
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._token_bucket = token_bucket
+        self._in_flight = 0
+        self._baseline_latency = None
+        self._last_decrease = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self):
+        with self._condition:
+            return int(self._limit)
+
+    @property
+    def in_flight(self):
+        with self._condition:
+            return self._in_flight
+
+    def acquire(self):
+        """
+        Waits for a free slot, and for a token when the rate is capped.
+
+        Returns:
+            float: Time the request started, to be passed back to release.
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+        if self._token_bucket is not None:
+            self._token_bucket.acquire()
+        return time.time()
+
+    def release(self, started, overloaded=False):
+        """
+        Frees the slot of a finished request and adapts the limit to its outcome.
+
+        Args:
+            started: Value returned by acquire.
+            overloaded: Whether the appliance answered 429 or 503, or the request timed out.
+        """
+        now = time.time()
+        latency = now - started
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                if started >= self._last_decrease:
+                    self._limit = max(float(self._min_limit), int(self._limit * self._decrease_factor))
+                    self._last_decrease = now
+            elif self.__is_latency_flat(latency):
+                self._limit = min(float(self._max_limit), self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    def get_stats(self):
+        """
+        Gets the current state of the limiter.
+
+        Returns:
+            dict: limit, in_flight and baseline_latency, in seconds.
+        """
+        with self._condition:
+            return {'limit': int(self._limit), 'in_flight': self._in_flight,
+                    'baseline_latency': self._baseline_latency}
+
+    def __is_latency_flat(self, latency):
+        if self._baseline_latency is None or latency < self._baseline_latency:
+            self._baseline_latency = latency
+            return True
+        is_flat = latency <= self._baseline_latency * self._latency_tolerance
+        self._baseline_latency += (latency - self._baseline_latency) * BASELINE_LATENCY_DRIFT
+        return is_flat
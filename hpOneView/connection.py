@@ -14,6 +14,7 @@ from __future__ import unicode_literals
 from builtins import open
 from builtins import str
 from future import standard_library
+from past.builtins import basestring
 
 standard_library.install_aliases()
 
@@ -47,22 +48,99 @@ __status__ = 'Development'
 ###
 
 import http.client
-import json
 import logging
 import shutil  # for shutil.copyfileobj()
-import mmap  # so we can upload the iso without having to load it in memory
 import os
+import select
+import socket
 import ssl
+import threading
 import time
+import zlib
 
+from hpOneView.api_version_cache import ApiVersionCache, DEFAULT_VERSION_CACHE_TTL
 from hpOneView.common import uri, get_members, get_member, make_eula_dict, make_initial_password_change_dict
+from hpOneView.concurrency_limiter import AIMDLimiter, TokenBucket, OVERLOAD_STATUSES, DEFAULT_INITIAL_LIMIT, \
+    DEFAULT_MIN_LIMIT, DEFAULT_MAX_LIMIT
 from hpOneView.exceptions import HPOneViewException
+from hpOneView.json_codec import get_default_codec
+from hpOneView.response_cache import ResponseCache, DEFAULT_CACHE_MAX_SIZE
+from hpOneView.retry_policy import RetryPolicy, CircuitBreaker, UNAVAILABLE_STATUSES, DEFAULT_FAILURE_THRESHOLD, \
+    DEFAULT_RESET_TIMEOUT, IDEMPOTENT_METHODS
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_POOL_SIZE = 10
+# Below the keep-alive timeout of common web servers (5 seconds), so idle sockets are rarely closed by the appliance
+DEFAULT_POOL_IDLE_TIMEOUT = 4
+DEFAULT_POOL_MAX_LIFETIME = 600
+# NOTE: Be careful raising this value as the read chunk is stored in RAM
+DEFAULT_UPLOAD_CHUNK_SIZE = 1048576
+MIN_UPLOAD_CHUNK_SIZE = 65536
+MAX_UPLOAD_CHUNK_SIZE = 16777216
+UPLOAD_CHUNK_TARGET_SECONDS = 1.0
+MAX_UPLOAD_RETRY_WAIT = 60
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1048576
+ACCEPTED_ENCODINGS = 'gzip, deflate'
+DECOMPRESSION_WBITS = {'gzip': 16 + zlib.MAX_WBITS, 'deflate': zlib.MAX_WBITS}
+DECOMPRESSION_READ_SIZE = 65536
+
+
+class TLSSessionCache(object):
+    """
+    Holds the last TLS session negotiated with the appliance so new sockets can resume it.
+    """
+
+    def __init__(self):
+        self.session = None
+
+
+class ResumableHTTPSConnection(http.client.HTTPSConnection):
+    """
+    HTTPSConnection that offers a cached TLS session when connecting, so reconnects skip the full handshake.
+    """
+
+    def __init__(self, host, port=None, context=None, session_cache=None, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+        http.client.HTTPSConnection.__init__(self, host, port, timeout=timeout, context=context)
+        self._session_cache = session_cache
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+
+        server_hostname = self._tunnel_host if self._tunnel_host else self.host
+        kwargs = {'server_hostname': server_hostname}
+        if self._session_cache and self._session_cache.session is not None:
+            kwargs['session'] = self._session_cache.session
+
+        self.sock = self._context.wrap_socket(self.sock, **kwargs)
+
+        if self._session_cache and getattr(self.sock, 'session', None) is not None:
+            self._session_cache.session = self.sock.session
+
+
+class PaginationState(threading.local):
+    """
+    Pagination links of the last collection read by the current thread.
+    """
+
+    def __init__(self):
+        self.nextPage = None
+        self.prevPage = None
+        self.numTotalRecords = 0
+        self.numDisplayedRecords = 0
+
 
 class connection(object):
+    """
+    Connection to an HPE OneView appliance.
+
+    A connection can be shared by any number of threads, along with the ResourceClient and TaskMonitor objects built
+    on it. Requests run concurrently on pooled keep-alive connections. The session, the headers and the settings are
+    shared: changing them affects the requests sent afterwards by every thread, never a request in flight. The
+    pagination state read by getNextPage and the related methods is kept per thread, so each thread pages through the
+    collection it read last.
+    """
 
     def __init__(self, applianceIp, api_version=200):
         self._session = None
@@ -72,20 +150,74 @@ class connection(object):
         self._headers = {
             'X-API-Version': self._apiVersion,
             'Accept': 'application/json',
-            'Content-Type': 'application/json'}
+            'Content-Type': 'application/json',
+            'Accept-Encoding': ACCEPTED_ENCODINGS}
         self._proxyHost = None
         self._proxyPort = None
         self._doProxy = False
         self._sslTrustedBundle = None
         self._sslTrustAll = True
-        self._nextPage = None
-        self._prevPage = None
-        self._numTotalRecords = 0
-        self._numDisplayedRecords = 0
+        self._pagination = PaginationState()
+        self._headers_lock = threading.Lock()
         self._validateVersion = False
+        self._pool = []
+        self._pool_lock = threading.Lock()
+        self._pool_size = DEFAULT_POOL_SIZE
+        self._pool_idle_timeout = DEFAULT_POOL_IDLE_TIMEOUT
+        self._pool_max_lifetime = DEFAULT_POOL_MAX_LIFETIME
+        self._request_timeout = None
+        self._ssl_context = None
+        self._tls_session_cache = TLSSessionCache()
+        self._cache = None
+        self._json_codec = get_default_codec()
+        self._compression_stats = {'compressed_responses': 0, 'compressed_bytes': 0, 'uncompressed_bytes': 0}
+        self._compression_stats_lock = threading.Lock()
+        self._limiter = None
+        self._retry_policy = RetryPolicy()
+        self._circuit_breaker = None
+        self._session_store = None
+        self._login_lock = threading.RLock()
+        self._login_deferred = False
+        self._version_cache = ApiVersionCache()
+
+    @property
+    def _nextPage(self):
+        return self._pagination.nextPage
+
+    @_nextPage.setter
+    def _nextPage(self, value):
+        self._pagination.nextPage = value
+
+    @property
+    def _prevPage(self):
+        return self._pagination.prevPage
+
+    @_prevPage.setter
+    def _prevPage(self, value):
+        self._pagination.prevPage = value
+
+    @property
+    def _numTotalRecords(self):
+        return self._pagination.numTotalRecords
+
+    @_numTotalRecords.setter
+    def _numTotalRecords(self, value):
+        self._pagination.numTotalRecords = value
+
+    @property
+    def _numDisplayedRecords(self):
+        return self._pagination.numDisplayedRecords
+
+    @_numDisplayedRecords.setter
+    def _numDisplayedRecords(self, value):
+        self._pagination.numDisplayedRecords = value
 
     def validateVersion(self):
-        version = self.get(uri['version'])
+        version = self._version_cache.get(self._host)
+        if version is None:
+            version = self.get(uri['version'])
+            if isinstance(version, dict):
+                self._version_cache.store(self._host, version)
         if 'minimumVersion' in version:
             if self._apiVersion < version['minimumVersion']:
                 raise HPOneViewException('Unsupported API Version')
@@ -94,14 +226,218 @@ class connection(object):
                 raise HPOneViewException('Unsupported API Version')
         self._validateVersion = True
 
+    def __set_headers(self, changes):
+        # Copy on write: requests read the headers without locking, so the dict they see is never modified
+        with self._headers_lock:
+            headers = self._headers.copy()
+            for name, value in changes.items():
+                if value is None:
+                    headers.pop(name, None)
+                else:
+                    headers[name] = value
+            self._headers = headers
+
     def set_proxy(self, proxyHost, proxyPort):
         self._proxyHost = proxyHost
         self._proxyPort = proxyPort
         self._doProxy = True
+        self.__reset_ssl_context()
 
     def set_trusted_ssl_bundle(self, sslBundle):
         self._sslTrustAll = False
         self._sslTrustedBundle = sslBundle
+        self.__reset_ssl_context()
+
+    def set_connection_pool(self, pool_size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_POOL_IDLE_TIMEOUT,
+                            max_lifetime=DEFAULT_POOL_MAX_LIFETIME):
+        """
+        Configures the pool of keep-alive connections reused between requests.
+
+        Args:
+            pool_size: Maximum number of idle connections kept open. Use 0 to disable the pool.
+            idle_timeout: Seconds an idle connection is kept before it is discarded. Keep it below the keep-alive
+                timeout of the appliance.
+            max_lifetime: Seconds after which a connection is recycled, regardless of its use.
+        """
+        self._pool_size = pool_size
+        self._pool_idle_timeout = idle_timeout
+        self._pool_max_lifetime = max_lifetime
+        self.close_connections()
+
+    def set_request_timeout(self, timeout):
+        """
+        Sets how long a request waits for the appliance on each socket operation, like connecting or reading the
+        response. Timed out requests back off the concurrency limit, and are retried according to the retry policy.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely, which is the default.
+        """
+        self._request_timeout = timeout
+        self.close_connections()
+
+    def close_connections(self):
+        """
+        Closes all idle connections kept in the pool.
+        """
+        with self._pool_lock:
+            pooled, self._pool = self._pool, []
+        for conn, created, last_used in pooled:
+            conn.close()
+
+    def set_concurrency_limit(self, initial_limit=DEFAULT_INITIAL_LIMIT, min_limit=DEFAULT_MIN_LIMIT,
+                              max_limit=DEFAULT_MAX_LIMIT, rate=None, burst=None):
+        """
+        Enables the adaptive limit of the requests sent at the same time to the appliance. It is shared by all the
+        resource clients and task monitors using this connection. The limit grows while the latency stays flat and
+        is cut when the appliance answers 429 or 503, or a request times out.
+
+        Args:
+            initial_limit: Requests in flight allowed at start.
+            min_limit: Lowest limit reached when backing off.
+            max_limit: Highest limit reached when growing.
+            rate: Optional cap of the requests per second.
+            burst: Requests sent back to back within the rate cap. Defaults to the rate.
+
+        Returns:
+            AIMDLimiter: The limiter.
+        """
+        token_bucket = TokenBucket(rate, burst) if rate else None
+        self._limiter = AIMDLimiter(initial_limit, min_limit, max_limit, token_bucket=token_bucket)
+        return self._limiter
+
+    def disable_concurrency_limit(self):
+        """
+        Disables the limit of the requests sent at the same time to the appliance.
+        """
+        self._limiter = None
+
+    def get_concurrency_limiter(self):
+        """
+        Gets the limiter of the requests sent at the same time to the appliance.
+
+        Returns:
+            AIMDLimiter: The limiter, or None when it is disabled.
+        """
+        return self._limiter
+
+    def set_retry_policy(self, retry_policy):
+        """
+        Sets how the requests that fail transiently are retried. By default, idempotent requests are sent up to 3
+        times on connection errors and on 429, 502, 503 and 504 responses, with an exponential backoff.
+
+        Args:
+            retry_policy (RetryPolicy): The policy, or None to never retry.
+        """
+        self._retry_policy = retry_policy
+
+    def get_retry_policy(self):
+        """
+        Gets how the requests that fail transiently are retried.
+
+        Returns:
+            RetryPolicy: The policy, or None when requests are never retried.
+        """
+        return self._retry_policy
+
+    def enable_circuit_breaker(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT):
+        """
+        Enables the circuit breaker, so requests fail fast with HPOneViewCircuitOpen while the appliance is down.
+
+        Args:
+            failure_threshold: Consecutive connection errors or 502, 503 and 504 responses that open the circuit.
+            reset_timeout: Seconds the circuit stays open before a request is let through to probe the appliance.
+
+        Returns:
+            CircuitBreaker: The circuit breaker.
+        """
+        self._circuit_breaker = CircuitBreaker(self._host, failure_threshold, reset_timeout)
+        return self._circuit_breaker
+
+    def disable_circuit_breaker(self):
+        """
+        Disables the circuit breaker.
+        """
+        self._circuit_breaker = None
+
+    def enable_cache(self, ttls=None, max_size=DEFAULT_CACHE_MAX_SIZE):
+        """
+        Enables the cache of GET responses. Cached responses are revalidated with If-None-Match after their TTL,
+        so unchanged resources are served from memory when the appliance answers 304 Not Modified.
+
+        Args:
+            ttls: Dict of URI prefix to the number of seconds responses under it are served without revalidation,
+                like {'/rest/server-hardware-types': 3600}. Only URIs under these prefixes are cached.
+            max_size: Maximum number of responses kept.
+
+        Returns:
+            ResponseCache: The cache, where more prefixes can be registered with set_ttl.
+        """
+        self._cache = ResponseCache(max_size=max_size, ttls=ttls)
+        return self._cache
+
+    def disable_cache(self):
+        """
+        Disables the cache of GET responses and drops the cached ones.
+        """
+        self._cache = None
+
+    def get_cache(self):
+        """
+        Gets the cache of GET responses.
+
+        Returns:
+            ResponseCache: The cache, or None when it is disabled.
+        """
+        return self._cache
+
+    def invalidate_cache(self, uri, collection=False):
+        """
+        Drops the cached responses made stale by a write to a URI: the resource, its sub-resources and the
+        listings of its collection.
+
+        Args:
+            uri: URI of the written resource or collection.
+            collection: Whether the URI is a collection the write added to, like a POST to create a resource. Only
+                the listings of the collection and its parent resource are dropped then, keeping the cached members.
+        """
+        if self._cache is None:
+            return
+        path = uri.split('?', 1)[0].rstrip('/')
+        if collection:
+            self._cache.invalidate_listings(path)
+        else:
+            self._cache.invalidate(path)
+        self._cache.invalidate_listings(path.rsplit('/', 1)[0])
+
+    def set_compression(self, enabled):
+        """
+        Enables or disables the negotiation of gzip and deflate compressed responses. It is enabled by default.
+
+        Args:
+            enabled (bool): Advertises the supported encodings through the Accept-Encoding header.
+        """
+        self.__set_headers({'Accept-Encoding': ACCEPTED_ENCODINGS if enabled else None})
+
+    def get_compression_stats(self):
+        """
+        Gets the number of bytes saved by compressed responses.
+
+        Returns:
+            dict: Number of compressed responses, their compressed and uncompressed sizes and the bytes saved.
+        """
+        with self._compression_stats_lock:
+            stats = self._compression_stats.copy()
+        stats['bytes_saved'] = stats['uncompressed_bytes'] - stats['compressed_bytes']
+        return stats
+
+    def set_json_codec(self, codec):
+        """
+        Sets the codec used to decode JSON responses.
+
+        Args:
+            codec (JSONCodec): Codec instance, like JSONCodec() to force the standard library.
+        """
+        self._json_codec = codec
 
     def get_session(self):
         return self._session
@@ -119,63 +455,225 @@ class connection(object):
         return 'https://%s%s' % (self._host, path)
 
     def do_http(self, method, path, body, custom_headers=None):
-        http_headers = self._headers.copy()
+        http_headers = self.__prepare_request(path)
         if custom_headers:
             http_headers.update(custom_headers)
 
-        bConnected = False
-        while bConnected is False:
+        attempt = 0
+        renewed = False
+        while True:
+            attempt += 1
+            if self._circuit_breaker:
+                self._circuit_breaker.before_request()
+            try:
+                resp, tempbytes = self.__send_request(method, path, body, http_headers)
+            except (http.client.HTTPException, socket.error) as e:
+                self.__record_outcome(failed=True)
+                if not self._retry_policy or not self._retry_policy.should_retry(method, attempt, error=e):
+                    raise
+                wait = self._retry_policy.get_backoff(attempt)
+                logger.warning('%s %s failed: %s. Retrying in %.1f seconds...' % (method, path, e, wait))
+            except BaseException:
+                # Any other failure, e.g. a corrupt compressed body, must still end a trial of the circuit breaker
+                self.__record_outcome(failed=True)
+                raise
+            else:
+                self.__record_outcome(failed=resp.status in UNAVAILABLE_STATUSES)
+                if self.__is_session_expired(resp, path, http_headers, renewed):
+                    self.__renew_session(http_headers['auth'])
+                    http_headers['auth'] = self._headers['auth']
+                    renewed = True
+                    attempt -= 1
+                    continue
+                if not self._retry_policy or not self._retry_policy.should_retry(method, attempt, status=resp.status):
+                    return resp, self.__decode_body(resp, tempbytes, body)
+                wait = self._retry_policy.get_backoff(attempt, resp.getheader('Retry-After'))
+                logger.warning('%s %s answered %d. Retrying in %.1f seconds...' % (method, path, resp.status, wait))
+            time.sleep(wait)
+
+    def __prepare_request(self, path):
+        # Every request path logs in first when the login was deferred, and sends the current session
+        self.__login_if_deferred(path)
+        return self._headers.copy()
+
+    def __is_session_expired(self, resp, path, http_headers, renewed):
+        return resp.status == 401 and not renewed and self._cred is not None and 'auth' in http_headers and \
+            path != uri['loginSessions']
+
+    def __send_request(self, method, path, body, http_headers):
+        limiter = self._limiter
+        while True:
+            started = limiter.acquire() if limiter else None
+            overloaded = False
+            conn, created, reused = self.__acquire_connection()
+            sent = False
+            resp = None
             try:
-                conn = self.get_connection()
                 conn.request(method, path, body, http_headers)
+                sent = True
                 resp = conn.getresponse()
-                try:
-                    tempbytes = resp.read()
-                    tempbody = tempbytes.decode('utf-8')
-                except UnicodeDecodeError:  # Might be binary data
-                    tempbody = tempbytes
-                    conn.close()
-                    bConnected = True
-                    return resp, tempbody
-                if tempbody:
-                    try:
-                        body = json.loads(tempbody)
-                    except ValueError:
-                        body = tempbody
-                conn.close()
-                bConnected = True
-            except http.client.BadStatusLine:
-                print('Bad Status Line. Trying again...')
+                tempbytes = self.__read_body(resp)
+                overloaded = resp.status in OVERLOAD_STATUSES
+            except (http.client.BadStatusLine, socket.error) as e:
                 conn.close()
-                time.sleep(1)
+                overloaded = isinstance(e, socket.timeout)
+                if not self.__is_stale_connection(e, method, reused, sent, resp):
+                    raise
+                # The appliance closed the idle keep-alive socket, so reconnect right away
+                logger.debug('Stale pooled connection. Reconnecting...')
                 continue
-        return resp, body
+            finally:
+                if limiter:
+                    limiter.release(started, overloaded)
+            self.__release_connection(conn, created, resp)
+            return resp, tempbytes
+
+    def __is_stale_connection(self, error, method, reused, sent, resp):
+        # A request may have reached the appliance once it was sent, so only an idempotent one is sent again right
+        # away, and only when no response was received. Any other failure is left to the retry policy.
+        if not reused or resp is not None or isinstance(error, socket.timeout):
+            return False
+        idempotent_methods = self._retry_policy.idempotent_methods if self._retry_policy else IDEMPOTENT_METHODS
+        return not sent or method.upper() in idempotent_methods
+
+    def __record_outcome(self, failed):
+        if self._circuit_breaker:
+            self._circuit_breaker.record(failed)
+
+    def __read_body(self, resp):
+        decompressor = self.__get_decompressor(resp)
+        if decompressor is None:
+            return resp.read()
+        return b''.join(self.__read_chunks(resp, DECOMPRESSION_READ_SIZE, decompressor))
+
+    def __read_chunks(self, resp, chunk_size, decompressor=None):
+        received = 0
+        uncompressed = 0
+        chunk = resp.read(chunk_size)
+        while chunk:
+            if decompressor is not None:
+                received += len(chunk)
+                chunk = decompressor.decompress(chunk)
+                uncompressed += len(chunk)
+            if chunk:
+                yield chunk
+            chunk = resp.read(chunk_size)
+        if decompressor is not None:
+            chunk = decompressor.flush()
+            uncompressed += len(chunk)
+            if chunk:
+                yield chunk
+            with self._compression_stats_lock:
+                self._compression_stats['compressed_responses'] += 1
+                self._compression_stats['compressed_bytes'] += received
+                self._compression_stats['uncompressed_bytes'] += uncompressed
+
+    def __get_decompressor(self, resp):
+        encoding = resp.getheader('Content-Encoding')
+        if not isinstance(encoding, basestring) or encoding.strip().lower() not in DECOMPRESSION_WBITS:
+            return None
+        return zlib.decompressobj(DECOMPRESSION_WBITS[encoding.strip().lower()])
+
+    def __decode_body(self, resp, tempbytes, body):
+        if not tempbytes:
+            return body
+        media_type = self.__get_media_type(resp)
+        if media_type == 'application/json' or media_type.endswith('+json'):
+            try:
+                return self._json_codec.loads(tempbytes)
+            except ValueError:
+                pass
+        elif media_type and not media_type.startswith('text/'):
+            return tempbytes
+        # Unknown content type, or text: keep the body as text, unless it turns out to be JSON or binary data
+        try:
+            tempbody = tempbytes.decode('utf-8')
+        except UnicodeDecodeError:  # Might be binary data
+            return tempbytes
+        if media_type.startswith('text/'):
+            return tempbody
+        try:
+            return self._json_codec.loads(tempbytes)
+        except ValueError:
+            return tempbody
+
+    def __get_media_type(self, resp):
+        content_type = resp.getheader('Content-Type')
+        if not isinstance(content_type, basestring):
+            return ''
+        media_type = content_type.split(';', 1)[0].strip().lower()
+        main_type, _, sub_type = media_type.partition('/')
+        if not main_type or not sub_type or '/' in sub_type:
+            return ''
+        return media_type
+
+    def __acquire_connection(self):
+        now = time.time()
+        with self._pool_lock:
+            while self._pool:
+                conn, created, last_used = self._pool.pop()
+                if now - last_used < self._pool_idle_timeout and now - created < self._pool_max_lifetime and \
+                        not self.__is_connection_dropped(conn):
+                    return conn, created, True
+                conn.close()
+        return self.get_connection(), now, False
+
+    def __is_connection_dropped(self, conn):
+        # An idle socket is readable only when the appliance closed it, or sent data nobody asked for
+        sock = getattr(conn, 'sock', None)
+        if not isinstance(sock, socket.socket):
+            return False
+        try:
+            return bool(select.select([sock], [], [], 0)[0])
+        except (select.error, ValueError):
+            return True
+
+    def __release_connection(self, conn, created, resp):
+        now = time.time()
+        if getattr(resp, 'will_close', True) is not False or now - created >= self._pool_max_lifetime:
+            conn.close()
+            return
+        with self._pool_lock:
+            if len(self._pool) < self._pool_size:
+                self._pool.append((conn, created, now))
+                return
+        conn.close()
 
     def get_connection(self):
-        context = ssl.SSLContext(ssl.PROTOCOL_TLSv1_2)
-        if self._sslTrustAll is False:
-            context.verify_mode = ssl.CERT_REQUIRED
-            context.load_verify_locations(self._sslTrustedBundle)
-            if self._doProxy is False:
-                conn = http.client.HTTPSConnection(self._host,
-                                                   context=context)
-            else:
-                conn = http.client.HTTPSConnection(self._proxyHost,
-                                                   self._proxyPort,
-                                                   context=context)
-                conn.set_tunnel(self._host, 443)
+        context = self.__get_ssl_context()
+        timeout = socket._GLOBAL_DEFAULT_TIMEOUT if self._request_timeout is None else self._request_timeout
+        if self._doProxy is False:
+            conn = ResumableHTTPSConnection(self._host,
+                                            context=context,
+                                            session_cache=self._tls_session_cache,
+                                            timeout=timeout)
         else:
-            context.verify_mode = ssl.CERT_NONE
-            if self._doProxy is False:
-                conn = http.client.HTTPSConnection(self._host,
-                                                   context=context)
-            else:
-                conn = http.client.HTTPSConnection(self._proxyHost,
-                                                   self._proxyPort,
-                                                   context=context)
-                conn.set_tunnel(self._host, 443)
+            conn = ResumableHTTPSConnection(self._proxyHost,
+                                            self._proxyPort,
+                                            context=context,
+                                            session_cache=self._tls_session_cache,
+                                            timeout=timeout)
+            conn.set_tunnel(self._host, 443)
         return conn
 
+    def __get_ssl_context(self):
+        context = self._ssl_context
+        if context is None:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLSv1_2)
+            if self._sslTrustAll is False:
+                context.verify_mode = ssl.CERT_REQUIRED
+                context.load_verify_locations(self._sslTrustedBundle)
+            else:
+                context.verify_mode = ssl.CERT_NONE
+            self._ssl_context = context
+        return context
+
+    def __reset_ssl_context(self):
+        # Sessions are bound to the context that negotiated them, so both are dropped together
+        self._ssl_context = None
+        self._tls_session_cache = TLSSessionCache()
+        self.close_connections()
+
     def encode_multipart_formdata(self, fields, files, baseName, verbose=False):
         """
         Fields is a sequence of (name, value) elements for regular form fields.
@@ -184,76 +682,214 @@ class connection(object):
 
         Returns: (content_type, body) ready for httplib.HTTP instance
         """
-        BOUNDARY = '----------ThIs_Is_tHe_bouNdaRY_$'
-        CRLF = '\r\n'
-        content_type = 'multipart/form-data; boundary=%s' % BOUNDARY
+        content_type, preamble, epilogue = self.__make_multipart_boundaries(baseName)
         if verbose is True:
             print(('Encoding ' + baseName + ' for upload...'))
         fin = open(files, 'rb')
         fout = open(files + '.b64', 'wb')
-        fout.write(bytearray('--' + BOUNDARY + CRLF, 'utf-8'))
-        fout.write(bytearray('Content-Disposition: form-data'
-                             '; name="file"; filename="' +
-                             baseName + '"' + CRLF, "utf-8"))
-        fout.write(bytearray('Content-Type: application/octet-stream' + CRLF,
-                             'utf-8'))
-        fout.write(bytearray(CRLF, 'utf-8'))
+        fout.write(preamble)
         shutil.copyfileobj(fin, fout)
-        fout.write(bytearray(CRLF, 'utf-8'))
-        fout.write(bytearray('--' + BOUNDARY + '--' + CRLF, 'utf-8'))
-        fout.write(bytearray(CRLF, 'utf-8'))
+        fout.write(epilogue)
         fout.close()
         fin.close()
         return content_type
 
-    def post_multipart(self, uri, fields, files, baseName, verbose=False):
-        content_type = self.encode_multipart_formdata(fields, files, baseName,
-                                                      verbose)
-        inputfile = open(files + '.b64', 'rb')
-        mappedfile = mmap.mmap(inputfile.fileno(), 0, access=mmap.ACCESS_READ)
-        if verbose is True:
-            print(('Uploading ' + files + '...'))
-        conn = self.get_connection()
-        # conn.set_debuglevel(1)
-        conn.connect()
-        conn.putrequest('POST', uri)
-        conn.putheader('uploadfilename', baseName)
-        conn.putheader('auth', self._headers['auth'])
-        conn.putheader('Content-Type', content_type)
-        totalSize = os.path.getsize(files + '.b64')
-        conn.putheader('Content-Length', totalSize)
-        conn.putheader('X-API-Version', self._apiVersion)
-        conn.endheaders()
-        while mappedfile.tell() < mappedfile.size():
-            # Send 1MB at a time
-            # NOTE: Be careful raising this value as the read chunk
-            # is stored in RAM
-            readSize = 1048576
-            conn.send(mappedfile.read(readSize))
+    def __make_multipart_boundaries(self, baseName):
+        BOUNDARY = '----------ThIs_Is_tHe_bouNdaRY_$'
+        CRLF = '\r\n'
+        content_type = 'multipart/form-data; boundary=%s' % BOUNDARY
+        preamble = bytearray('--' + BOUNDARY + CRLF +
+                             'Content-Disposition: form-data; name="file"; filename="' + baseName + '"' + CRLF +
+                             'Content-Type: application/octet-stream' + CRLF +
+                             CRLF, 'utf-8')
+        epilogue = bytearray(CRLF + '--' + BOUNDARY + '--' + CRLF + CRLF, 'utf-8')
+        return content_type, bytes(preamble), bytes(epilogue)
+
+    def post_multipart(self, uri, fields, files, baseName, verbose=False, chunk_size=DEFAULT_UPLOAD_CHUNK_SIZE,
+                       progress_callback=None, adaptive_chunk_size=False, max_retries=0):
+        """
+        Uploads a file as multipart/form-data.
+
+        The file is streamed from its source in chunks between the multipart boundaries, so it is never copied
+        to disk nor fully loaded in memory. The appliance does not accept partial uploads, so a retry after a
+        connection failure sends the file again from the beginning. Once the file is fully sent the appliance may be
+        processing it, so a failure while waiting for the response is never retried.
+
+        Args:
+            uri: URI to post the file to.
+            fields: Not used.
+            files: Path of the file to upload.
+            baseName: File name sent to the appliance.
+            verbose: Prints the upload progress.
+            chunk_size: Number of bytes read from the file and sent at a time.
+            progress_callback: Function called after each chunk with the bytes sent, the total bytes and the
+                throughput of the current attempt in bytes per second.
+            adaptive_chunk_size: Grows or shrinks the chunk size so sending a chunk takes about one second on
+                the current link.
+            max_retries: Number of times the upload is restarted when the connection fails before the file is fully
+                sent.
+
+        Returns:
+            tuple: The response and its decoded body.
+        """
+        content_type, preamble, epilogue = self.__make_multipart_boundaries(baseName)
+        totalSize = len(preamble) + os.path.getsize(files) + len(epilogue)
+        attempt = 0
+        renewed = False
+        while True:
             if verbose is True:
-                print('%d bytes sent... \r' % mappedfile.tell())
-        mappedfile.close()
-        inputfile.close()
-        os.remove(files + '.b64')
-        response = conn.getresponse()
-        body = response.read().decode('utf-8')
-        if body:
+                print(('Uploading ' + files + '...'))
+            http_headers = self.__prepare_request(uri)
             try:
-                body = json.loads(body)
-            except ValueError:
-                body = response.read().decode('utf-8')
-        conn.close()
+                conn, created = self.__send_multipart(uri, http_headers, files, baseName, content_type, preamble,
+                                                      epilogue, totalSize, verbose, chunk_size, progress_callback,
+                                                      adaptive_chunk_size)
+            except (socket.error, http.client.HTTPException) as e:
+                if attempt >= max_retries:
+                    raise
+                attempt += 1
+                logger.warning('Upload of %s failed: %s. Restarting it (%d/%d)...' %
+                               (baseName, e, attempt, max_retries))
+                time.sleep(min(2 ** attempt, MAX_UPLOAD_RETRY_WAIT))
+                continue
+            response, body = self.__get_multipart_response(uri, conn, created)
+            if not self.__is_session_expired(response, uri, http_headers, renewed):
+                return response, body
+            # The appliance rejected the upload, so it is sent again with a new session
+            self.__renew_session(http_headers['auth'])
+            renewed = True
+
+    def __send_multipart(self, uri, http_headers, files, baseName, content_type, preamble, epilogue, totalSize,
+                         verbose, chunk_size, progress_callback, adaptive_chunk_size):
+        # A fresh socket avoids a stale pooled one failing midway through a large upload
+        conn = self.get_connection()
+        created = time.time()
+        try:
+            # conn.set_debuglevel(1)
+            conn.connect()
+            conn.putrequest('POST', uri)
+            conn.putheader('uploadfilename', baseName)
+            if 'auth' in http_headers:
+                conn.putheader('auth', http_headers['auth'])
+            conn.putheader('Content-Type', content_type)
+            conn.putheader('Content-Length', totalSize)
+            conn.putheader('X-API-Version', self._apiVersion)
+            conn.endheaders()
+            conn.send(preamble)
+            self.__send_file(conn, files, len(preamble), totalSize, verbose, chunk_size, progress_callback,
+                             adaptive_chunk_size)
+            conn.send(epilogue)
+        except Exception:
+            conn.close()
+            raise
+        return conn, created
+
+    def __get_multipart_response(self, uri, conn, created):
+        try:
+            response = conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+        self.invalidate_cache(uri, collection=True)
+        body = self.__decode_body(response, self.__read_body(response), '')
+        self.__release_connection(conn, created, response)
         return response, body
 
+    def __send_file(self, conn, files, sent, totalSize, verbose, chunk_size, progress_callback, adaptive_chunk_size):
+        started = time.time()
+        with open(files, 'rb') as inputfile:
+            chunk = inputfile.read(chunk_size)
+            while chunk:
+                chunk_started = time.time()
+                conn.send(chunk)
+                sent += len(chunk)
+                now = time.time()
+                if adaptive_chunk_size and len(chunk) == chunk_size:
+                    chunk_size = self.__adapt_chunk_size(chunk_size, now - chunk_started)
+                if progress_callback:
+                    progress_callback(sent, totalSize, sent / max(now - started, 0.001))
+                if verbose is True:
+                    print('%d bytes sent... \r' % sent)
+                chunk = inputfile.read(chunk_size)
+
+    def __adapt_chunk_size(self, chunk_size, elapsed):
+        if elapsed < UPLOAD_CHUNK_TARGET_SECONDS / 2 and chunk_size < MAX_UPLOAD_CHUNK_SIZE:
+            return min(chunk_size * 2, MAX_UPLOAD_CHUNK_SIZE)
+        if elapsed > UPLOAD_CHUNK_TARGET_SECONDS * 2 and chunk_size > MIN_UPLOAD_CHUNK_SIZE:
+            return max(chunk_size // 2, MIN_UPLOAD_CHUNK_SIZE)
+        return chunk_size
+
+    def download(self, uri, dest, chunk_size=DEFAULT_DOWNLOAD_CHUNK_SIZE, resume=False):
+        """
+        Downloads a file, like a backup or a support dump, writing it to disk as it arrives so it is never fully
+        loaded in memory.
+
+        Args:
+            uri: URI of the file to download.
+            dest: Path of the file to write.
+            chunk_size: Number of bytes read from the response and written at a time.
+            resume: Continues a previous download into an existing file, requesting only the missing bytes. The
+                file is downloaded again from the beginning when the appliance does not support ranges.
+
+        Returns:
+            bool: Indicates if the file was successfully downloaded.
+        """
+        renewed = False
+        while True:
+            resp, location, http_headers = self.__download(uri, dest, chunk_size, resume, renewed)
+            if resp.status == 302:
+                return self.download(location, dest, chunk_size, resume)
+            if resp.status != 401:
+                return True
+            self.__renew_session(http_headers['auth'])
+            renewed = True
+
+    def __download(self, uri, dest, chunk_size, resume, renewed):
+        offset = os.path.getsize(dest) if resume and os.path.exists(dest) else 0
+        http_headers = self.__prepare_request(uri)
+        if offset:
+            http_headers['Range'] = 'bytes=%d-' % offset
+            # Ranges apply to the encoded content, so a resumed download is requested uncompressed
+            http_headers.pop('Accept-Encoding', None)
+
+        location = None
+        conn = self.get_connection()
+        created = time.time()
+        try:
+            conn.request('GET', uri, '', http_headers)
+            resp = conn.getresponse()
+            if resp.status == 302:
+                resp.read()
+                location = resp.getheader('Location')
+            elif resp.status == 416 and offset:
+                # The requested range starts at the end of the file, so there is nothing left to download
+                resp.read()
+            elif self.__is_session_expired(resp, uri, http_headers, renewed):
+                resp.read()
+            elif resp.status >= 400:
+                raise HPOneViewException(self.__decode_body(resp, self.__read_body(resp), ''))
+            else:
+                self.__write_response(resp, dest, 'ab' if resp.status == 206 else 'wb', chunk_size)
+        except Exception:
+            conn.close()
+            raise
+        self.__release_connection(conn, created, resp)
+        return resp, location, http_headers
+
+    def __write_response(self, resp, dest, mode, chunk_size):
+        with open(dest, mode) as f:
+            for chunk in self.__read_chunks(resp, chunk_size, self.__get_decompressor(resp)):
+                f.write(chunk)
+
     ###########################################################################
     # Utility functions for making requests - the HTTP verbs
     ###########################################################################
     def get(self, uri):
-        resp, body = self.do_http('GET', uri, '')
-        if resp.status >= 400:
-            raise HPOneViewException(body)
-        if resp.status == 302:
-            body = self.get(resp.getheader('Location'))
+        cached = self._cache.lookup(uri) if self._cache is not None else None
+        if cached is not None and cached.is_fresh():
+            body = cached.body
+        else:
+            body = self.__get_from_appliance(uri, cached)
         if type(body) is dict:
             if 'nextPageUri' in body:
                 self._nextPage = body['nextPageUri']
@@ -265,6 +901,22 @@ class connection(object):
                 self._numDisplayedRecords = body['count']
         return body
 
+    def __get_from_appliance(self, uri, cached):
+        if cached is not None and cached.etag:
+            resp, body = self.do_http('GET', uri, '', {'If-None-Match': cached.etag})
+            if resp.status == 304:
+                self._cache.refresh(uri)
+                return cached.body
+        else:
+            resp, body = self.do_http('GET', uri, '')
+        if resp.status >= 400:
+            raise HPOneViewException(body)
+        if resp.status == 302:
+            return self.get(resp.getheader('Location'))
+        if self._cache is not None and resp.status == 200:
+            self._cache.store(uri, body, resp.getheader('ETag'))
+        return body
+
     def getNextPage(self):
         body = self.get(self._nextPage)
         return get_members(body)
@@ -347,8 +999,9 @@ class connection(object):
     def __do_rest_call(self, http_method, uri, body, custom_headers):
         resp, body = self.do_http(method=http_method,
                                   path=uri,
-                                  body=json.dumps(body),
+                                  body=self._json_codec.dumps(body),
                                   custom_headers=custom_headers)
+        self.invalidate_cache(uri, collection=http_method == 'POST')
         if resp.status >= 400:
             raise HPOneViewException(body)
         elif resp.status == 202:
@@ -388,11 +1041,60 @@ class connection(object):
     ###########################################################################
     # Login/Logout to/from appliance
     ###########################################################################
-    def login(self, cred, verbose=False):
-        if self._validateVersion is False:
-            self.validateVersion()
-
+    def login(self, cred, verbose=False, deferred=False):
         self._cred = cred
+        self._login_deferred = deferred
+        if not deferred:
+            self.__login(verbose)
+
+    def __login(self, verbose=False):
+        if self.__reuse_stored_session():
+            logger.info('Reused the stored session')
+            return
+
+        if self._validateVersion is False and self._version_cache.get(self._host) is None:
+            self.__create_session_validating_version()
+        else:
+            if self._validateVersion is False:
+                self.validateVersion()
+            self.__create_session()
+        if verbose is True:
+            print(('Session Key: ' + self._headers['auth']))
+        logger.info('Logged in successfully')
+
+    def set_version_cache(self, path=None, ttl=DEFAULT_VERSION_CACHE_TTL):
+        """
+        Configures the cache of the API versions supported by the appliance, checked before logging in. The versions
+        are always kept in memory, shared by the connections of the process.
+
+        Args:
+            path: Optional directory where the versions are also kept, shared with other processes.
+            ttl: Seconds a version is used before it is checked again.
+        """
+        self._version_cache = ApiVersionCache(path, ttl)
+
+    def set_session_store(self, session_store):
+        """
+        Sets where the login sessions are shared with other processes. Login reuses the session stored for the
+        appliance and user, skipping the version check and the login request, and stores the new sessions.
+
+        Args:
+            session_store (FileSessionStore): The store, or None to stop sharing sessions.
+        """
+        self._session_store = session_store
+
+    def __reuse_stored_session(self):
+        if not self._session_store:
+            return False
+        session = self._session_store.get(self._host, self._cred)
+        if not session or session.get('apiVersion') != self._apiVersion:
+            return False
+        self.__set_headers({'auth': session['sessionID']})
+        self._session = True
+        self._validateVersion = True
+        return True
+
+    def __create_session(self, store=True):
         try:
             task, body = self.post(uri['loginSessions'], self._cred)
         except HPOneViewException:
@@ -400,11 +1102,74 @@ class connection(object):
             raise
         auth = body['sessionID']
         # Add the auth ID to the headers dictionary
-        self._headers['auth'] = auth
+        self.__set_headers({'auth': auth})
         self._session = True
-        if verbose is True:
-            print(('Session Key: ' + auth))
-        logger.info('Logged in successfully')
+        if store:
+            self.__store_session()
+
+    def __store_session(self):
+        if self._session_store:
+            self._session_store.save(self._host, self._cred, self._headers['auth'], self._apiVersion)
+
+    def __create_session_validating_version(self):
+        # The version check and the login do not depend on each other, so both requests are sent at the same time
+        version_errors = []
+
+        def validate_version():
+            try:
+                self.validateVersion()
+            except Exception as e:
+                version_errors.append(e)
+
+        thread = threading.Thread(target=validate_version)
+        thread.daemon = True
+        thread.start()
+        try:
+            # The session is only shared once the version is known to be supported
+            self.__create_session(store=False)
+        except HPOneViewException:
+            thread.join()
+            if version_errors:
+                raise version_errors[0]
+            raise
+        thread.join()
+        if version_errors:
+            self.__discard_session()
+            raise version_errors[0]
+        self.__store_session()
+
+    def __discard_session(self):
+        auth = self._headers.get('auth')
+        if self._session_store:
+            self._session_store.delete(self._host, self._cred, auth)
+        try:
+            self.delete(uri['loginSessions'])
+        except Exception:
+            logger.warning('Could not log out the session of an unsupported API version', exc_info=True)
+        self.__set_headers({'auth': None})
+        self._session = False
+
+    def __login_if_deferred(self, path):
+        if not self._login_deferred or path in (uri['loginSessions'], uri['version']):
+            return
+        with self._login_lock:
+            if self._login_deferred:
+                self.__login()
+                self._login_deferred = False
+
+    def __renew_session(self, expired_auth):
+        # Single flight: only the first thread finding the session expired logs in again, the others reuse its session
+        with self._login_lock:
+            if self._headers.get('auth') != expired_auth:
+                return
+            logger.info('Session expired. Logging in again...')
+            if self._session_store:
+                self._session_store.delete(self._host, self._cred, expired_auth)
+                session = self._session_store.get(self._host, self._cred)
+                if session and session.get('apiVersion') == self._apiVersion:
+                    self.__set_headers({'auth': session['sessionID']})
+                    return
+            self.__create_session()
 
     def logout(self, verbose=False):
         # resp, body = self.do_http(method, uri['loginSessions'] \
@@ -416,7 +1181,10 @@ class connection(object):
             raise
         if verbose is True:
             print('Logged Out')
-        del self._headers['auth']
+        if self._session_store:
+            self._session_store.delete(self._host, self._cred, self._headers.get('auth'))
+        self.__set_headers({'auth': None})
         self._session = False
+        self.close_connections()
         logger.info('Logged out successfully')
         return None
@@ -88,3 +88,7 @@ class HPOneViewUnknownType(HPOneViewException):
 
 class HPOneViewTimeout(HPOneViewException):
     pass
+
+
+class HPOneViewCircuitOpen(HPOneViewException):
+    pass
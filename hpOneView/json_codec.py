@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*
+
+"""
+json_codec.py
+~~~~~~~~~~~~~~
+
+This module implements the JSON codecs used to decode the appliance responses.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from future import standard_library
+
+standard_library.install_aliases()
+
+__title__ = 'json_codec'
+__version__ = '0.0.1'
+__copyright__ = '(C) Copyright (2012-2016) Hewlett Packard Enterprise ' \
+                ' Development LP'
+__license__ = 'MIT'
+__status__ = 'Development'
+
+###
+# (C) Copyright (2012-2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JSONCodec(object):
+    """
+    Codec based on the standard library json module.
+
+    Request bodies are always encoded with the standard library, so they are sent in the same format whatever
+    codec decodes the responses.
+    """
+    name = 'json'
+
+    def loads(self, data):
+        """
+        Parses a JSON document.
+
+        Args:
+            data: UTF-8 encoded bytes or text.
+
+        Returns:
+            The decoded object.
+
+        Raises:
+            ValueError: When the data is not valid JSON.
+        """
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+    def dumps(self, obj):
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec that parses the responses with orjson, straight from the received bytes.
+    """
+    name = 'orjson'
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    Codec that parses the responses with ujson, straight from the received bytes.
+    """
+    name = 'ujson'
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+def get_default_codec():
+    """
+    Gets the fastest codec available: orjson or ujson when installed, the standard library otherwise.
+
+    Returns:
+        JSONCodec: Codec instance.
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    if ujson is not None:
+        return UjsonCodec()
+    return JSONCodec()
@@ -44,7 +44,9 @@ __status__ = 'Development'
 
 import json
 
+from hpOneView.api_version_cache import DEFAULT_VERSION_CACHE_PATH
 from hpOneView.connection import connection
+from hpOneView.session_store import FileSessionStore, DEFAULT_SESSION_STORE_PATH
 from hpOneView.resources.servers.connections import Connections
 from hpOneView.resources.networking.fc_networks import FcNetworks
 from hpOneView.resources.networking.fcoe_networks import FcoeNetworks
@@ -98,7 +100,9 @@ class OneViewClient(object):
     def __init__(self, config):
         self.__connection = connection(config["ip"], config.get('api_version', 200))
         self.__set_proxy(config)
-        self.__connection.login(config["credentials"])
+        self.__set_session_store(config)
+        self.__set_version_cache(config)
+        self.__connection.login(config["credentials"], deferred=config.get("deferred_login", False))
         self.__connections = None
         self.__connection_templates = None
         self.__fc_networks = None
@@ -178,6 +182,28 @@ class OneViewClient(object):
             proxy_port = int(splitted[1])
             self.__connection.set_proxy(proxy_host, proxy_port)
 
+    def __set_session_store(self, config):
+        """
+        Share the login sessions with other processes if needed
+        Args:
+            config: Config dict
+        """
+        session_store = config.get("session_store")
+        if session_store:
+            path = DEFAULT_SESSION_STORE_PATH if session_store is True else session_store
+            self.__connection.set_session_store(FileSessionStore(path))
+
+    def __set_version_cache(self, config):
+        """
+        Share the API versions supported by the appliance with other processes if needed
+        Args:
+            config: Config dict
+        """
+        version_cache = config.get("version_cache")
+        if version_cache:
+            path = DEFAULT_VERSION_CACHE_PATH if version_cache is True else version_cache
+            self.__connection.set_version_cache(path)
+
     @property
     def connection(self):
         """
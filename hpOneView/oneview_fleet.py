@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+"""
+oneview_fleet.py
+~~~~~~~~~~~~~~~~
+
+This module implements a client for many HPE OneView appliances at once.
+
+The appliances are logged in concurrently, and each resource call is run on all of them in parallel. The results
+are kept per appliance, so a failure on one appliance does not hide the results of the others.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from future import standard_library
+
+standard_library.install_aliases()
+
+__title__ = 'oneview_fleet'
+__version__ = '0.0.1'
+__copyright__ = '(C) Copyright (2012-2016) Hewlett Packard Enterprise ' \
+                ' Development LP'
+__license__ = 'MIT'
+__status__ = 'Development'
+
+import json
+import logging
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+from hpOneView.oneview_client import OneViewClient
+
+DEFAULT_FLEET_MAX_WORKERS = 16
+
+FLEET_DUPLICATE_APPLIANCE = 'Appliance %s is configured more than once'
+
+logger = logging.getLogger(__name__)
+
+
+class FleetResult(object):
+    """
+    Results of a call run on all the appliances of a fleet.
+
+    Attributes:
+        results: OrderedDict of appliance IP to the value returned by its call.
+        errors: OrderedDict of appliance IP to the exception raised by its call.
+    """
+
+    def __init__(self, results, errors):
+        self.results = results
+        self.errors = errors
+
+    def merged(self):
+        """
+        Merges the results of all the appliances, tagging each item with the appliance it came from. List results,
+        like the ones from get_all, are flattened.
+
+        Returns:
+            list: Tuples of appliance IP and item.
+        """
+        merged = []
+        for appliance, result in self.results.items():
+            items = result if isinstance(result, list) else [result]
+            merged += [(appliance, item) for item in items]
+        return merged
+
+    def __len__(self):
+        return len(self.results) + len(self.errors)
+
+
+class FleetResource(object):
+    """
+    Runs the methods of a OneViewClient resource client on all the appliances of a fleet. Every method returns a
+    FleetResult.
+    """
+
+    def __init__(self, fleet, name):
+        self._fleet = fleet
+        self._name = name
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def run_on_fleet(*args, **kwargs):
+            return self._fleet.run(lambda client: getattr(getattr(client, self._name), name)(*args, **kwargs))
+
+        run_on_fleet.__name__ = str(name)
+        return run_on_fleet
+
+
+class OneViewFleet(object):
+    """
+    Client for many HPE OneView appliances.
+
+    Exposes the same resource properties as OneViewClient, each one running its calls on all the appliances in
+    parallel, e.g. fleet.server_hardware.get_all(filter="powerState='On'"). Appliances that fail to log in are kept
+    out of the fleet and reported in login_errors.
+    """
+
+    def __init__(self, configs, max_workers=DEFAULT_FLEET_MAX_WORKERS):
+        """
+        Args:
+            configs: List of OneViewClient config dicts, one per appliance.
+            max_workers: Maximum number of appliances called at the same time.
+
+        Raises:
+            ValueError: When an appliance is configured more than once.
+        """
+        appliances = [config['ip'] for config in configs]
+        for appliance in appliances:
+            if appliances.count(appliance) > 1:
+                raise ValueError(FLEET_DUPLICATE_APPLIANCE % appliance)
+
+        self.__max_workers = max_workers
+        self.__resources = {}
+        logins = self.__map(OneViewClient, OrderedDict((config['ip'], config) for config in configs))
+        self.__clients = logins.results
+        self.__login_errors = logins.errors
+        for appliance, error in self.__login_errors.items():
+            logger.warning('Login to %s failed: %s' % (appliance, error))
+
+    @classmethod
+    def from_json_file(cls, file_name, max_workers=DEFAULT_FLEET_MAX_WORKERS):
+        """
+        Construct OneViewFleet using a json file with a list of OneViewClient configs.
+
+        Args:
+            file_name: json full path.
+            max_workers: Maximum number of appliances called at the same time.
+
+        Returns:
+            OneViewFleet:
+        """
+        with open(file_name) as json_data:
+            configs = json.load(json_data)
+
+        return cls(configs, max_workers=max_workers)
+
+    @property
+    def clients(self):
+        """
+        Gets the clients of the appliances logged in.
+
+        Returns:
+            OrderedDict: Appliance IP to OneViewClient.
+        """
+        return self.__clients
+
+    @property
+    def login_errors(self):
+        """
+        Gets the appliances that failed to log in.
+
+        Returns:
+            OrderedDict: Appliance IP to the exception raised by the login.
+        """
+        return self.__login_errors
+
+    def run(self, function):
+        """
+        Runs a function on all the appliances in parallel.
+
+        Args:
+            function: Callable that receives the OneViewClient of an appliance.
+
+        Returns:
+            FleetResult:
+        """
+        return self.__map(function, self.__clients)
+
+    def close(self):
+        """
+        Closes the pooled connections of all the appliances.
+        """
+        for client in self.__clients.values():
+            client.connection.close_connections()
+
+    def __getattr__(self, name):
+        if name.startswith('_') or not isinstance(getattr(OneViewClient, name, None), property):
+            raise AttributeError(name)
+
+        if name not in self.__resources:
+            self.__resources[name] = FleetResource(self, name)
+        return self.__resources[name]
+
+    def __map(self, function, arguments):
+        if not arguments:
+            return FleetResult(OrderedDict(), OrderedDict())
+
+        def safe_call(argument):
+            try:
+                return function(argument), None
+            except Exception as e:
+                return None, e
+
+        pool = ThreadPool(min(self.__max_workers, len(arguments)))
+        try:
+            outcomes = pool.map(safe_call, list(arguments.values()))
+        finally:
+            pool.close()
+            pool.join()
+
+        results = OrderedDict()
+        errors = OrderedDict()
+        for appliance, (result, error) in zip(arguments, outcomes):
+            if error is None:
+                results[appliance] = result
+            else:
+                errors[appliance] = error
+        return FleetResult(results, errors)
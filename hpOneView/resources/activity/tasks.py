@@ -98,3 +98,72 @@ class Tasks(object):
         """
         return self._client.get_all(start=start, count=count, filter=filter, query=query, sort=sort, view=view,
                                     fields=fields)
+
+    def iter_all(self, start=0, count=-1, fields='', filter='', query='', sort='', view='', read_ahead=False):
+        """
+        Iterates over the tasks based upon the filters provided, requesting one page at a time.
+
+        Unlike get_all, the items are yielded as each page is received.
+
+        Args:
+            start:
+                 The first item to return, using 0-based indexing. If not specified, the default is 0 - start with the
+                 first available item.
+            count:
+                The number of resources to return. A count of -1 requests all items. The actual number of items in
+                the response may differ from the requested count if the sum of start and count exceed the total number
+                of items.
+            fields:
+                 Specifies which fields should be returned in the result set.
+            filter (list or str):
+                 A general filter/query string to narrow the list of items returned. The default is no filter; all
+                 resources are returned.
+            query:
+                 A general query string to narrow the list of resources returned. The default is no query (all
+                 resources are returned).
+            sort:
+                The sort order of the returned data set. By default, the sort order is based on create time, with the
+                oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by specifying the name of a
+                 predefined view. The default view is expand (show all attributes of the resource and all elements of
+                 collections of resources).
+            read_ahead:
+                If True, the next page is requested while the current one is consumed.
+
+        Returns:
+            generator: The tasks.
+        """
+        return self._client.iter_all(start=start, count=count, filter=filter, query=query, sort=sort, view=view,
+                                     fields=fields, read_ahead=read_ahead)
+
+    def count(self, filter='', query=''):
+        """
+        Gets the number of tasks that match the filter, without retrieving them.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items counted. The default is no filter; all
+                resources are counted.
+            query:
+                A general query string to narrow the items counted.
+
+        Returns:
+            int: The number of matching tasks.
+        """
+        return self._client.count(filter=filter, query=query)
+
+    def exists(self, filter='', query=''):
+        """
+        Checks if any of the tasks matches the filter, requesting a single item.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items checked. The default is no filter.
+            query:
+                A general query string to narrow the items checked.
+
+        Returns:
+            bool: True when at least one matches.
+        """
+        return self._client.exists(filter=filter, query=query)
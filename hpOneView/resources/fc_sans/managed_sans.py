@@ -46,7 +46,7 @@ class ManagedSANs(object):
         self._connection = con
         self._client = ResourceClient(con, self.URI)
 
-    def get_all(self, start=0, count=-1, query='', sort=''):
+    def get_all(self, start=0, count=-1, query='', sort='', view='', fields=''):
         """
         Retrieves the list of registered Managed SANs
 
@@ -64,11 +64,78 @@ class ManagedSANs(object):
             sort:
                 The sort order of the returned data set. By default, the sort order is based
                 on create time with the oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by
+                 specifying the name of a predefined view. The default view is expand (show
+                 all attributes of the resource and all elements of collections of resources).
+            fields:
+                Specifies which fields should be returned in the result set.
 
         Returns:
             list: A list of Managed SANs
         """
-        return self._client.get_all(start=start, count=count, query=query, sort=sort)
+        return self._client.get_all(start=start, count=count, query=query, sort=sort, view=view, fields=fields)
+
+    def iter_all(self, start=0, count=-1, query='', sort='', view='', fields='', read_ahead=False):
+        """
+        Iterates over the Managed SANs, requesting one page at a time.
+
+        Unlike get_all, the items are yielded as each page is received.
+
+        Args:
+            start:
+                The first item to return, using 0-based indexing.
+                If not specified, the default is 0 - start with the first available item.
+            count:
+                The number of resources to return. A count of -1 requests all items. The actual number of items in
+                the response may differ from the requested count if the sum of start and count exceed the total number
+                of items.
+            query:
+                A general query string to narrow the list of resources returned.
+                The default is no query - all resources are returned.
+            sort:
+                The sort order of the returned data set. By default, the sort order is based
+                on create time with the oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by
+                 specifying the name of a predefined view. The default view is expand (show
+                 all attributes of the resource and all elements of collections of resources).
+            fields:
+                Specifies which fields should be returned in the result set.
+            read_ahead:
+                If True, the next page is requested while the current one is consumed.
+
+        Returns:
+            generator: The Managed SANs.
+        """
+        return self._client.iter_all(start=start, count=count, query=query, sort=sort, view=view, fields=fields,
+                                     read_ahead=read_ahead)
+
+    def count(self, query=''):
+        """
+        Gets the number of managed SANs that match the query, without retrieving them.
+
+        Args:
+            query:
+                A general query string to narrow the items counted.
+
+        Returns:
+            int: The number of matching managed SANs.
+        """
+        return self._client.count(query=query)
+
+    def exists(self, query=''):
+        """
+        Checks if any of the managed SANs matches the query, requesting a single item.
+
+        Args:
+            query:
+                A general query string to narrow the items checked.
+
+        Returns:
+            bool: True when at least one matches.
+        """
+        return self._client.exists(query=query)
 
     def get_by_name(self, name):
         """
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from future import standard_library
+
+standard_library.install_aliases()
+
+__title__ = 'InventoryMirror'
+__version__ = '0.0.1'
+__copyright__ = '(C) Copyright (2012-2016) Hewlett Packard Enterprise ' \
+                ' Development LP'
+__license__ = 'MIT'
+__status__ = 'Development'
+
+import logging
+import threading
+
+from past.builtins import basestring
+
+from hpOneView.resources.resource import ResourceClient
+
+DEFAULT_INDEX_FIELDS = ('name', 'uri', 'serialNumber', 'vlanId', 'wwn', 'mac')
+
+logger = logging.getLogger(__name__)
+
+
+class InventoryMirror(object):
+    """
+    In-process copy of a collection, indexed by some of its fields so lookups are answered without requests.
+
+    The collection is loaded once. Then, refresh reloads only the members modified since the last load and drops
+    the deleted ones. Lookups on indexed fields take constant time; other fields are searched through all the
+    members.
+
+    The returned resources are shared by the mirror, so they must not be modified.
+    """
+
+    def __init__(self, con, uri, index_fields=DEFAULT_INDEX_FIELDS, filter=''):
+        """
+        Args:
+            con: Connection to the appliance.
+            uri: Collection URI, like '/rest/server-hardware'.
+            index_fields: Fields indexed for the lookups.
+            filter (list or str): A general filter/query string to mirror only part of the collection.
+        """
+        self._uri = uri
+        self._client = ResourceClient(con, uri)
+        self._index_fields = tuple(index_fields)
+        self._filter = filter
+        self._lock = threading.RLock()
+        self._members = {}
+        self._indexes = dict((field, {}) for field in self._index_fields)
+        self._last_modified = None
+        self._loaded = False
+
+    def load(self):
+        """
+        Loads the whole collection, replacing the mirrored members.
+
+        Returns:
+            int: The number of members loaded.
+        """
+        members = self._client.get_all(filter=self._filter)
+        with self._lock:
+            self._members = {}
+            self._indexes = dict((field, {}) for field in self._index_fields)
+            for member in members:
+                self.__add(member)
+            self._last_modified = self.__get_last_modified(members, None)
+            self._loaded = True
+        logger.debug('Mirrored %d members of %s' % (len(members), self._uri))
+        return len(members)
+
+    def refresh(self):
+        """
+        Reloads the members added or modified since the last load or refresh, and drops the deleted ones. The
+        whole collection is loaded when it was not loaded yet or its members do not report when they were
+        modified.
+
+        Returns:
+            tuple: The number of members added, changed and removed.
+        """
+        if not self._loaded or not self._last_modified:
+            return self.load(), 0, 0
+
+        with self._lock:
+            known = dict((uri, member.get('eTag')) for uri, member in self._members.items())
+        added, changed, removed = self._client.sync(since=self._last_modified, known=known, filter=self._filter)
+        with self._lock:
+            for uri in removed:
+                self.__remove(uri)
+            for member in added + changed:
+                self.__remove(member['uri'])
+                self.__add(member)
+            self._last_modified = self.__get_last_modified(added + changed, self._last_modified)
+        return len(added), len(changed), len(removed)
+
+    def get(self, uri):
+        """
+        Gets a mirrored member by its URI.
+
+        Args:
+            uri: Resource URI.
+
+        Returns:
+            dict: The member, or None when it is not mirrored.
+        """
+        with self._lock:
+            return self._members.get(uri)
+
+    def get_by(self, field, value):
+        """
+        Gets the mirrored members whose field matches the value. The comparison of strings is case-insensitive,
+        like the filters of the appliance.
+
+        Args:
+            field: Field name to filter.
+            value: Value to filter.
+
+        Returns:
+            list: The matching members. None, lists and dicts never match.
+        """
+        key = self.__make_key(value)
+        if key is None:
+            return []
+        with self._lock:
+            if field in self._indexes:
+                return [self._members[uri] for uri in self._indexes[field].get(key, [])]
+            return [member for member in self._members.values() if self.__make_key(member.get(field)) == key]
+
+    def get_by_name(self, name):
+        """
+        Gets a mirrored member by its name.
+
+        Args:
+            name: Resource name.
+
+        Returns:
+            dict: The member, or None when no member has the name.
+        """
+        result = self.get_by('name', name)
+        return result[0] if result else None
+
+    def get_all(self):
+        """
+        Gets all mirrored members.
+
+        Returns:
+            list: The members.
+        """
+        with self._lock:
+            return list(self._members.values())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._members)
+
+    def __add(self, member):
+        self._members[member['uri']] = member
+        for field, index in self._indexes.items():
+            key = self.__make_key(member.get(field))
+            if key is not None:
+                index.setdefault(key, []).append(member['uri'])
+
+    def __remove(self, uri):
+        member = self._members.pop(uri, None)
+        if member is None:
+            return
+        for field, index in self._indexes.items():
+            key = self.__make_key(member.get(field))
+            if key in index:
+                index[key].remove(uri)
+                if not index[key]:
+                    del index[key]
+
+    def __make_key(self, value):
+        if isinstance(value, basestring):
+            return value.lower()
+        if isinstance(value, (list, dict)):
+            return None
+        return value
+
+    def __get_last_modified(self, members, last_modified):
+        for member in members:
+            modified = member.get('modified')
+            if modified and (last_modified is None or modified > last_modified):
+                last_modified = modified
+        return last_modified
@@ -38,9 +38,12 @@ __license__ = 'MIT'
 __status__ = 'Development'
 
 import logging
+from multiprocessing.pool import ThreadPool
 from urllib.parse import quote
 from hpOneView.resources.task_monitor import TaskMonitor
 from hpOneView.exceptions import HPOneViewUnknownType, HPOneViewException
+from hpOneView.response_cache import DEFAULT_CACHE_TTL
+from hpOneView.connection import DEFAULT_DOWNLOAD_CHUNK_SIZE
 
 RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED = 'Resource was not provided'
 RESOURCE_CLIENT_INVALID_FIELD = 'Invalid field was provided'
@@ -49,12 +52,17 @@ RESOURCE_CLIENT_UNKNOWN_OBJECT_TYPE = 'Unknown object type'
 UNRECOGNIZED_URI = 'Unrecognized URI for this resource'
 RESOURCE_CLIENT_TASK_EXPECTED = "Failed: Expected a TaskResponse."
 
+DEFAULT_BATCH_MAX_WORKERS = 8
+
 logger = logging.getLogger(__name__)
 
 
 class ResourceClient(object):
     """
     This class implements common functions for HpOneView API rest
+
+    A ResourceClient keeps no state besides its connection and URI, so it can be shared by any number of threads. The
+    pages of a collection are followed from each response, never from state shared on the connection.
     """
 
     def __init__(self, con, uri):
@@ -62,7 +70,7 @@ class ResourceClient(object):
         self._uri = uri
         self._task_monitor = TaskMonitor(con)
 
-    def get_all(self, start=0, count=-1, filter='', query='', sort='', view='', fields='', uri=None):
+    def get_all(self, start=0, count=-1, filter='', query='', sort='', view='', fields='', uri=None, max_workers=1):
         """
         Gets all items according with the given arguments.
 
@@ -101,38 +109,161 @@ class ResourceClient(object):
                 Name of the fields.
             uri:
                 A specific URI (optional)
+            max_workers:
+                Maximum number of pages requested concurrently. With the default of 1, the pages are followed
+                serially through 'nextPageUri'. Otherwise, the remaining pages are computed from the 'total'
+                reported by the first page and fetched in parallel, falling back to serial paging when the
+                total is not reported or the appliance returns a truncated page.
 
         Returns:
             list: A list of items matching the specified filter.
         """
-        if filter:
-            filter = self.__make_query_filter(filter)
+        uri_prefix, query_string = self.__make_getall_query(filter, query, sort, view, fields, uri)
+        uri = self.__make_page_uri(uri_prefix, start, count, query_string)
 
-        if query:
-            query = "&query=" + quote(query)
+        logger.debug('Getting all resources with uri: {0}'.format(uri))
 
-        if sort:
-            sort = "&sort=" + quote(sort)
+        if max_workers > 1:
+            result = self.__do_parallel_requests_to_getall(uri_prefix, start, count, query_string, max_workers)
+        else:
+            result = self.__do_requests_to_getall(uri, count)
 
-        if view:
-            view = "&view=" + quote(view)
+        return result
 
-        if fields:
-            fields = "&fields=" + quote(fields)
+    def iter_all(self, start=0, count=-1, filter='', query='', sort='', view='', fields='', uri=None,
+                 read_ahead=False):
+        """
+        Iterates over all items according with the given arguments, requesting one page at a time.
 
-        path = uri if uri else self._uri
-        self.__validate_resource_uri(path)
+        Accepts the same arguments as get_all, but yields each member as soon as its page is received instead of
+        accumulating the whole collection in memory.
 
-        symbol = '?' if '?' not in path else '&'
+        Args:
+            start:
+                The first item to return, using 0-based indexing.
+                If not specified, the default is 0 - start with the first available item.
+            count:
+                The number of resources to return. A count of -1 requests all items (default).
+            filter (list or str):
+                A general filter/query string to narrow the list of items returned. The default is no
+                filter; all resources are returned.
+            query:
+                A single query parameter can do what would take multiple parameters or multiple GET requests using
+                filter. Use query for more complex queries. NOTE: This parameter is experimental for OneView 2.0.
+            sort:
+                The sort order of the returned data set. By default, the sort order is based on create time with the
+                oldest entry first.
+            view:
+                Returns a specific subset of the attributes of the resource or collection by specifying the name of a
+                predefined view.
+            fields:
+                Name of the fields.
+            uri:
+                A specific URI (optional)
+            read_ahead:
+                If True, the next page is requested in the background while the caller consumes the current one.
 
-        uri = "{0}{1}start={2}&count={3}{4}{5}{6}{7}{8}".format(path, symbol, start, count, filter, query, sort,
-                                                                view, fields)
+        Returns:
+            generator: The items matching the specified filter.
+        """
+        uri_prefix, query_string = self.__make_getall_query(filter, query, sort, view, fields, uri)
+        uri = self.__make_page_uri(uri_prefix, start, count, query_string)
 
-        logger.debug('Getting all resources with uri: {0}'.format(uri))
+        logger.debug('Iterating over all resources with uri: {0}'.format(uri))
 
-        result = self.__do_requests_to_getall(uri, count)
+        for members in self.__iter_pages(uri, count, read_ahead):
+            for member in members:
+                yield member
 
-        return result
+    def count(self, filter='', query='', uri=None):
+        """
+        Gets the number of resources that match the filter, without retrieving the collection.
+
+        A single item is requested and the 'total' reported by the appliance is returned.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items counted. The default is no filter; all
+                resources are counted.
+            query:
+                A general query string to narrow the items counted.
+            uri:
+                A specific URI (optional).
+
+        Returns:
+            int: The number of matching resources.
+        """
+        response = self.__get_first_item(filter, query, uri)
+
+        if 'total' not in response:
+            # The total is not reported by every resource, so the whole collection must be counted
+            return len(self.get_all(filter=filter, query=query, uri=uri))
+
+        return response['total']
+
+    def exists(self, filter='', query='', uri=None):
+        """
+        Checks if any resource matches the filter, requesting a single item.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items checked. The default is no filter.
+            query:
+                A general query string to narrow the items checked.
+            uri:
+                A specific URI (optional).
+
+        Returns:
+            bool: True when at least one resource matches.
+        """
+        return len(self.__get_members(self.__get_first_item(filter, query, uri))) > 0
+
+    def sync(self, since=None, known=None, filter='', uri=None):
+        """
+        Gets the changes to the collection since a previous sync, without downloading the unchanged members.
+
+        Only the members whose 'modified' is at or after 'since' are requested. Members modified in that same
+        instant are requested again, since they may have been missed, so the eTags in 'known' are compared to
+        report only real changes. The removed members are found through a listing of the URIs alone, or from the
+        members requested when all of them are.
+
+        Args:
+            since:
+                The newest 'modified' timestamp seen by the previous sync. All members are requested when not
+                provided.
+            known:
+                The members from the previous sync, as a dict of URI to eTag or a list of URIs. When not
+                provided, every member requested is reported as added.
+            filter (list or str):
+                A general filter/query string to sync only part of the collection.
+            uri:
+                A specific URI (optional).
+
+        Returns:
+            tuple: The added members, the changed members and the URIs of the removed members.
+        """
+        filters = list(filter) if isinstance(filter, list) else [filter] if filter else []
+        if since:
+            filters.insert(0, "modified >= '%s'" % since)
+        members = self.get_all(filter=filters or '', uri=uri)
+
+        if known is None:
+            return members, [], []
+        if not isinstance(known, dict):
+            known = dict((known_uri, None) for known_uri in known)
+
+        added = [member for member in members if member['uri'] not in known]
+        changed = [member for member in members if member['uri'] in known and
+                   (known[member['uri']] is None or known[member['uri']] != member.get('eTag'))]
+
+        # Without 'since' the whole collection was just requested, so it is not listed again
+        current = self.get_all(filter=filter, fields='uri', uri=uri) if since else members
+        current_uris = set(member['uri'] for member in current)
+        removed = [known_uri for known_uri in known if known_uri not in current_uris]
+
+        logger.debug('Sync (uri = %s): %d added, %d changed, %d removed' %
+                     (uri or self._uri, len(added), len(changed), len(removed)))
+        return added, changed, removed
 
     def delete_all(self, filter, force=False, timeout=-1):
         """
@@ -161,25 +292,13 @@ class ResourceClient(object):
             # Successful return from a synchronous delete operation.
             return True
 
-        return self._task_monitor.wait_for_task(task, timeout=timeout)
+        result = self._task_monitor.wait_for_task(task, timeout=timeout)
+        self.__refresh_cache(self._uri)
+        return result
 
     def delete(self, resource, force=False, timeout=-1, custom_headers=None):
 
-        if not resource:
-            logger.exception(RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED)
-            raise ValueError(RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED)
-
-        if isinstance(resource, dict):
-            if 'uri' in resource and resource['uri']:
-                uri = resource['uri']
-            else:
-                logger.exception(RESOURCE_CLIENT_UNKNOWN_OBJECT_TYPE)
-                raise HPOneViewUnknownType(RESOURCE_CLIENT_UNKNOWN_OBJECT_TYPE)
-        else:
-            uri = self.build_uri(resource)
-
-        if force:
-            uri += '?force=True'
+        uri = self.__get_delete_uri(resource, force)
 
         logger.debug("Delete resource (uri = %s, resource = %s)" %
                      (self._uri, str(resource)))
@@ -192,6 +311,7 @@ class ResourceClient(object):
             return True
 
         task = self._task_monitor.wait_for_task(task, timeout=timeout)
+        self.__refresh_cache(uri)
 
         return task
 
@@ -200,6 +320,19 @@ class ResourceClient(object):
                      (self._uri, self._uri))
         return self._connection.get(self._uri + '/schema')
 
+    def enable_cache(self, ttl=DEFAULT_CACHE_TTL):
+        """
+        Caches the GET responses of this resource in the connection. Cached responses are revalidated with
+        If-None-Match once the TTL expires.
+
+        Args:
+            ttl: Seconds a response is served from memory without revalidation. Use 0 to always revalidate.
+        """
+        cache = self._connection.get_cache()
+        if cache is None:
+            cache = self._connection.enable_cache()
+        cache.set_ttl(self._uri, ttl)
+
     def get(self, id_or_uri):
         """
         Args:
@@ -343,6 +476,103 @@ class ResourceClient(object):
 
         return self.__do_post(uri, resource, timeout, custom_headers)
 
+    def create_many(self, resources, uri=None, timeout=-1, custom_headers=None, max_workers=DEFAULT_BATCH_MAX_WORKERS):
+        """
+        Creates several resources at once.
+
+        The POST requests are sent with bounded concurrency and the returned tasks are waited for together.
+
+        Args:
+            resources (list): Objects to create.
+            uri:
+                Can be either the resource ID or the resource URI.
+            timeout:
+                Timeout in seconds for all the tasks to complete. Wait for task completion by default. The timeout
+                does not abort the operations in OneView; it just stops waiting for their completion.
+            custom_headers:
+                Allows set specific HTTP headers.
+            max_workers:
+                Maximum number of requests sent concurrently.
+
+        Returns:
+            list: A tuple (created resource, error) for each resource, in the same order as the input.
+        """
+        if not uri:
+            uri = self._uri
+
+        def submit(resource):
+            if not resource:
+                raise ValueError(RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED)
+            logger.debug('Create (uri = %s, resource = %s)' % (uri, str(resource)))
+            return self._connection.post(uri, resource, custom_headers=custom_headers)
+
+        return self.__do_many(submit, resources, timeout, max_workers)
+
+    def update_many(self, resources, force=False, timeout=-1, custom_headers=None,
+                    max_workers=DEFAULT_BATCH_MAX_WORKERS):
+        """
+        Updates several resources at once, each one through a PUT request to its 'uri'.
+
+        The requests are sent with bounded concurrency and the returned tasks are waited for together.
+
+        Args:
+            resources (list): Objects to update.
+            force:
+                If set to true, the operation completes despite any problems with network connectivity or errors
+                on the resource itself. The default is false.
+            timeout:
+                Timeout in seconds for all the tasks to complete. Wait for task completion by default. The timeout
+                does not abort the operations in OneView; it just stops waiting for their completion.
+            custom_headers:
+                Allows set specific HTTP headers.
+            max_workers:
+                Maximum number of requests sent concurrently.
+
+        Returns:
+            list: A tuple (updated resource, error) for each resource, in the same order as the input.
+        """
+        def submit(resource):
+            if not resource:
+                raise ValueError(RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED)
+            uri = resource['uri'] + ('?force=True' if force else '')
+            logger.debug('Update (uri = %s, resource = %s)' % (uri, str(resource)))
+            return self._connection.put(uri, resource, custom_headers=custom_headers)
+
+        return self.__do_many(submit, resources, timeout, max_workers)
+
+    def delete_many(self, resources, force=False, timeout=-1, custom_headers=None,
+                    max_workers=DEFAULT_BATCH_MAX_WORKERS):
+        """
+        Deletes several resources at once.
+
+        The DELETE requests are sent with bounded concurrency and the returned tasks are waited for together.
+
+        Args:
+            resources (list): Resource dicts, IDs or URIs to delete.
+            force:
+                If set to true, the operation completes despite any problems with network connectivity or errors
+                on the resource itself. The default is false.
+            timeout:
+                Timeout in seconds for all the tasks to complete. Wait for task completion by default. The timeout
+                does not abort the operations in OneView; it just stops waiting for their completion.
+            custom_headers:
+                Allows set specific HTTP headers.
+            max_workers:
+                Maximum number of requests sent concurrently.
+
+        Returns:
+            list: A tuple (result, error) for each resource, in the same order as the input. The result is True
+            when the resource was deleted.
+        """
+        def submit(resource):
+            uri = self.__get_delete_uri(resource, force)
+            logger.debug('Delete resource (uri = %s, resource = %s)' % (uri, str(resource)))
+            task, body = self._connection.delete(uri, custom_headers=custom_headers)
+            # 204 NO CONTENT: successful return from a synchronous delete operation
+            return task, body if task else True
+
+        return self.__do_many(submit, resources, timeout, max_workers)
+
     def patch(self, id_or_uri, operation, path, value, timeout=-1, custom_headers=None):
         """
         Uses the PATCH to update a resource.
@@ -368,12 +598,13 @@ class ResourceClient(object):
         patch_request = [{'op': operation, 'path': path, 'value': value}]
         task, entity = self._connection.patch(uri, patch_request, custom_headers=custom_headers)
 
-        if not task:
-            return entity
+        if task:
+            entity = self._task_monitor.wait_for_task(task, timeout)
 
-        return self._task_monitor.wait_for_task(task, timeout)
+        self.__refresh_cache(uri, entity)
+        return entity
 
-    def get_by(self, field, value, uri=None):
+    def get_by(self, field, value, uri=None, view='', fields=''):
         """
         This function uses get_all passing a filter.
 
@@ -383,6 +614,8 @@ class ResourceClient(object):
             field: Field name to filter.
             value: Value to filter.
             uri: Resource uri.
+            view: Returns a specific subset of the attributes, by specifying the name of a predefined view.
+            fields: Specifies which fields should be returned in the result set.
 
         Returns:
             dict
@@ -399,7 +632,7 @@ class ResourceClient(object):
                      (uri, field, str(value)))
 
         filter = "\"'{0}'='{1}'\"".format(field, value)
-        return self.get_all(filter=filter, uri=uri)
+        return self.get_all(filter=filter, uri=uri, view=view, fields=fields)
 
     def get_by_name(self, name):
         """
@@ -530,6 +763,22 @@ class ResourceClient(object):
 
         return task['taskOutput']
 
+    def download(self, uri, file_path, chunk_size=DEFAULT_DOWNLOAD_CHUNK_SIZE, resume=False):
+        """
+        Downloads the contents of a URI to a file, streaming it to disk.
+
+        Args:
+            uri: URI of the file to download.
+            file_path: Path of the file to write.
+            chunk_size: Number of bytes read from the response and written at a time.
+            resume: Continues a previous download into an existing file, requesting only the missing bytes.
+
+        Returns:
+            bool: Indicates if the file was successfully downloaded.
+        """
+        logger.debug('Download (uri = %s, file_path = %s)' % (uri, file_path))
+        return self._connection.download(uri, file_path, chunk_size=chunk_size, resume=resume)
+
     def build_uri(self, id_or_uri):
         if not id_or_uri:
             logger.exception(RESOURCE_CLIENT_INVALID_ID)
@@ -560,24 +809,133 @@ class ResourceClient(object):
         else:
             return []
 
+    def __get_delete_uri(self, resource, force):
+        if not resource:
+            logger.exception(RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED)
+            raise ValueError(RESOURCE_CLIENT_RESOURCE_WAS_NOT_PROVIDED)
+
+        if isinstance(resource, dict):
+            if 'uri' in resource and resource['uri']:
+                uri = resource['uri']
+            else:
+                logger.exception(RESOURCE_CLIENT_UNKNOWN_OBJECT_TYPE)
+                raise HPOneViewUnknownType(RESOURCE_CLIENT_UNKNOWN_OBJECT_TYPE)
+        else:
+            uri = self.build_uri(resource)
+
+        if force:
+            uri += '?force=True'
+
+        return uri
+
+    def __do_many(self, submit, resources, timeout, max_workers):
+        results = [(None, None)] * len(resources)
+        if not resources:
+            return results
+
+        def safe_submit(resource):
+            try:
+                return submit(resource) + (None,)
+            except Exception as e:
+                return None, None, e
+
+        pool = ThreadPool(min(max_workers, len(resources)))
+        try:
+            responses = pool.map(safe_submit, resources)
+        finally:
+            pool.close()
+            pool.join()
+
+        pending = {}
+        for index, (task, body, error) in enumerate(responses):
+            if task:
+                pending[task['uri']] = index
+            else:
+                results[index] = (body, error)
+
+        self.__wait_for_many(responses, pending, results, timeout)
+        return results
+
+    def __wait_for_many(self, responses, pending, results, timeout):
+        try:
+            for task, result, error in self._task_monitor.wait_for_tasks(
+                    [responses[index][0] for index in sorted(pending.values())], timeout):
+                index = pending.pop(task['uri'])
+                resource_uri = task.get('associatedResource', {}).get('resourceUri')
+                try:
+                    self.__refresh_cache(resource_uri or self._uri, result, collection=not resource_uri)
+                except Exception as e:
+                    result, error = None, e
+                results[index] = (result, error)
+        except Exception as e:
+            # A timeout, or a failure to poll the tasks, fails only the tasks still pending
+            for index in pending.values():
+                results[index] = (None, e)
+
     def __do_post(self, uri, resource, timeout, custom_headers):
         task, entity = self._connection.post(uri, resource, custom_headers=custom_headers)
 
-        if not task:
-            return entity
+        if task:
+            entity = self._task_monitor.wait_for_task(task, timeout)
 
-        return self._task_monitor.wait_for_task(task, timeout)
+        self.__refresh_cache(uri, entity, collection=True)
+        return entity
 
     def __do_put(self, uri, resource, timeout, custom_headers):
         task, body = self._connection.put(uri, resource, custom_headers=custom_headers)
 
-        if not task:
-            return body
+        if task:
+            body = self._task_monitor.wait_for_task(task, timeout)
+
+        self.__refresh_cache(uri, body)
+        return body
+
+    def __refresh_cache(self, uri, entity=None, collection=False):
+        # The requests invalidated the cache when sent, but a copy read while the task ran would be stale now
+        self._connection.invalidate_cache(uri, collection)
+        cache = self._connection.get_cache()
+        if cache is None:
+            return
+        cache.invalidate_listings(self._uri)
+        if isinstance(entity, dict) and entity.get('uri'):
+            cache.store(entity['uri'], entity)
+
+    def __get_first_item(self, filter, query, uri):
+        uri_prefix, query_string = self.__make_getall_query(filter, query, '', '', '', uri)
+        uri = self.__make_page_uri(uri_prefix, 0, 1, query_string)
+
+        logger.debug('Getting the first item with uri: {0}'.format(uri))
+
+        return self._connection.get(uri) or {}
+
+    def __make_getall_query(self, filter, query, sort, view, fields, uri):
+        if filter:
+            filter = self.__make_query_filter(filter)
+
+        if query:
+            query = "&query=" + quote(query)
+
+        if sort:
+            sort = "&sort=" + quote(sort)
+
+        if view:
+            view = "&view=" + quote(view)
+
+        if fields:
+            fields = "&fields=" + quote(fields)
+
+        path = uri if uri else self._uri
+        self.__validate_resource_uri(path)
+
+        symbol = '?' if '?' not in path else '&'
+
+        return path + symbol, "{0}{1}{2}{3}{4}".format(filter, query, sort, view, fields)
 
-        return self._task_monitor.wait_for_task(task, timeout)
+    def __make_page_uri(self, uri_prefix, start, count, query_string):
+        return "{0}start={1}&count={2}{3}".format(uri_prefix, start, count, query_string)
 
-    def __do_requests_to_getall(self, uri, requested_count):
-        items = []
+    def __do_requests_to_getall(self, uri, requested_count, items=None):
+        items = items if items is not None else []
 
         while uri:
             logger.debug('Making HTTP request to get all resources. Uri: {0}'.format(uri))
@@ -586,17 +944,85 @@ class ResourceClient(object):
             items += members
 
             logger.debug("Response getAll: nextPageUri = {0}, members list length: {1}".format(uri, str(len(members))))
-            uri = self.__get_next_page(response, items, requested_count)
+            uri = self.__get_next_page(response, len(items), requested_count)
+
+        logger.debug('Total # of members found = {0}'.format(str(len(items))))
+        return items
+
+    def __iter_pages(self, uri, requested_count, read_ahead):
+        pool = ThreadPool(1) if read_ahead else None
+        items_count = 0
+        try:
+            logger.debug('Making HTTP request to get all resources. Uri: {0}'.format(uri))
+            response = self._connection.get(uri)
+            while True:
+                members = self.__get_members(response)
+                items_count += len(members)
+                uri = self.__get_next_page(response, items_count, requested_count)
+
+                next_response = None
+                if uri and pool:
+                    next_response = pool.apply_async(self._connection.get, (uri,))
+
+                yield members
+
+                if not uri:
+                    break
+
+                logger.debug('Making HTTP request to get all resources. Uri: {0}'.format(uri))
+                response = next_response.get() if next_response else self._connection.get(uri)
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+
+    def __do_parallel_requests_to_getall(self, uri_prefix, start, requested_count, query_string, max_workers):
+        uri = self.__make_page_uri(uri_prefix, start, requested_count, query_string)
+        logger.debug('Making HTTP request to get all resources. Uri: {0}'.format(uri))
+        response = self._connection.get(uri)
+        items = self.__get_members(response)
+        next_page_uri = self.__get_next_page(response, len(items), requested_count)
+        total = response.get('total')
+
+        if not next_page_uri or not items or total is None:
+            return self.__do_requests_to_getall(next_page_uri, requested_count, items)
+
+        page_size = len(items)
+        end = total if requested_count == -1 else min(total, start + requested_count)
+        windows = [(page_start, min(page_size, end - page_start))
+                   for page_start in range(start + page_size, end, page_size)]
+        if not windows:
+            return items
+
+        def get_page(window):
+            page_uri = self.__make_page_uri(uri_prefix, window[0], window[1], query_string)
+            logger.debug('Making HTTP request to get all resources. Uri: {0}'.format(page_uri))
+            return self._connection.get(page_uri)
+
+        pool = ThreadPool(min(max_workers, len(windows)))
+        try:
+            responses = pool.map(get_page, windows)
+        finally:
+            pool.close()
+            pool.join()
+
+        for (page_start, page_count), response in zip(windows, responses):
+            members = self.__get_members(response)
+            items += members
+            if len(members) < page_count:
+                # The appliance truncated this page, so the following windows are misaligned: continue serially
+                next_page_uri = self.__get_next_page(response, len(items), requested_count)
+                return self.__do_requests_to_getall(next_page_uri, requested_count, items)
 
         logger.debug('Total # of members found = {0}'.format(str(len(items))))
         return items
 
-    def __get_next_page(self, response, items, requested_count):
+    def __get_next_page(self, response, items_count, requested_count):
         next_page_is_empty = response.get('nextPageUri') is None
         has_different_next_page = not response.get('uri') == response.get('nextPageUri')
         has_next_page = not next_page_is_empty and has_different_next_page
 
-        if len(items) >= requested_count and requested_count != -1:
+        if items_count >= requested_count and requested_count != -1:
             return None
 
         return response.get('nextPageUri') if has_next_page else None
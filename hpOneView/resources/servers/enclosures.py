@@ -36,7 +36,7 @@ __copyright__ = '(C) Copyright (2012-2016) Hewlett Packard Enterprise ' \
 __license__ = 'MIT'
 __status__ = 'Development'
 
-from hpOneView.resources.resource import ResourceClient
+from hpOneView.resources.resource import ResourceClient, DEFAULT_BATCH_MAX_WORKERS
 
 
 class Enclosures(object):
@@ -46,7 +46,7 @@ class Enclosures(object):
         self._connection = con
         self._client = ResourceClient(con, self.URI)
 
-    def get_all(self, start=0, count=-1, filter='', sort=''):
+    def get_all(self, start=0, count=-1, filter='', sort='', view='', fields=''):
         """
         Gets a paginated collection of Enclosures. The collection is based on optional sorting and filtering, and
         constrained by start and count parameters.
@@ -65,13 +65,81 @@ class Enclosures(object):
             sort:
                 The sort order of the returned data set. By default, the sort order is based
                 on create time with the oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by
+                 specifying the name of a predefined view. The default view is expand (show
+                 all attributes of the resource and all elements of collections of resources).
+            fields:
+                Specifies which fields should be returned in the result set.
 
         Returns:
             list: A list of Enclosures.
         """
-        return self._client.get_all(start, count, filter=filter, sort=sort)
+        return self._client.get_all(start, count, filter=filter, sort=sort, view=view, fields=fields)
+
+    def iter_all(self, start=0, count=-1, filter='', sort='', view='', fields='', read_ahead=False):
+        """
+        Iterates over the Enclosures, requesting one page at a time.
+
+        Unlike get_all, the items are yielded as each page is received.
+
+        Args:
+            start:
+                The first item to return, using 0-based indexing.
+                If not specified, the default is 0 - start with the first available item.
+            count:
+                The number of resources to return. A count of -1 requests all items.
+                The actual number of items in the response might differ from the requested
+                count if the sum of start and count exceeds the total number of items.
+            filter (list or str):
+                A general filter/query string to narrow the list of items returned. The
+                default is no filter; all resources are returned.
+            sort:
+                The sort order of the returned data set. By default, the sort order is based
+                on create time with the oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by
+                 specifying the name of a predefined view. The default view is expand (show
+                 all attributes of the resource and all elements of collections of resources).
+            fields:
+                Specifies which fields should be returned in the result set.
+            read_ahead:
+                If True, the next page is requested while the current one is consumed.
+
+        Returns:
+            generator: The Enclosures.
+        """
+        return self._client.iter_all(start, count, filter=filter, sort=sort, view=view, fields=fields,
+                                     read_ahead=read_ahead)
 
-    def get_by(self, field, value):
+    def count(self, filter=''):
+        """
+        Gets the number of enclosures that match the filter, without retrieving them.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items counted. The default is no filter; all
+                resources are counted.
+
+        Returns:
+            int: The number of matching enclosures.
+        """
+        return self._client.count(filter=filter)
+
+    def exists(self, filter=''):
+        """
+        Checks if any of the enclosures matches the filter, requesting a single item.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items checked. The default is no filter.
+
+        Returns:
+            bool: True when at least one matches.
+        """
+        return self._client.exists(filter=filter)
+
+    def get_by(self, field, value, view='', fields=''):
         """
         Gets all Enclosures that match the filter.
 
@@ -80,11 +148,13 @@ class Enclosures(object):
         Args:
             field: Field name to filter.
             value: Value to filter.
+            view: Returns a specific subset of the attributes, by specifying the name of a predefined view.
+            fields: Specifies which fields should be returned in the result set.
 
         Returns:
             list: A list of Enclosures.
         """
-        return self._client.get_by(field, value)
+        return self._client.get_by(field, value, view=view, fields=fields)
 
     def add(self, information, timeout=-1):
         """
@@ -102,6 +172,21 @@ class Enclosures(object):
         """
         return self._client.create(information, timeout=timeout)
 
+    def add_many(self, information, timeout=-1, max_workers=DEFAULT_BATCH_MAX_WORKERS):
+        """
+        Adds several enclosures to the appliance at once, waiting for all their tasks together.
+
+        Args:
+            information (list): Objects to create, one per enclosure.
+            timeout: Timeout in seconds for all the enclosures to be added. Wait for task completion by default.
+                The timeout does not abort the operation in OneView; it just stops waiting for its completion.
+            max_workers: Maximum number of requests sent concurrently.
+
+        Returns:
+            list: A tuple (added enclosure, error) for each object, in the same order as the input.
+        """
+        return self._client.create_many(information, timeout=timeout, max_workers=max_workers)
+
     def get(self, id_or_uri):
         """
         Returns the enclosure with the specified ID, if it exists.
@@ -48,7 +48,7 @@ class ServerProfileTemplate(object):
             'type': 'ServerProfileTemplateV1'
         }
 
-    def get_all(self, start=0, count=-1, filter='', sort=''):
+    def get_all(self, start=0, count=-1, filter='', sort='', view='', fields=''):
         """
         Gets a list of server profile templates based on optional sorting and filtering and is constrained by start and
         count parameters.
@@ -73,12 +73,86 @@ class ServerProfileTemplate(object):
             sort:
                 The sort order of the returned data set. By default, the sort order is based
                 on create time with the oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by
+                 specifying the name of a predefined view. The default view is expand (show
+                 all attributes of the resource and all elements of collections of resources).
+            fields:
+                Specifies which fields should be returned in the result set.
 
         Returns:
             list: A list of server profile templates.
 
         """
-        return self._client.get_all(start=start, count=count, filter=filter, sort=sort)
+        return self._client.get_all(start=start, count=count, filter=filter, sort=sort, view=view, fields=fields)
+
+    def iter_all(self, start=0, count=-1, filter='', sort='', view='', fields='', read_ahead=False):
+        """
+        Iterates over the server profile templates, requesting one page at a time.
+
+        Unlike get_all, the items are yielded as each page is received.
+
+        Args:
+            start:
+                The first item to return, using 0-based indexing.
+                If not specified, the default is 0 - start with the first available item.
+            count:
+                The number of resources to return.
+                Providing a -1 for the count parameter will restrict the result set size to 64 server profile
+                templates. The maximum number of profile templates is restricted to 256, that is, if user requests more
+                than 256, this will be internally limited to 256.
+                The actual number of items in the response might differ from the
+                requested count if the sum of start and count exceeds the total number of items, or if returning the
+                requested number of items would take too long.
+            filter (list or str):
+                A general filter/query string to narrow the list of items returned. The default is no filter; all
+                resources are returned.
+                Filters are supported for the name, description, affinity, macType, wwnType, serialNumberType, status,
+                serverHardwareTypeUri, enclosureGroupUri, and firmware.firmwareBaselineUri attributes.
+            sort:
+                The sort order of the returned data set. By default, the sort order is based
+                on create time with the oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by
+                 specifying the name of a predefined view. The default view is expand (show
+                 all attributes of the resource and all elements of collections of resources).
+            fields:
+                Specifies which fields should be returned in the result set.
+            read_ahead:
+                If True, the next page is requested while the current one is consumed.
+
+        Returns:
+            generator: The server profile templates.
+        """
+        return self._client.iter_all(start=start, count=count, filter=filter, sort=sort, view=view, fields=fields,
+                                     read_ahead=read_ahead)
+
+    def count(self, filter=''):
+        """
+        Gets the number of server profile templates that match the filter, without retrieving them.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items counted. The default is no filter; all
+                resources are counted.
+
+        Returns:
+            int: The number of matching server profile templates.
+        """
+        return self._client.count(filter=filter)
+
+    def exists(self, filter=''):
+        """
+        Checks if any of the server profile templates matches the filter, requesting a single item.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items checked. The default is no filter.
+
+        Returns:
+            bool: True when at least one matches.
+        """
+        return self._client.exists(filter=filter)
 
     def get(self, id_or_uri):
         """
@@ -92,7 +166,7 @@ class ServerProfileTemplate(object):
         """
         return self._client.get(id_or_uri=id_or_uri)
 
-    def get_by(self, field, value):
+    def get_by(self, field, value, view='', fields=''):
         """
         Gets all server profile templates that match a specified filter.
         The search is case-insensitive.
@@ -100,11 +174,13 @@ class ServerProfileTemplate(object):
         Args:
             field: Field name to filter.
             value: Value to filter.
+            view: Returns a specific subset of the attributes, by specifying the name of a predefined view.
+            fields: Specifies which fields should be returned in the result set.
 
         Returns:
             list: A list of server profile templates.
         """
-        return self._client.get_by(field, value)
+        return self._client.get_by(field, value, view=view, fields=fields)
 
     def get_by_name(self, name):
         """
@@ -53,7 +53,7 @@ class FirmwareBundles(object):
         self._client = ResourceClient(con, self.URI)
         self._task_monitor = TaskMonitor(con)
 
-    def upload(self, file_path, timeout=-1):
+    def upload(self, file_path, timeout=-1, progress_callback=None, max_retries=0):
         """
         Upload an SPP ISO image file or a hotfix file to the appliance.
         The API supports upload of one hotfix at a time into the system.
@@ -63,12 +63,18 @@ class FirmwareBundles(object):
             file_path: Full path to firmware.
             timeout: Timeout in seconds. Wait for task completion by default. The timeout does not abort the operation
                 in OneView; it just stops waiting for its completion.
+            progress_callback: Function called as the file is sent, with the bytes sent, the total bytes and the
+                throughput in bytes per second.
+            max_retries: Number of times the upload is restarted when the connection drops before the file is fully
+                sent. The appliance does not accept partial uploads, so each retry sends the file from the beginning.
 
         Returns:
           dict: Information about the updated firmware bundle.
         """
         upload_file_name = os.path.basename(file_path)
-        response, body = self._connection.post_multipart(self.URI, None, file_path, upload_file_name)
+        response, body = self._connection.post_multipart(self.URI, None, file_path, upload_file_name,
+                                                         progress_callback=progress_callback,
+                                                         adaptive_chunk_size=True, max_retries=max_retries)
         if response.status >= 400:
             raise HPOneViewException(body.get('message'))
 
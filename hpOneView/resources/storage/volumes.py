@@ -37,7 +37,7 @@ __copyright__ = '(C) Copyright (2012-2016) Hewlett Packard Enterprise ' \
 __license__ = 'MIT'
 __status__ = 'Development'
 
-from hpOneView.resources.resource import ResourceClient
+from hpOneView.resources.resource import ResourceClient, DEFAULT_BATCH_MAX_WORKERS
 
 INVALID_VOLUME_URI = "When no snapshot uri is provided, volume id or valume uri is required."
 
@@ -52,7 +52,7 @@ class Volumes(object):
             "type": "Snapshot"
         }
 
-    def get_all(self, start=0, count=-1, filter='', sort=''):
+    def get_all(self, start=0, count=-1, filter='', sort='', view='', fields=''):
         """
         Gets a paginated collection of managed volumes. The collection is based on optional
         sorting and filtering and is constrained by start and count parameters.
@@ -71,11 +71,79 @@ class Volumes(object):
             sort:
                 The sort order of the returned data set. By default, the sort order is based
                 on create time with the oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by
+                 specifying the name of a predefined view. The default view is expand (show
+                 all attributes of the resource and all elements of collections of resources).
+            fields:
+                Specifies which fields should be returned in the result set.
 
         Returns:
             list: A list of managed volumes.
         """
-        return self._client.get_all(start, count, filter=filter, sort=sort)
+        return self._client.get_all(start, count, filter=filter, sort=sort, view=view, fields=fields)
+
+    def iter_all(self, start=0, count=-1, filter='', sort='', view='', fields='', read_ahead=False):
+        """
+        Iterates over the managed volumes, requesting one page at a time.
+
+        Unlike get_all, the items are yielded as each page is received.
+
+        Args:
+            start:
+                The first item to return, using 0-based indexing.
+                If not specified, the default is 0 - start with the first available item.
+            count:
+                The number of resources to return. A count of -1 requests all items.
+                The actual number of items in the response might differ from the requested
+                count if the sum of start and count exceeds the total number of items.
+            filter (list or str):
+                A general filter/query string to narrow the list of items returned. The
+                default is no filter; all resources are returned.
+            sort:
+                The sort order of the returned data set. By default, the sort order is based
+                on create time with the oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by
+                 specifying the name of a predefined view. The default view is expand (show
+                 all attributes of the resource and all elements of collections of resources).
+            fields:
+                Specifies which fields should be returned in the result set.
+            read_ahead:
+                If True, the next page is requested while the current one is consumed.
+
+        Returns:
+            generator: The managed volumes.
+        """
+        return self._client.iter_all(start, count, filter=filter, sort=sort, view=view, fields=fields,
+                                     read_ahead=read_ahead)
+
+    def count(self, filter=''):
+        """
+        Gets the number of managed volumes that match the filter, without retrieving them.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items counted. The default is no filter; all
+                resources are counted.
+
+        Returns:
+            int: The number of matching managed volumes.
+        """
+        return self._client.count(filter=filter)
+
+    def exists(self, filter=''):
+        """
+        Checks if any of the managed volumes matches the filter, requesting a single item.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items checked. The default is no filter.
+
+        Returns:
+            bool: True when at least one matches.
+        """
+        return self._client.exists(filter=filter)
 
     def get(self, id_or_uri):
         """
@@ -89,7 +157,7 @@ class Volumes(object):
         """
         return self._client.get(id_or_uri)
 
-    def get_by(self, field, value):
+    def get_by(self, field, value, view='', fields=''):
         """
         Gets all managed volumes that matches the given filter.
 
@@ -98,11 +166,13 @@ class Volumes(object):
         Args:
             field: Field name to filter.
             value: Value to filter.
+            view: Returns a specific subset of the attributes, by specifying the name of a predefined view.
+            fields: Specifies which fields should be returned in the result set.
 
         Returns:
             list: A list of managed volumes.
         """
-        return self._client.get_by(field, value)
+        return self._client.get_by(field, value, view=view, fields=fields)
 
     def create(self, resource, timeout=-1):
         """
@@ -131,6 +201,24 @@ class Volumes(object):
         """
         return self._client.create(resource, timeout=timeout)
 
+    def create_many(self, resources, timeout=-1, max_workers=DEFAULT_BATCH_MAX_WORKERS):
+        """
+        Creates or adds several volumes at once, waiting for all their tasks together.
+
+        Args:
+            resources (list):
+                Objects to create. See create for the supported methods.
+            timeout:
+                Timeout in seconds for all the volumes to be created. Wait for task completion by default. The timeout
+                does not abort the operation in OneView, just stop waiting for its completion.
+            max_workers:
+                Maximum number of requests sent concurrently.
+
+        Returns:
+            list: A tuple (created or added volume, error) for each resource, in the same order as the input.
+        """
+        return self._client.create_many(resources, timeout=timeout, max_workers=max_workers)
+
     def update(self, resource, force=False, timeout=-1):
         """
         Updates properties of a volume.
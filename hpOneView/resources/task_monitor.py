@@ -38,8 +38,12 @@ __license__ = 'MIT'
 __status__ = 'Development'
 
 import logging
+import random
 import time
-from hpOneView.exceptions import HPOneViewInvalidResource, HPOneViewTimeout, HPOneViewTaskError, HPOneViewUnknownType
+from collections import OrderedDict
+from urllib.parse import quote
+from hpOneView.exceptions import HPOneViewException, HPOneViewInvalidResource, HPOneViewTimeout, HPOneViewTaskError, \
+    HPOneViewUnknownType
 
 TASK_PENDING_STATES = ['New', 'Starting', 'Pending', 'Running', 'Suspended', 'Stopping']
 TASK_ERROR_STATES = ['Error', 'Warning', 'Terminated', 'Killed']
@@ -53,10 +57,20 @@ MSG_INVALID_TASK = 'Invalid task was provided'
 
 UNLIMITED_TIMEOUT = -1
 
+TASKS_URI = '/rest/tasks'
+TASKS_PER_QUERY = 20
+MIN_POLLING_INTERVAL = 1
+MAX_POLLING_INTERVAL = 10
+
 logger = logging.getLogger(__name__)
 
 
 class TaskMonitor(object):
+    """
+    Waits for the tasks started on the appliance. It keeps no state besides its connection, so it can be shared by any
+    number of threads, each waiting for its own tasks.
+    """
+
     def __init__(self, con):
         self._connection = con
 
@@ -64,25 +78,26 @@ class TaskMonitor(object):
     def get_current_seconds():
         return int(time.time())
 
-    def wait_for_task(self, task, timeout=-1):
+    def wait_for_task(self, task, timeout=-1, fetch_resource=True):
         """
         Wait for task execution and return associated resource.
 
         Args:
             task: task dict
             timeout: timeout in seconds
+            fetch_resource:
+                If False, the URI of the associated resource is returned instead of the resource itself, which
+                saves one request to the appliance.
 
         Returns:
             Associated resource when creating or updating; True when deleting.
         """
-        self.__wait_task_completion(task, timeout)
-
-        task = self.get(task)
+        task = self.__wait_task_completion(task, timeout)
 
         logger.debug("Waiting for task. Percentage complete: " + str(task.get('computedPercentComplete')))
         logger.debug("Waiting for task. Task state: " + str(task.get('taskState')))
 
-        task_response = self.__get_task_response(task)
+        task_response = self.get_task_response(task, fetch_resource)
         logger.debug('Task completed')
         return task_response
 
@@ -97,9 +112,116 @@ class TaskMonitor(object):
         Returns:
             dict: TaskResource
         """
-        self.__wait_task_completion(task, timeout)
+        return self.__wait_task_completion(task, timeout)
+
+    def wait_for_tasks(self, tasks, timeout=-1, fetch_resource=True):
+        """
+        Waits for several tasks at once, yielding each one as soon as it completes.
 
-        return self.get(task)
+        The states of all the pending tasks are fetched through a single filtered query on /rest/tasks per polling
+        round, and the interval between rounds adapts to the progress and expected duration reported by the tasks.
+
+        Args:
+            tasks: list of task dicts
+            timeout: timeout in seconds for all the tasks to complete
+            fetch_resource: If False, the URI of each associated resource is returned instead of the resource.
+
+        Returns:
+            generator: A tuple (task, result, error) for each task, in completion order. The result is the same
+            returned by wait_for_task; error is the exception raised by a failed task, or None.
+        """
+        pending = OrderedDict()
+        for task in tasks:
+            if not task or 'uri' not in task:
+                raise HPOneViewUnknownType(MSG_INVALID_TASK)
+            pending[task['uri']] = task
+
+        start_time = self.get_current_seconds()
+
+        i = 0
+        while pending:
+            for task, error in self.__update_pending_tasks(pending):
+                yield task, None, error
+
+            for task_uri, task in list(pending.items()):
+                if task.get('taskState') in TASK_PENDING_STATES:
+                    continue
+                del pending[task_uri]
+                try:
+                    response = self.get_task_response(task, fetch_resource)
+                except Exception as e:
+                    yield task, None, e
+                else:
+                    yield task, response, None
+
+            if not pending:
+                break
+
+            if (timeout != UNLIMITED_TIMEOUT) and (start_time + timeout < self.get_current_seconds()):
+                raise HPOneViewTimeout(MSG_TIMEOUT % str(timeout))
+
+            i = i + 1 if i < MAX_POLLING_INTERVAL else MAX_POLLING_INTERVAL
+            time.sleep(self.__get_polling_interval(list(pending.values()), i))
+
+    def get_tasks(self, task_uris):
+        """
+        Retrieves several tasks through filtered queries on /rest/tasks.
+
+        Tasks not returned by the query are retrieved one by one. A task that cannot be retrieved, e.g. because it
+        was purged, does not prevent the others from being returned.
+
+        Args:
+            task_uris: list of task URIs
+
+        Returns:
+            tuple: The list of task dicts retrieved, and an OrderedDict of the URI of each task that could not be
+            retrieved to the exception raised.
+        """
+        tasks = []
+        errors = OrderedDict()
+        for index in range(0, len(task_uris), TASKS_PER_QUERY):
+            chunk = task_uris[index:index + TASKS_PER_QUERY]
+            query_filter = '"' + ' OR '.join("'uri'='{0}'".format(task_uri) for task_uri in chunk) + '"'
+            query_uri = '{0}?filter={1}&count={2}'.format(TASKS_URI, quote(query_filter), len(chunk))
+            try:
+                members = self._connection.get(query_uri).get('members') or []
+            except HPOneViewException:
+                logger.debug('Unable to query tasks in bulk, getting them one by one')
+                members = []
+
+            found = [task['uri'] for task in members if 'uri' in task]
+            tasks += members
+            for task_uri in chunk:
+                if task_uri in found:
+                    continue
+                try:
+                    tasks.append(self.get({'uri': task_uri}))
+                except Exception as e:
+                    errors[task_uri] = e
+        return tasks, errors
+
+    def __update_pending_tasks(self, pending):
+        # Refreshes the pending tasks in place, removing and returning the ones that could not be retrieved
+        tasks, errors = self.get_tasks(list(pending))
+        for task in tasks:
+            if task.get('uri') in pending:
+                pending[task['uri']] = task
+        return [(pending.pop(task_uri), error) for task_uri, error in errors.items() if task_uri in pending]
+
+    def __get_polling_interval(self, tasks, default_interval):
+        interval = default_interval
+        for task in tasks:
+            expected_duration = task.get('expectedDuration')
+            percent_complete = task.get('computedPercentComplete')
+            if expected_duration and percent_complete is not None:
+                # Check back about halfway through the estimated remaining time
+                remaining = expected_duration * (100 - min(percent_complete, 100)) / 100.0
+                interval = min(interval, remaining / 2)
+
+        interval = max(MIN_POLLING_INTERVAL, min(interval, MAX_POLLING_INTERVAL))
+
+        # Jitter keeps many monitors from polling the appliance in lockstep
+        return interval * random.uniform(0.8, 1.2)
 
     def __wait_task_completion(self, task, timeout):
         if not task:
@@ -110,8 +232,11 @@ class TaskMonitor(object):
         # gets current cpu second for timeout
         start_time = self.get_current_seconds()
 
+        # the last polled state is carried through the loop, so the completed task is not fetched again
+        task = self.get(task)
+
         i = 0
-        while self.is_task_running(task):
+        while task.get('taskState') in TASK_PENDING_STATES:
             # wait 1 to 10 seconds
             # the value increases to avoid flooding server with requests
             i = i + 1 if i < 10 else 10
@@ -123,7 +248,21 @@ class TaskMonitor(object):
             if (timeout != UNLIMITED_TIMEOUT) and (start_time + timeout < self.get_current_seconds()):
                 raise HPOneViewTimeout(MSG_TIMEOUT % str(timeout))
 
-    def __get_task_response(self, task):
+            task = self.get(task)
+
+        return task
+
+    def get_task_response(self, task, fetch_resource=True):
+        """
+        Gets the response of a completed task, raising HPOneViewTaskError when the task failed.
+
+        Args:
+            task: task dict in a completed state
+            fetch_resource: If False, the URI of the associated resource is returned instead of the resource.
+
+        Returns:
+            Associated resource when creating or updating; True when deleting.
+        """
         if task['taskState'] in TASK_ERROR_STATES and task['taskState'] != 'Warning':
             msg = None
             error_code = None
@@ -145,7 +284,7 @@ class TaskMonitor(object):
 
         if 'type' in task and task['type'].startswith('Task') and 'name' in task and not deleted_resource:
             # get associated resource when is not a delete task
-            task, entity = self.get_associated_resource(task)
+            task, entity = self.get_associated_resource(task, fetch_resource)
             return entity
 
         if 'name' in task and task['name'] == 'Delete':
@@ -186,12 +325,13 @@ class TaskMonitor(object):
         task = self._connection.get(task['uri'])
         return task
 
-    def get_associated_resource(self, task):
+    def get_associated_resource(self, task, fetch_resource=True):
         """
         Retrieve a resource associated with a task.
 
         Args:
             task: task dict
+            fetch_resource: If False, the URI of the resource is returned in place of the entity.
 
         Returns:
             tuple: task (updated), the entity found (dict)
@@ -217,9 +357,14 @@ class TaskMonitor(object):
         else:
             raise HPOneViewInvalidResource(MSG_TASK_TYPE_UNRECONIZED % task['type'])
 
+        if not fetch_resource:
+            return task, resource_uri
+
         entity = {}
 
         if resource_uri:
+            # A copy cached while the task was running would be stale now
+            self._connection.invalidate_cache(resource_uri)
             entity = self._connection.get(resource_uri)
 
         return task, entity
@@ -47,7 +47,7 @@ class UnmanagedDevices(object):
         self._connection = con
         self._client = ResourceClient(con, self.URI)
 
-    def get_all(self, start=0, count=-1, filter='', query='', sort=''):
+    def get_all(self, start=0, count=-1, filter='', query='', sort='', view='', fields=''):
         """
         Gets a set of unmanaged device resources according to the specified parameters. Filters can be used to get a
         specific set of unmanaged devices. With no filters specified, the API returns a potentially paginated list of
@@ -70,11 +70,86 @@ class UnmanagedDevices(object):
             sort:
                 The sort order of the returned data set. By default, the sort order is based
                 on create time with the oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by
+                 specifying the name of a predefined view. The default view is expand (show
+                 all attributes of the resource and all elements of collections of resources).
+            fields:
+                Specifies which fields should be returned in the result set.
 
         Returns:
              list: Unmanaged Devices
         """
-        return self._client.get_all(start, count, filter=filter, sort=sort, query=query)
+        return self._client.get_all(start, count, filter=filter, sort=sort, query=query, view=view, fields=fields)
+
+    def iter_all(self, start=0, count=-1, filter='', query='', sort='', view='', fields='', read_ahead=False):
+        """
+        Iterates over the unmanaged devices, requesting one page at a time.
+
+        Unlike get_all, the items are yielded as each page is received.
+
+        Args:
+            start:
+                The first item to return, using 0-based indexing.
+                If not specified, the default is 0 - start with the first available item.
+            count:
+                The number of resources to return. A count of -1 requests all items.
+                The actual number of items in the response might differ from the requested
+                count if the sum of start and count exceeds the total number of items.
+            filter (list or str):
+                A general filter/query string to narrow the list of items returned. The
+                default is no filter; all resources are returned.
+            query:
+                 A general query string to narrow the list of resources returned. The default
+                 is no query - all resources are returned.
+            sort:
+                The sort order of the returned data set. By default, the sort order is based
+                on create time with the oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by
+                 specifying the name of a predefined view. The default view is expand (show
+                 all attributes of the resource and all elements of collections of resources).
+            fields:
+                Specifies which fields should be returned in the result set.
+            read_ahead:
+                If True, the next page is requested while the current one is consumed.
+
+        Returns:
+            generator: The unmanaged devices.
+        """
+        return self._client.iter_all(start, count, filter=filter, sort=sort, query=query, view=view, fields=fields,
+                                     read_ahead=read_ahead)
+
+    def count(self, filter='', query=''):
+        """
+        Gets the number of unmanaged devices that match the filter, without retrieving them.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items counted. The default is no filter; all
+                resources are counted.
+            query:
+                A general query string to narrow the items counted.
+
+        Returns:
+            int: The number of matching unmanaged devices.
+        """
+        return self._client.count(filter=filter, query=query)
+
+    def exists(self, filter='', query=''):
+        """
+        Checks if any of the unmanaged devices matches the filter, requesting a single item.
+
+        Args:
+            filter (list or str):
+                A general filter/query string to narrow the items checked. The default is no filter.
+            query:
+                A general query string to narrow the items checked.
+
+        Returns:
+            bool: True when at least one matches.
+        """
+        return self._client.exists(filter=filter, query=query)
 
     def get(self, id_or_uri):
         """
@@ -179,7 +254,7 @@ class UnmanagedDevices(object):
         uri = self._client.build_uri(id_or_uri) + "/environmentalConfiguration"
         return self._client.get(uri)
 
-    def get_by(self, field, value):
+    def get_by(self, field, value, view='', fields=''):
         """
         Gets all Unmanaged Devices that match the filter
         The search is case-insensitive
@@ -187,8 +262,10 @@ class UnmanagedDevices(object):
         Args:
             field: field name to filter
             value: value to filter
+            view: Returns a specific subset of the attributes, by specifying the name of a predefined view.
+            fields: Specifies which fields should be returned in the result set.
 
         Returns:
             dict: Unmanaged Devices
         """
-        return self._client.get_by(field, value)
+        return self._client.get_by(field, value, view=view, fields=fields)
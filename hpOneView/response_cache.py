@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*
+
+"""
+response_cache.py
+~~~~~~~~~~~~~~
+
+This module implements an in-memory cache for GET responses, revalidated through ETags.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from future import standard_library
+
+standard_library.install_aliases()
+
+__title__ = 'response_cache'
+__version__ = '0.0.1'
+__copyright__ = '(C) Copyright (2012-2016) Hewlett Packard Enterprise ' \
+                ' Development LP'
+__license__ = 'MIT'
+__status__ = 'Development'
+
+###
+# (C) Copyright (2012-2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_CACHE_MAX_SIZE = 1000
+DEFAULT_CACHE_TTL = 300
+
+
+class CacheEntry(object):
+    """
+    A cached response body and the ETag it was served with.
+    """
+
+    def __init__(self, body, etag, expires):
+        self.body = body
+        self.etag = etag
+        self.expires = expires
+
+    def is_fresh(self):
+        return time.time() < self.expires
+
+
+class ResponseCache(object):
+    """
+    Bounded LRU cache of GET responses keyed by URI.
+
+    Only URIs under a prefix registered with a TTL are cached, so task polling and other volatile
+    resources always go to the appliance. Within its TTL an entry is served from memory; once it
+    expires it is kept so the next request can be revalidated with If-None-Match.
+    """
+
+    def __init__(self, max_size=DEFAULT_CACHE_MAX_SIZE, ttls=None):
+        """
+        Args:
+            max_size: Maximum number of responses kept.
+            ttls: Dict of URI prefix to the number of seconds responses under it are served without revalidation.
+        """
+        self._max_size = max_size
+        self._ttls = {}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        for uri_prefix, ttl in (ttls or {}).items():
+            self.set_ttl(uri_prefix, ttl)
+
+    def set_ttl(self, uri_prefix, ttl=DEFAULT_CACHE_TTL):
+        """
+        Enables caching for the URIs under a prefix.
+
+        Args:
+            uri_prefix: URI prefix, like '/rest/server-hardware-types'.
+            ttl: Seconds a response is served without revalidation. Use 0 to always revalidate.
+        """
+        with self._lock:
+            self._ttls[uri_prefix.rstrip('/')] = ttl
+
+    def get_ttl(self, uri):
+        """
+        Gets the TTL that applies to a URI.
+
+        Args:
+            uri: Resource or collection URI.
+
+        Returns:
+            int: Seconds from the longest matching prefix, or None when the URI is not cacheable.
+        """
+        path = uri.split('?', 1)[0]
+        matched = None
+        with self._lock:
+            for uri_prefix in self._ttls:
+                if path == uri_prefix or path.startswith(uri_prefix + '/'):
+                    if matched is None or len(uri_prefix) > len(matched):
+                        matched = uri_prefix
+            return self._ttls[matched] if matched is not None else None
+
+    def lookup(self, uri):
+        """
+        Gets the cached entry of a URI.
+
+        Args:
+            uri: Requested URI.
+
+        Returns:
+            CacheEntry: Entry with a private copy of the body, or None when nothing is cached.
+        """
+        with self._lock:
+            entry = self._entries.get(uri)
+            if entry is None:
+                return None
+            self._entries.pop(uri)
+            self._entries[uri] = entry
+            return CacheEntry(copy.deepcopy(entry.body), entry.etag, entry.expires)
+
+    def store(self, uri, body, etag=None):
+        """
+        Caches a response body when its URI is cacheable.
+
+        Args:
+            uri: Requested URI.
+            body: Decoded response body.
+            etag: ETag of the response. Falls back to the 'eTag' attribute of the body.
+        """
+        ttl = self.get_ttl(uri)
+        if ttl is None:
+            return
+        if etag is None and isinstance(body, dict):
+            etag = body.get('eTag')
+        entry = CacheEntry(copy.deepcopy(body), etag, time.time() + ttl)
+        with self._lock:
+            self._entries.pop(uri, None)
+            self._entries[uri] = entry
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def refresh(self, uri):
+        """
+        Restarts the TTL of an entry after the appliance confirmed it is unchanged.
+
+        Args:
+            uri: Requested URI.
+        """
+        ttl = self.get_ttl(uri)
+        with self._lock:
+            entry = self._entries.get(uri)
+            if entry is not None and ttl is not None:
+                entry.expires = time.time() + ttl
+
+    def invalidate(self, uri):
+        """
+        Removes the cached responses of a resource, with any query string, and of its sub-resources.
+
+        Args:
+            uri: Resource URI.
+        """
+        uri = uri.split('?', 1)[0].rstrip('/')
+        self.__remove(lambda path: path == uri or path.startswith(uri + '/'))
+
+    def invalidate_listings(self, collection_uri):
+        """
+        Removes the cached listings of a collection, keeping the cached members.
+
+        Args:
+            collection_uri: Collection URI, like '/rest/server-profiles'.
+        """
+        collection_uri = collection_uri.split('?', 1)[0].rstrip('/')
+        self.__remove(lambda path: path == collection_uri)
+
+    def clear(self):
+        """
+        Removes all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __remove(self, matches):
+        with self._lock:
+            for uri in [uri for uri in self._entries if matches(uri.split('?', 1)[0])]:
+                del self._entries[uri]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*
+
+"""
+retry_policy.py
+~~~~~~~~~~~~~~
+
+This module implements the retries of the requests that fail transiently, and the circuit breaker that fails fast
+while an appliance is down.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from future import standard_library
+
+standard_library.install_aliases()
+
+__title__ = 'retry_policy'
+__version__ = '0.0.1'
+__copyright__ = '(C) Copyright (2012-2016) Hewlett Packard Enterprise ' \
+                ' Development LP'
+__license__ = 'MIT'
+__status__ = 'Development'
+
+###
+# (C) Copyright (2012-2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import errno
+import random
+import threading
+import time
+
+from hpOneView.exceptions import HPOneViewCircuitOpen
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30
+DEFAULT_RETRYABLE_STATUSES = (429, 502, 503, 504)
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+# Statuses telling the request was rejected before being processed, so it is safe to send it again whatever the method
+NOT_PROCESSED_STATUSES = (429,)
+UNAVAILABLE_STATUSES = (502, 503, 504)
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30
+
+MSG_CIRCUIT_OPEN = 'The appliance %s is unavailable after %d consecutive failures. Retry in %.0f seconds.'
+
+
+class RetryPolicy(object):
+    """
+    Decides which failed requests are sent again and how long to wait before each attempt.
+
+    Requests with an idempotent method are retried on connection errors and on the retryable statuses. POST and
+    PATCH requests are only retried when the appliance refused the connection or answered 429, since they were not
+    processed, so a create is never replayed.
+    """
+
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS, backoff_base=DEFAULT_BACKOFF_BASE,
+                 backoff_max=DEFAULT_BACKOFF_MAX, jitter=True, retryable_statuses=DEFAULT_RETRYABLE_STATUSES,
+                 idempotent_methods=IDEMPOTENT_METHODS):
+        """
+        Args:
+            max_attempts: Maximum number of times a request is sent, including the first one.
+            backoff_base: Seconds waited before the first retry. The wait doubles on each retry.
+            backoff_max: Maximum seconds waited before a retry.
+            jitter: Whether to wait a random time up to the backoff, so clients do not retry in lockstep.
+            retryable_statuses: HTTP statuses that are retried.
+            idempotent_methods: HTTP methods that are safe to send more than once.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retryable_statuses = retryable_statuses
+        self.idempotent_methods = idempotent_methods
+
+    def should_retry(self, method, attempt, status=None, error=None):
+        """
+        Tells whether a failed request is sent again.
+
+        Args:
+            method: HTTP method.
+            attempt: Number of times the request was sent.
+            status: HTTP status of the response, when there is one.
+            error: Exception raised while sending the request, when there is no response.
+
+        Returns:
+            bool:
+        """
+        if attempt >= self.max_attempts:
+            return False
+        idempotent = method.upper() in self.idempotent_methods
+        if error is not None:
+            return idempotent or getattr(error, 'errno', None) == errno.ECONNREFUSED
+        if status not in self.retryable_statuses:
+            return False
+        return idempotent or status in NOT_PROCESSED_STATUSES
+
+    def get_backoff(self, attempt, retry_after=None):
+        """
+        Gets the seconds to wait before sending a request again.
+
+        Args:
+            attempt: Number of times the request was sent.
+            retry_after: Value of the Retry-After header of the response, honored when it is a number of seconds.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        try:
+            return min(float(retry_after), self.backoff_max)
+        except (TypeError, ValueError):
+            pass
+        backoff = min(self.backoff_base * 2 ** (attempt - 1), self.backoff_max)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+class CircuitBreaker(object):
+    """
+    Fails fast while an appliance is down.
+
+    The circuit opens after a number of consecutive failures: connection errors or 502, 503 and 504 responses. While
+    open, requests raise HPOneViewCircuitOpen without reaching the appliance. After the reset timeout, a single request
+    is let through: the circuit closes if it succeeds and opens again if it fails.
+    """
+
+    def __init__(self, host, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT):
+        """
+        Args:
+            host: Appliance address, used in the error message.
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before a request is let through.
+        """
+        self._host = host
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        with self._lock:
+            return self._opened is not None
+
+    def before_request(self):
+        """
+        Lets a request through, unless the circuit is open.
+
+        Raises:
+            HPOneViewCircuitOpen: When the circuit is open.
+        """
+        with self._lock:
+            if self._opened is None:
+                return
+            remaining = self._opened + self._reset_timeout - time.time()
+            if remaining <= 0 and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            raise HPOneViewCircuitOpen(MSG_CIRCUIT_OPEN % (self._host, self._failures, max(remaining, 0)))
+
+    def record(self, failed):
+        """
+        Records the outcome of a request let through.
+
+        Args:
+            failed: Whether the request failed with a connection error or the appliance was unavailable.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+            if not failed:
+                self._failures = 0
+                self._opened = None
+                return
+            self._failures += 1
+            if self._opened is not None or self._failures >= self._failure_threshold:
+                self._opened = time.time()
+
+    def reset(self):
+        """
+        Closes the circuit.
+        """
+        self.record(failed=False)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*
+
+"""
+session_store.py
+~~~~~~~~~~~~~~
+
+This module implements a store of login sessions shared by the processes of a user, so they reuse a valid session
+instead of logging in again.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from future import standard_library
+
+standard_library.install_aliases()
+
+__title__ = 'session_store'
+__version__ = '0.0.1'
+__copyright__ = '(C) Copyright (2012-2016) Hewlett Packard Enterprise ' \
+                ' Development LP'
+__license__ = 'MIT'
+__status__ = 'Development'
+
+###
+# (C) Copyright (2012-2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+DEFAULT_SESSION_STORE_PATH = os.path.join(os.path.expanduser('~'), '.hpOneView', 'sessions')
+
+logger = logging.getLogger(__name__)
+
+
+def write_private_file(path, file_name, content):
+    """
+    Writes a file readable only by the owner, replacing it atomically, so concurrent processes never read a partial
+    file.
+
+    Args:
+        path: Directory of the file. It is created, readable only by the owner, when missing.
+        file_name: Full path of the file, in the directory.
+        content: Text written to the file.
+    """
+    if not os.path.isdir(path):
+        os.makedirs(path, 0o700)
+
+    # mkstemp creates the file readable only by the owner
+    handle, temp_file_name = tempfile.mkstemp(dir=path)
+    try:
+        with os.fdopen(handle, 'w') as private_file:
+            private_file.write(content)
+        getattr(os, 'replace', os.rename)(temp_file_name, file_name)
+    except Exception:
+        os.remove(temp_file_name)
+        raise
+
+
+class FileSessionStore(object):
+    """
+    Keeps the session ID of each appliance and user in a file readable only by the owner.
+
+    The passwords are never stored. Files readable by other users are ignored, and files are replaced atomically, so
+    concurrent processes never read a partial session.
+    """
+
+    def __init__(self, path=DEFAULT_SESSION_STORE_PATH):
+        """
+        Args:
+            path: Directory of the session files. It is created, readable only by the owner, when missing.
+        """
+        self._path = path
+
+    def get(self, host, cred):
+        """
+        Gets the stored session of a user.
+
+        Args:
+            host: Appliance address.
+            cred: Login credentials, with the userName and the optional authLoginDomain.
+
+        Returns:
+            dict: sessionID and apiVersion, or None when there is no session stored.
+        """
+        file_name = self.__get_file_name(host, cred)
+        try:
+            if os.name == 'posix' and os.stat(file_name).st_mode & 0o077:
+                logger.warning('Ignoring session file %s readable by other users' % file_name)
+                return None
+            with open(file_name) as session_file:
+                session = json.load(session_file)
+        except (IOError, OSError, ValueError):
+            return None
+        return session if session.get('sessionID') else None
+
+    def save(self, host, cred, session_id, api_version):
+        """
+        Stores the session of a user.
+
+        Args:
+            host: Appliance address.
+            cred: Login credentials, with the userName and the optional authLoginDomain.
+            session_id: Session ID returned by the login.
+            api_version: API version validated by the login.
+        """
+        session = {'host': host, 'userName': cred.get('userName'), 'authLoginDomain': cred.get('authLoginDomain'),
+                   'sessionID': session_id, 'apiVersion': api_version}
+        write_private_file(self._path, self.__get_file_name(host, cred), json.dumps(session))
+
+    def delete(self, host, cred, session_id=None):
+        """
+        Removes the stored session of a user.
+
+        Args:
+            host: Appliance address.
+            cred: Login credentials, with the userName and the optional authLoginDomain.
+            session_id: Removes the session only when it is still this one, so a session renewed by another process
+                is kept.
+        """
+        session = self.get(host, cred)
+        if session is None or (session_id is not None and session['sessionID'] != session_id):
+            return
+        try:
+            os.remove(self.__get_file_name(host, cred))
+        except OSError:
+            pass
+
+    def __get_file_name(self, host, cred):
+        key = json.dumps([host, cred.get('userName'), cred.get('authLoginDomain') or ''])
+        return os.path.join(self._path, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
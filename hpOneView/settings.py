@@ -14,7 +14,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from builtins import open
 from future import standard_library
 
 standard_library.install_aliases()
@@ -146,10 +145,7 @@ class settings(object):
 
     @deprecated
     def download_support_dump(self, dumpInfo):
-        body = self._con.get(dumpInfo['uri'])
-        f = open(dumpInfo['uri'].split('/')[-1], 'wb')
-        f.write(body)
-        f.close()
+        self._con.download(dumpInfo['uri'], dumpInfo['uri'].split('/')[-1])
         return
 
     @deprecated
@@ -167,10 +163,7 @@ class settings(object):
 
     @deprecated
     def download_backup(self, backup):
-        body = self._con.get(backup['downloadUri'])
-        f = open(backup['downloadUri'].split('/')[-1] + '.bkp', 'wb')
-        f.write(body)
-        f.close()
+        self._con.download(backup['downloadUri'], backup['downloadUri'].split('/')[-1] + '.bkp')
         return
 
     @deprecated
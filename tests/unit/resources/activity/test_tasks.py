@@ -48,7 +48,33 @@ class TasksTest(TestCase):
                                                 '.resourceCatgory=\'appliance\'"',
                                          query='', sort='name:ascending', start=0, view='day')
 
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all(self, mock_iter_all):
+        self._client.iter_all(fields='parentTaskUri,owner,name', filter="\"taskState='Running'\"", read_ahead=True)
+
+        mock_iter_all.assert_called_once_with(count=-1, fields='parentTaskUri,owner,name',
+                                              filter='"taskState=\'Running\'"', query='', sort='', start=0,
+                                              view='', read_ahead=True)
+
     @mock.patch.object(ResourceClient, 'get')
     def test_get_specific(self, mock_get):
         self._client.get('35323930-4936-4450-5531-303153474820')
         mock_get.assert_called_once_with('35323930-4936-4450-5531-303153474820')
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._client.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'", query='')
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._client.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'", query='')
@@ -43,12 +43,22 @@ class RacksTest(TestCase):
 
         self._racks.get_all(2, 500, filter=filter, sort=sort)
 
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, query='')
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, query='', view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._racks.iter_all(2, 500, filter=filter, sort=sort)
+
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter, sort=sort, query='', view='', fields='',
+                                              read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_all_called_once_with_default(self, mock_get_all):
         self._racks.get_all()
-        mock_get_all.assert_called_once_with(0, -1, filter='', sort='', query='')
+        mock_get_all.assert_called_once_with(0, -1, filter='', sort='', query='', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get')
     def test_get_by_id_called_once(self, mock_get):
@@ -80,7 +90,7 @@ class RacksTest(TestCase):
     def test_get_by_called_once(self, mock_get_by):
         self._racks.get_by("name", "test name")
 
-        mock_get_by.assert_called_once_with("name", "test name")
+        mock_get_by.assert_called_once_with("name", "test name", view='', fields='')
 
     @mock.patch.object(ResourceClient, 'create')
     def test_add_called_once_with_defaults(self, mock_create):
@@ -137,3 +147,21 @@ class RacksTest(TestCase):
         self._racks.remove(id)
 
         mock_delete.assert_called_once_with(id, force=False, timeout=-1)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._racks.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'", query='')
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._racks.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'", query='')
@@ -44,7 +44,16 @@ class ManagedSANsTest(TestCase):
         sort = 'name:ascending'
 
         self._resource.get_all(start=2, count=500, query=query_filter, sort=sort)
-        mock_get_all.assert_called_once_with(start=2, count=500, query=query_filter, sort=sort)
+        mock_get_all.assert_called_once_with(start=2, count=500, query=query_filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all(self, mock_iter_all):
+        query_filter = "name EQ 'TestName'"
+        sort = 'name:ascending'
+
+        self._resource.iter_all(start=2, count=500, query=query_filter, sort=sort)
+        mock_iter_all.assert_called_once_with(start=2, count=500, query=query_filter, sort=sort, view='', fields='',
+                                              read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_by_name_should_return_san_manager_when_found(self, mock_get_all):
@@ -144,3 +153,21 @@ class ManagedSANsTest(TestCase):
 
         expected_uri = '/rest/fc-sans/managed-sans/280FF951-F007-478F-AC29-E4655FC76DDC/issues/'
         mock_create_report.assert_called_once_with(uri=expected_uri, timeout=-1)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._resource.count(query="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(query="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._resource.exists(query="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(query="name='test'")
@@ -51,7 +51,16 @@ class ConnectionTemplatesTest(unittest.TestCase):
 
         self._connection_templates.get_all(2, 500, filter, sort)
 
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._connection_templates.iter_all(2, 500, filter, sort)
+
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='', read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get_by')
     def test_get_by_called_once(self, mock_get_by):
@@ -59,7 +68,7 @@ class ConnectionTemplatesTest(unittest.TestCase):
             'name', 'name1128673347-1465916352647')
 
         mock_get_by.assert_called_once_with(
-            'name', 'name1128673347-1465916352647')
+            'name', 'name1128673347-1465916352647', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get')
     def test_get_default_called_once(self, mock_get):
@@ -80,3 +89,21 @@ class ConnectionTemplatesTest(unittest.TestCase):
         }
         self._connection_templates.update(con_template, 70)
         mock_update.assert_called_once_with(con_template, timeout=70)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._connection_templates.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._connection_templates.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
@@ -43,7 +43,16 @@ class EthernetNetworksTest(TestCase):
 
         self._ethernet_networks.get_all(2, 500, filter, sort)
 
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._ethernet_networks.iter_all(2, 500, filter, sort)
+
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='', read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'create')
     def test_create_should_use_given_values(self, mock_create):
@@ -104,7 +113,7 @@ class EthernetNetworksTest(TestCase):
         mock_create.assert_called_once_with(
             resource_rest_call, uri='/rest/ethernet-networks/bulk', timeout=27)
         mock_get_all.assert_called_once_with(
-            0, -1, filter='"\'name\' matches \'TestNetwork\\_%\'"', sort='vlanId:ascending')
+            0, -1, filter='"\'name\' matches \'TestNetwork\\_%\'"', sort='vlanId:ascending', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'update')
     def test_update_should_use_given_values(self, mock_update):
@@ -154,7 +163,7 @@ class EthernetNetworksTest(TestCase):
             'name', 'OneViewSDK Test Ethernet Network')
 
         mock_get_by.assert_called_once_with(
-            'name', 'OneViewSDK Test Ethernet Network')
+            'name', 'OneViewSDK Test Ethernet Network', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get')
     def test_get_called_once(self, mock_get):
@@ -300,3 +309,21 @@ class EthernetNetworksTest(TestCase):
         expected_result = [6, 7, 9, 10]
         result = self._ethernet_networks.dissociate_values_or_ranges('6-7,9-10')
         self.assertEqual(result, expected_result)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._ethernet_networks.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._ethernet_networks.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
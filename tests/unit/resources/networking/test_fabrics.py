@@ -51,11 +51,38 @@ class FabricsTest(unittest.TestCase):
 
         self._fabrics.get_all(2, 500, filter, sort)
 
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._fabrics.iter_all(2, 500, filter, sort)
+
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='', read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get_by')
     def test_get_by_called_once(self, mock_get_by):
         self._fabrics.get_by('name', 'DefaultFabric')
 
         mock_get_by.assert_called_once_with(
-            'name', 'DefaultFabric')
+            'name', 'DefaultFabric', view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._fabrics.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._fabrics.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
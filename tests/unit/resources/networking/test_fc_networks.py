@@ -43,7 +43,16 @@ class FcNetworksTest(unittest.TestCase):
 
         self._fc_networks.get_all(2, 500, filter, sort)
 
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._fc_networks.iter_all(2, 500, filter, sort)
+
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='', read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'create')
     def test_create_should_use_given_values(self, mock_create):
@@ -125,7 +134,7 @@ class FcNetworksTest(unittest.TestCase):
     def test_get_by_called_once(self, mock_get_by):
         self._fc_networks.get_by('name', 'OneViewSDK "Test FC Network')
 
-        mock_get_by.assert_called_once_with('name', 'OneViewSDK "Test FC Network')
+        mock_get_by.assert_called_once_with('name', 'OneViewSDK "Test FC Network', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get')
     def test_get_called_once(self, mock_get):
@@ -139,3 +148,21 @@ class FcNetworksTest(unittest.TestCase):
         self._fc_networks.get(uri)
 
         mock_get.assert_called_once_with(uri)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._fc_networks.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._fc_networks.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
@@ -81,7 +81,7 @@ class InterconnectsTest(unittest.TestCase):
         value = 'fakeName'
 
         self._interconnects.get_by(field, value)
-        mock_get_by.assert_called_once_with(field, value)
+        mock_get_by.assert_called_once_with(field, value, view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get_by_name')
     def test_get_interconnect_by_name(self, mock_get_by_name):
@@ -96,7 +96,15 @@ class InterconnectsTest(unittest.TestCase):
         sort = 'name:ascending'
 
         self._interconnects.get_all(2, 5, filter, sort)
-        mock_get_all.assert_called_once_with(2, 5, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 5, filter=filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._interconnects.iter_all(2, 5, filter, sort, read_ahead=True)
+        mock_iter_all.assert_called_once_with(2, 5, filter=filter, sort=sort, view='', fields='', read_ahead=True)
 
     @mock.patch.object(ResourceClient, 'patch')
     def test_patch_interconnect_should_return_the_task(self, mock_patch):
@@ -151,3 +159,21 @@ class InterconnectsTest(unittest.TestCase):
 
         self._interconnects.update_ports(ports, interconnect_id)
         mock_update.assert_called_once_with(expected_ports, url, -1)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._interconnects.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._interconnects.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
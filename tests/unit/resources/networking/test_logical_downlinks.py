@@ -44,7 +44,16 @@ class LogicalDownlinksTest(unittest.TestCase):
 
         self._logical_downlinks.get_all(2, 500, filter, sort)
 
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._logical_downlinks.iter_all(2, 500, filter, sort)
+
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='', read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get_by')
     def test_get_by_called_once(self, mock_get_by):
@@ -52,7 +61,7 @@ class LogicalDownlinksTest(unittest.TestCase):
             'name', 'HP VC FlexFabric 10Gb/24-Port Module')
 
         mock_get_by.assert_called_once_with(
-            'name', 'HP VC FlexFabric 10Gb/24-Port Module')
+            'name', 'HP VC FlexFabric 10Gb/24-Port Module', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get')
     def test_get_called_once(self, mock_get):
@@ -83,3 +92,21 @@ class LogicalDownlinksTest(unittest.TestCase):
         self._logical_downlinks.get_all_without_ethernet(2, 500, filter, sort)
 
         mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._logical_downlinks.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._logical_downlinks.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
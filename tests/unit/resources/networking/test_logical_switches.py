@@ -43,7 +43,16 @@ class LogicalSwitchesTest(unittest.TestCase):
 
         self._logical_switches.get_all(2, 500, filter, sort)
 
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._logical_switches.iter_all(2, 500, filter, sort)
+
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='', read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'create')
     def test_create_should_use_given_values(self, mock_create):
@@ -138,7 +147,7 @@ class LogicalSwitchesTest(unittest.TestCase):
     def test_get_by_called_once(self, mock_get_by):
         self._logical_switches.get_by('name', 'Test Logical Switch')
 
-        mock_get_by.assert_called_once_with('name', 'Test Logical Switch')
+        mock_get_by.assert_called_once_with('name', 'Test Logical Switch', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get')
     def test_get_called_once(self, mock_get):
@@ -171,3 +180,21 @@ class LogicalSwitchesTest(unittest.TestCase):
         self._logical_switches.refresh(id)
 
         mock_update_with_zero_body.assert_called_once_with(uri_rest_call, timeout=-1)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._logical_switches.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._logical_switches.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
@@ -42,18 +42,25 @@ class UplinkSetsTest(unittest.TestCase):
         filter = 'name=TestName'
         sort = 'name:ascending'
         self._uplink_sets.get_all(2, 500, filter, sort)
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+        self._uplink_sets.iter_all(2, 500, filter, sort)
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='', read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_all_called_once_with_defaults(self, mock_get_all):
         self._uplink_sets.get_all()
-        mock_get_all.assert_called_once_with(0, -1, filter='', sort='')
+        mock_get_all.assert_called_once_with(0, -1, filter='', sort='', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get_by')
     def test_get_by_called_once(self, mock_get_by):
         self._uplink_sets.get_by('name', 'OneViewSDK Test Uplink Set')
 
-        mock_get_by.assert_called_once_with('name', 'OneViewSDK Test Uplink Set')
+        mock_get_by.assert_called_once_with('name', 'OneViewSDK Test Uplink Set', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get')
     def test_get_called_once(self, mock_get):
@@ -379,3 +386,21 @@ class UplinkSetsTest(unittest.TestCase):
         result = self._uplink_sets.remove_ethernet_networks(id, ethernet_to_remove)
         self.assertEqual(mock_uplink_update.call_count, 0)
         self.assertEqual(uplink, result)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._uplink_sets.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._uplink_sets.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
@@ -49,6 +49,18 @@ class ConnectionsTest(TestCase):
         mock_get_all.assert_called_once_with(
             2, 500, filter=filter, sort=sort, view=view, fields=fields)
 
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'interconnectUri=xxxx'
+        sort = 'name:ascending'
+        fields = 'name'
+        view = ''
+
+        self._connections.iter_all(2, 500, filter, sort, view, fields)
+
+        mock_iter_all.assert_called_once_with(
+            2, 500, filter=filter, sort=sort, view=view, fields=fields, read_ahead=False)
+
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_all_called_once_with_defaults(self, mock_get_all):
         self._connections.get_all()
@@ -61,7 +73,7 @@ class ConnectionsTest(TestCase):
         self._connections.get_by('name', 'OneViewSDK-Test-Connection')
 
         mock_get_by.assert_called_once_with(
-            'name', 'OneViewSDK-Test-Connection')
+            'name', 'OneViewSDK-Test-Connection', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get')
     def test_get_called_once(self, mock_get):
@@ -76,3 +88,21 @@ class ConnectionsTest(TestCase):
         self._connections.get(uri)
 
         mock_get.assert_called_once_with(uri)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._connections.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._connections.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
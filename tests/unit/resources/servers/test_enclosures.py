@@ -43,19 +43,25 @@ class EnclosuresTest(TestCase):
 
         self._enclosures.get_all(2, 500, filter, sort)
 
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_all_called_once_with_default_values(self, mock_get_all):
         self._enclosures.get_all()
 
-        mock_get_all.assert_called_once_with(0, -1, filter='', sort='')
+        mock_get_all.assert_called_once_with(0, -1, filter='', sort='', view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once_with_default_values(self, mock_iter_all):
+        self._enclosures.iter_all()
+
+        mock_iter_all.assert_called_once_with(0, -1, filter='', sort='', view='', fields='', read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get_by')
     def test_get_by_called_once(self, mock_get_by):
         self._enclosures.get_by('name', 'OneViewSDK-Test-Enclosure')
 
-        mock_get_by.assert_called_once_with('name', 'OneViewSDK-Test-Enclosure')
+        mock_get_by.assert_called_once_with('name', 'OneViewSDK-Test-Enclosure', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'create')
     def test_add_called_once(self, mock_create):
@@ -67,6 +73,14 @@ class EnclosuresTest(TestCase):
         self._enclosures.add(information)
         mock_create.assert_called_once_with(information.copy(), timeout=-1)
 
+    @mock.patch.object(ResourceClient, 'create_many')
+    def test_add_many_called_once(self, mock_create_many):
+        information = [{'enclosureGroupUri': '/rest/enclosure-groups/id-enclosure-group', 'hostname': '1.1.1.1'},
+                       {'enclosureGroupUri': '/rest/enclosure-groups/id-enclosure-group', 'hostname': '1.1.1.2'}]
+
+        self._enclosures.add_many(information, timeout=600)
+        mock_create_many.assert_called_once_with(information, timeout=600, max_workers=8)
+
     @mock.patch.object(ResourceClient, 'get')
     def test_get_called_once(self, mock_get):
         self._enclosures.get('3518be0e-17c1-4189-8f81-83f3724f6155')
@@ -239,3 +253,21 @@ class EnclosuresTest(TestCase):
 
         mock_get.assert_called_once_with('/rest/enclosures/09USE7335NW3',
                                          fields=None, filter=None, refresh=False, view=None)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._enclosures.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._enclosures.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
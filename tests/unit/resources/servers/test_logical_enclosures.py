@@ -43,19 +43,28 @@ class LogicalEnclosuresTest(TestCase):
 
         self._logical_enclosures.get_all(2, 500, filter, sort)
 
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._logical_enclosures.iter_all(2, 500, filter, sort)
+
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='', read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_all_called_once_with_default_values(self, mock_get_all):
         self._logical_enclosures.get_all()
 
-        mock_get_all.assert_called_once_with(0, -1, filter='', sort='')
+        mock_get_all.assert_called_once_with(0, -1, filter='', sort='', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get_by')
     def test_get_by_called_once(self, mock_get_by):
         self._logical_enclosures.get_by('name', 'OneViewSDK-Test-Logical-Enclosure')
 
-        mock_get_by.assert_called_once_with('name', 'OneViewSDK-Test-Logical-Enclosure')
+        mock_get_by.assert_called_once_with('name', 'OneViewSDK-Test-Logical-Enclosure', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get_by_name')
     def test_get_by_name_called_once(self, mock_get_by_name):
@@ -203,3 +212,21 @@ class LogicalEnclosuresTest(TestCase):
 
         mock_update_with_zero_body.assert_called_once_with(
             uri=uri_rest_call, timeout=-1)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._logical_enclosures.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._logical_enclosures.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
@@ -60,20 +60,42 @@ class ServerHardwareTest(TestCase):
 
         self._server_hardware.get_all(2, 500, filter, sort)
 
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_all_called_once_with_default_values(self, mock_get_all):
         self._server_hardware.get_all()
 
-        mock_get_all.assert_called_once_with(0, -1, filter='', sort='')
+        mock_get_all.assert_called_once_with(0, -1, filter='', sort='', view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_get_all_with_fields(self, mock_get_all):
+        self._server_hardware.get_all(fields='uri,name,serialNumber,powerState')
+
+        mock_get_all.assert_called_once_with(0, -1, filter='', sort='', view='',
+                                             fields='uri,name,serialNumber,powerState')
+
+    @mock.patch.object(ResourceClient, 'get_by')
+    def test_get_by_with_view(self, mock_get_by):
+        self._server_hardware.get_by('name', 'OneViewSDK-Test-Rack-Server', view='minimal', fields='uri')
+
+        mock_get_by.assert_called_once_with('name', 'OneViewSDK-Test-Rack-Server', view='minimal', fields='uri')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._server_hardware.iter_all(2, 500, filter, sort, read_ahead=True)
+
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='', read_ahead=True)
 
     @mock.patch.object(ResourceClient, 'get_by')
     def test_get_by_called_once(self, mock_get_by):
         self._server_hardware.get_by('name', 'OneViewSDK-Test-Rack-Server')
 
         mock_get_by.assert_called_once_with(
-            'name', 'OneViewSDK-Test-Rack-Server')
+            'name', 'OneViewSDK-Test-Rack-Server', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'create')
     def test_add_called_once(self, mock_create):
@@ -298,3 +320,21 @@ class ServerHardwareTest(TestCase):
 
         mock_get.assert_called_once_with('/rest/server-hardware/ad28cf21-8b15-4f92-bdcf-51cb2042db32/mpFirmwareVersion',
                                          -1)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._server_hardware.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._server_hardware.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
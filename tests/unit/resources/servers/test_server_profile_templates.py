@@ -45,7 +45,16 @@ class ServerProfileTemplateTest(TestCase):
         sort = 'name:ascending'
 
         self._resource.get_all(start=2, count=500, filter=query_filter, sort=sort)
-        mock_get_all.assert_called_once_with(start=2, count=500, filter=query_filter, sort=sort)
+        mock_get_all.assert_called_once_with(start=2, count=500, filter=query_filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all(self, mock_iter_all):
+        query_filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._resource.iter_all(start=2, count=500, filter=query_filter, sort=sort)
+        mock_iter_all.assert_called_once_with(start=2, count=500, filter=query_filter, sort=sort, view='', fields='',
+                                              read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get')
     def test_get_by_id(self, mock_get):
@@ -60,7 +69,7 @@ class ServerProfileTemplateTest(TestCase):
         template_name = "BL460c Gen8 1"
 
         self._resource.get_by(template_property, template_name)
-        mock_get_by.assert_called_once_with(template_property, template_name)
+        mock_get_by.assert_called_once_with(template_property, template_name, view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get_by_name')
     def test_get_by_name(self, mock_get_by_name):
@@ -104,3 +113,21 @@ class ServerProfileTemplateTest(TestCase):
 
         self._resource.get_new_profile(id_or_uri=template_id)
         mock_get.assert_called_once_with(id_or_uri=expected_uri)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._resource.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._resource.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
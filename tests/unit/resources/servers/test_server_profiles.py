@@ -44,7 +44,16 @@ class ServerProfilesTest(TestCase):
         sort = 'name:ascending'
 
         self._resource.get_all(start=2, count=500, filter=query_filter, sort=sort)
-        mock_get_all.assert_called_once_with(start=2, count=500, filter=query_filter, sort=sort)
+        mock_get_all.assert_called_once_with(start=2, count=500, filter=query_filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all(self, mock_iter_all):
+        query_filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._resource.iter_all(start=2, count=500, filter=query_filter, sort=sort)
+        mock_iter_all.assert_called_once_with(start=2, count=500, filter=query_filter, sort=sort, view='', fields='',
+                                              read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get')
     def test_get_by_id(self, mock_get):
@@ -59,7 +68,7 @@ class ServerProfilesTest(TestCase):
         profile_name = "Server Profile Test"
 
         self._resource.get_by(profile_property, profile_name)
-        mock_get_by.assert_called_once_with(profile_property, profile_name)
+        mock_get_by.assert_called_once_with(profile_property, profile_name, view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get_by_name')
     def test_get_by_name(self, mock_get_by_name):
@@ -78,6 +87,16 @@ class ServerProfilesTest(TestCase):
         self._resource.create(resource=template, timeout=TIMEOUT)
         mock_create.assert_called_once_with(resource=expected_template, timeout=TIMEOUT)
 
+    @mock.patch.object(ResourceClient, 'create_many')
+    def test_create_many(self, mock_create_many):
+        templates = [dict(name="Server Profile 1"), dict(name="Server Profile 2", type="ServerProfileV6")]
+
+        self._resource.create_many(templates, timeout=TIMEOUT, max_workers=2)
+
+        expected = [dict(name="Server Profile 1", type="ServerProfileV5"),
+                    dict(name="Server Profile 2", type="ServerProfileV6")]
+        mock_create_many.assert_called_once_with(expected, timeout=TIMEOUT, max_workers=2)
+
     @mock.patch.object(ResourceClient, 'update')
     def test_update(self, mock_update):
         uri = "/rest/server-profiles/4ff2327f-7638-4b66-ad9d-283d4940a4ae"
@@ -222,3 +241,21 @@ class ServerProfilesTest(TestCase):
         self._resource.get_available_targets(enclosureGroupUri=enclosure_group_uri,
                                              serverHardwareTypeUri=server_hardware_type_uri)
         mock_get.assert_called_once_with(uri)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._resource.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._resource.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
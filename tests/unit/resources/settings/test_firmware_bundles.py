@@ -55,7 +55,8 @@ class FirmwareBundlesTest(unittest.TestCase):
 
         self._firmware_bundles.upload(firmware_path)
         mock_upload.assert_called_once_with('/rest/firmware-bundles', None, firmware_path,
-                                            'SPPgen9snap6.2015_0405.81.iso')
+                                            'SPPgen9snap6.2015_0405.81.iso', progress_callback=None,
+                                            adaptive_chunk_size=True, max_retries=0)
 
         mock_wait_task.assert_called_once_with(body, -1)
 
@@ -77,3 +78,16 @@ class FirmwareBundlesTest(unittest.TestCase):
             mock_wait_task.assert_not_called()
         else:
             self.fail("Expected exception was not raised")
+
+    @mock.patch.object(TaskMonitor, 'wait_for_task')
+    @mock.patch.object(connection, 'post_multipart')
+    def test_upload_with_progress_callback(self, mock_upload, mock_wait_task):
+        firmware_path = "test/SPPgen9snap6.2015_0405.81.iso"
+        progress_callback = mock.Mock()
+        mock_upload.return_value = mock.MagicMock(status=202), {}
+
+        self._firmware_bundles.upload(firmware_path, progress_callback=progress_callback, max_retries=2)
+
+        mock_upload.assert_called_once_with('/rest/firmware-bundles', None, firmware_path,
+                                            'SPPgen9snap6.2015_0405.81.iso', progress_callback=progress_callback,
+                                            adaptive_chunk_size=True, max_retries=2)
@@ -56,7 +56,15 @@ class FirmwareDriversTest(TestCase):
         sort = 'name:ascending'
 
         self.resource.get_all(2, 500, filter_by, sort)
-        mock_get_all.assert_called_once_with(2, 500, filter=filter_by, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter_by, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all(self, mock_iter_all):
+        filter_by = 'name=TestName'
+        sort = 'name:ascending'
+
+        self.resource.iter_all(2, 500, filter_by, sort)
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter_by, sort=sort, view='', fields='', read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_by(self, mock_get_all):
@@ -99,3 +107,21 @@ class FirmwareDriversTest(TestCase):
 
         self.resource.delete(fake_firmware)
         mock_delete.assert_called_once_with(fake_firmware, force=False, timeout=-1)
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self.resource.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self.resource.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
@@ -44,13 +44,22 @@ class VolumesTest(unittest.TestCase):
 
         self._volumes.get_all(2, 500, filter, sort)
 
-        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort)
+        mock_get_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='')
+
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all_called_once(self, mock_iter_all):
+        filter = 'name=TestName'
+        sort = 'name:ascending'
+
+        self._volumes.iter_all(2, 500, filter, sort)
+
+        mock_iter_all.assert_called_once_with(2, 500, filter=filter, sort=sort, view='', fields='', read_ahead=False)
 
     @mock.patch.object(ResourceClient, 'get_by')
     def test_get_by_called_once(self, mock_get_by):
         self._volumes.get_by('name', 'Test Volume')
 
-        mock_get_by.assert_called_once_with('name', 'Test Volume')
+        mock_get_by.assert_called_once_with('name', 'Test Volume', view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get')
     def test_get_by_id_called_once(self, mock_get):
@@ -75,6 +84,13 @@ class VolumesTest(unittest.TestCase):
         self._volumes.create(resource)
         mock_create.assert_called_once_with(resource_rest_call, timeout=-1)
 
+    @mock.patch.object(ResourceClient, 'create_many')
+    def test_create_many_called_once(self, mock_create_many):
+        resources = [{'name': 'ONEVIEW_SDK_TEST_VOLUME_1'}, {'name': 'ONEVIEW_SDK_TEST_VOLUME_2'}]
+
+        self._volumes.create_many(resources)
+        mock_create_many.assert_called_once_with(resources, timeout=-1, max_workers=8)
+
     @mock.patch.object(ResourceClient, 'update')
     def test_update_called_once(self, mock_update):
         resource = {
@@ -279,3 +295,21 @@ class VolumesTest(unittest.TestCase):
 
         expected_uri = '/rest/storage-volumes/attachable-volumes'
         mock_get_all.assert_called_once_with(0, -1, uri=expected_uri, filter='', query='', sort='')
+
+    @mock.patch.object(ResourceClient, 'count')
+    def test_count_called_once(self, mock_count):
+        mock_count.return_value = 3
+
+        result = self._volumes.count(filter="name='test'")
+
+        self.assertEqual(3, result)
+        mock_count.assert_called_once_with(filter="name='test'")
+
+    @mock.patch.object(ResourceClient, 'exists')
+    def test_exists_called_once(self, mock_exists):
+        mock_exists.return_value = True
+
+        result = self._volumes.exists(filter="name='test'")
+
+        self.assertTrue(result)
+        mock_exists.assert_called_once_with(filter="name='test'")
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import unittest
+
+import mock
+
+from hpOneView.connection import connection
+from hpOneView.resources.inventory_mirror import InventoryMirror
+from hpOneView.resources.resource import ResourceClient
+
+
+class InventoryMirrorTest(unittest.TestCase):
+    URI = '/rest/server-hardware'
+
+    def setUp(self):
+        self.connection = connection('127.0.0.1')
+        self.mirror = InventoryMirror(self.connection, self.URI)
+        self.members = [
+            {'uri': self.URI + '/1', 'name': 'Encl1, bay 1', 'serialNumber': 'SN1',
+             'modified': '2016-08-01T10:00:00.000Z'},
+            {'uri': self.URI + '/2', 'name': 'Encl1, bay 2', 'serialNumber': 'SN2',
+             'modified': '2016-08-02T10:00:00.000Z'},
+        ]
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_load_should_get_whole_collection(self, mock_get_all):
+        mock_get_all.return_value = self.members
+
+        self.assertEqual(2, self.mirror.load())
+
+        mock_get_all.assert_called_once_with(filter='')
+        self.assertEqual(2, len(self.mirror))
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_get_by_indexed_field_should_not_request(self, mock_get_all):
+        mock_get_all.return_value = self.members
+        self.mirror.load()
+
+        result = self.mirror.get_by('serialNumber', 'sn2')
+
+        self.assertEqual([self.members[1]], result)
+        mock_get_all.assert_called_once_with(filter='')
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_get_by_not_indexed_field_should_search_members(self, mock_get_all):
+        mock_get_all.return_value = self.members
+        self.mirror.load()
+
+        self.assertEqual([self.members[0]], self.mirror.get_by('modified', '2016-08-01T10:00:00.000Z'))
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_get_by_should_not_match_missing_or_composite_values(self, mock_get_all):
+        mock_get_all.return_value = self.members
+        self.mirror.load()
+
+        self.assertEqual([], self.mirror.get_by('missingField', None))
+        self.assertEqual([], self.mirror.get_by('serialNumber', None))
+        self.assertEqual([], self.mirror.get_by('missingField', ['sn1']))
+        self.assertEqual([], self.mirror.get_by('missingField', {}))
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_get_by_name_and_uri(self, mock_get_all):
+        mock_get_all.return_value = self.members
+        self.mirror.load()
+
+        self.assertEqual(self.members[0], self.mirror.get_by_name('Encl1, bay 1'))
+        self.assertEqual(self.members[1], self.mirror.get(self.URI + '/2'))
+        self.assertIsNone(self.mirror.get_by_name('missing'))
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_refresh_should_load_when_not_loaded(self, mock_get_all):
+        mock_get_all.return_value = self.members
+
+        self.mirror.refresh()
+
+        mock_get_all.assert_called_once_with(filter='')
+
+    @mock.patch.object(ResourceClient, 'sync')
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_refresh_should_reload_modified_members(self, mock_get_all, mock_sync):
+        changed = {'uri': self.URI + '/1', 'name': 'Encl1, bay 1', 'serialNumber': 'SN3',
+                   'modified': '2016-08-03T10:00:00.000Z'}
+        mock_get_all.return_value = self.members
+        mock_sync.return_value = ([], [changed], [])
+        self.mirror.load()
+
+        self.assertEqual((0, 1, 0), self.mirror.refresh())
+
+        mock_sync.assert_called_once_with(since='2016-08-02T10:00:00.000Z',
+                                          known={self.URI + '/1': None, self.URI + '/2': None}, filter='')
+        self.assertEqual([], self.mirror.get_by('serialNumber', 'SN1'))
+        self.assertEqual([changed], self.mirror.get_by('serialNumber', 'SN3'))
+        self.assertEqual(2, len(self.mirror))
+
+    @mock.patch.object(ResourceClient, 'sync')
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_refresh_should_drop_removed_members(self, mock_get_all, mock_sync):
+        added = {'uri': self.URI + '/3', 'name': 'Encl1, bay 3', 'serialNumber': 'SN3',
+                 'modified': '2016-08-04T10:00:00.000Z'}
+        mock_get_all.return_value = self.members
+        mock_sync.return_value = ([added], [], [self.URI + '/2'])
+        self.mirror.load()
+
+        self.assertEqual((1, 0, 1), self.mirror.refresh())
+
+        self.assertIsNone(self.mirror.get(self.URI + '/2'))
+        self.assertEqual([], self.mirror.get_by('serialNumber', 'SN2'))
+        self.assertEqual(added, self.mirror.get_by_name('Encl1, bay 3'))
+        self.assertEqual(2, len(self.mirror))
+
+    @mock.patch.object(ResourceClient, 'sync')
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_refresh_should_keep_mirror_filter(self, mock_get_all, mock_sync):
+        self.mirror = InventoryMirror(self.connection, self.URI, filter="state='Monitored'")
+        mock_get_all.return_value = self.members
+        mock_sync.return_value = ([], [], [])
+        self.mirror.load()
+
+        self.mirror.refresh()
+
+        mock_sync.assert_called_once_with(since='2016-08-02T10:00:00.000Z', known=mock.ANY,
+                                          filter="state='Monitored'")
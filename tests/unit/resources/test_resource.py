@@ -21,13 +21,15 @@
 # THE SOFTWARE.
 ###
 
+import socket
+import threading
 import unittest
 
 import mock
 from mock import call
 
 from hpOneView.connection import connection
-from hpOneView.exceptions import HPOneViewUnknownType, HPOneViewException
+from hpOneView.exceptions import HPOneViewUnknownType, HPOneViewException, HPOneViewTimeout
 from hpOneView.resources.resource import ResourceClient, RESOURCE_CLIENT_INVALID_ID, UNRECOGNIZED_URI, TaskMonitor, \
     RESOURCE_CLIENT_TASK_EXPECTED
 
@@ -218,6 +220,111 @@ class ResourceTest(unittest.TestCase):
 
         self.assertEqual(result, [])
 
+    @mock.patch.object(connection, 'get')
+    def test_get_all_in_parallel_should_request_remaining_pages_from_total(self, mock_get):
+        pages = {
+            '/rest/testuri?start=0&count=-1': {'nextPageUri': '/rest/testuri?start=2&count=2', 'total': 7,
+                                               'members': [{'id': '1'}, {'id': '2'}]},
+            '/rest/testuri?start=2&count=2': {'members': [{'id': '3'}, {'id': '4'}]},
+            '/rest/testuri?start=4&count=2': {'members': [{'id': '5'}, {'id': '6'}]},
+            '/rest/testuri?start=6&count=1': {'members': [{'id': '7'}]},
+        }
+        mock_get.side_effect = lambda uri: pages[uri]
+
+        result = self.resource_client.get_all(max_workers=4)
+
+        expected_items = [{'id': '1'}, {'id': '2'}, {'id': '3'}, {'id': '4'}, {'id': '5'}, {'id': '6'}, {'id': '7'}]
+        self.assertSequenceEqual(result, expected_items)
+        self.assertEqual(sorted(pages.keys()), sorted(c[0][0] for c in mock_get.call_args_list))
+
+    @mock.patch.object(connection, 'get')
+    def test_get_all_in_parallel_should_respect_requested_count(self, mock_get):
+        pages = {
+            '/rest/testuri?start=0&count=5&sort=name%3Aascending': {
+                'nextPageUri': '/rest/testuri?start=2&count=2', 'total': 9, 'members': [{'id': '1'}, {'id': '2'}]},
+            '/rest/testuri?start=2&count=2&sort=name%3Aascending': {'members': [{'id': '3'}, {'id': '4'}]},
+            '/rest/testuri?start=4&count=1&sort=name%3Aascending': {'members': [{'id': '5'}]},
+        }
+        mock_get.side_effect = lambda uri: pages[uri]
+
+        result = self.resource_client.get_all(count=5, sort='name:ascending', max_workers=2)
+
+        self.assertEqual(['1', '2', '3', '4', '5'], [item['id'] for item in result])
+
+    @mock.patch.object(connection, 'get')
+    def test_get_all_in_parallel_should_page_serially_when_total_is_missing(self, mock_get):
+        uri_list = ['/rest/testuri?start=0&count=-1',
+                    '/rest/testuri?start=3&count=3']
+        mock_get.side_effect = [{'nextPageUri': uri_list[1], 'members': [{'id': '1'}, {'id': '2'}, {'id': '3'}]},
+                                {'nextPageUri': None, 'members': [{'id': '4'}]}]
+
+        result = self.resource_client.get_all(max_workers=4)
+
+        self.assertEqual(['1', '2', '3', '4'], [item['id'] for item in result])
+        self.assertEqual([call(uri_list[0]), call(uri_list[1])], mock_get.call_args_list)
+
+    @mock.patch.object(connection, 'get')
+    def test_get_all_in_parallel_should_page_serially_after_truncated_page(self, mock_get):
+        pages = {
+            '/rest/testuri?start=0&count=-1': {'nextPageUri': '/rest/testuri?start=2&count=2', 'total': 6,
+                                               'members': [{'id': '1'}, {'id': '2'}]},
+            '/rest/testuri?start=2&count=2': {'nextPageUri': '/rest/testuri?start=3&count=2',
+                                              'members': [{'id': '3'}]},
+            '/rest/testuri?start=4&count=2': {'members': [{'id': '5'}, {'id': '6'}]},
+            '/rest/testuri?start=3&count=2': {'nextPageUri': '/rest/testuri?start=5&count=2',
+                                              'members': [{'id': '4'}, {'id': '5'}]},
+            '/rest/testuri?start=5&count=2': {'nextPageUri': None, 'members': [{'id': '6'}]},
+        }
+        mock_get.side_effect = lambda uri: pages[uri]
+
+        result = self.resource_client.get_all(max_workers=2)
+
+        self.assertEqual(['1', '2', '3', '4', '5', '6'], [item['id'] for item in result])
+
+    @mock.patch.object(connection, 'get')
+    def test_iter_all_should_yield_members_of_all_pages(self, mock_get):
+        uri_list = ['/rest/testuri?start=0&count=-1&filter=name%3DTestName',
+                    '/rest/testuri?start=3&count=3']
+        mock_get.side_effect = [{'nextPageUri': uri_list[1], 'members': [{'id': '1'}, {'id': '2'}, {'id': '3'}]},
+                                {'nextPageUri': None, 'members': [{'id': '4'}]}]
+
+        result = list(self.resource_client.iter_all(filter='name=TestName'))
+
+        self.assertEqual(['1', '2', '3', '4'], [item['id'] for item in result])
+        self.assertEqual([call(uri_list[0]), call(uri_list[1])], mock_get.call_args_list)
+
+    @mock.patch.object(connection, 'get')
+    def test_iter_all_should_request_next_page_only_when_consumed(self, mock_get):
+        mock_get.side_effect = [{'nextPageUri': '/rest/testuri?start=1&count=1', 'members': [{'id': '1'}]},
+                                {'nextPageUri': None, 'members': [{'id': '2'}]}]
+
+        items = self.resource_client.iter_all()
+        first = next(items)
+
+        self.assertEqual({'id': '1'}, first)
+        mock_get.assert_called_once_with('/rest/testuri?start=0&count=-1')
+
+    @mock.patch.object(connection, 'get')
+    def test_iter_all_with_read_ahead_should_yield_members_in_order(self, mock_get):
+        mock_get.side_effect = [{'nextPageUri': '/rest/testuri?start=1&count=1', 'members': [{'id': '1'}]},
+                                {'nextPageUri': '/rest/testuri?start=2&count=1', 'members': [{'id': '2'}]},
+                                {'nextPageUri': None, 'members': [{'id': '3'}]}]
+
+        result = list(self.resource_client.iter_all(read_ahead=True))
+
+        self.assertEqual(['1', '2', '3'], [item['id'] for item in result])
+        self.assertEqual(3, mock_get.call_count)
+
+    @mock.patch.object(connection, 'get')
+    def test_iter_all_should_stop_requests_when_requested_count_reached(self, mock_get):
+        mock_get.side_effect = [{'nextPageUri': '/rest/testuri?start=3&count=3',
+                                 'members': [{'id': '1'}, {'id': '2'}, {'id': '3'}]}]
+
+        result = list(self.resource_client.iter_all(count=3))
+
+        self.assertEqual(3, len(result))
+        mock_get.assert_called_once_with('/rest/testuri?start=0&count=3')
+
     @mock.patch.object(connection, 'delete')
     @mock.patch.object(TaskMonitor, 'wait_for_task')
     def test_delete_all_called_once(self, mock_wait4task, mock_delete):
@@ -292,6 +399,163 @@ class ResourceTest(unittest.TestCase):
         self.resource_client.get('12345')
         mock_get.assert_called_once_with(self.URI + "/12345")
 
+    def test_enable_cache_should_register_resource_uri(self):
+        self.resource_client.enable_cache(ttl=3600)
+
+        self.assertEqual(3600, self.connection.get_cache().get_ttl(self.URI + "/12345"))
+
+    def test_enable_cache_should_keep_existing_cache(self):
+        cache = self.connection.enable_cache({'/rest/other': 60})
+
+        self.resource_client.enable_cache()
+
+        self.assertIs(cache, self.connection.get_cache())
+        self.assertEqual(60, cache.get_ttl('/rest/other/1'))
+
+    @mock.patch.object(connection, 'put')
+    @mock.patch.object(TaskMonitor, 'wait_for_task')
+    def test_update_should_refresh_cache_with_updated_resource(self, mock_wait4task, mock_put):
+        cache = self.connection.enable_cache({self.URI: 60})
+        cache.store(self.URI + "/1", {"uri": self.URI + "/1", "name": "read while the task ran"})
+        cache.store(self.URI + "?start=0&count=-1", {"members": []})
+        mock_put.return_value = self.task, self.task
+        mock_wait4task.return_value = {"uri": self.URI + "/1", "name": "new"}
+
+        self.resource_client.update({"uri": self.URI + "/1", "name": "new"})
+
+        self.assertEqual({"uri": self.URI + "/1", "name": "new"}, cache.lookup(self.URI + "/1").body)
+        self.assertIsNone(cache.lookup(self.URI + "?start=0&count=-1"))
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(TaskMonitor, 'wait_for_task')
+    def test_create_should_keep_cached_members(self, mock_wait4task, mock_post):
+        cache = self.connection.enable_cache({self.URI: 60})
+        cache.store(self.URI + "/1", {"uri": self.URI + "/1", "name": "existing"})
+        cache.store(self.URI + "?start=0&count=-1", {"members": []})
+        mock_post.return_value = self.task, self.task
+        mock_wait4task.return_value = {"uri": self.URI + "/2", "name": "new"}
+
+        self.resource_client.create({"name": "new"})
+
+        self.assertIsNotNone(cache.lookup(self.URI + "/1"))
+        self.assertEqual({"uri": self.URI + "/2", "name": "new"}, cache.lookup(self.URI + "/2").body)
+        self.assertIsNone(cache.lookup(self.URI + "?start=0&count=-1"))
+
+    @mock.patch.object(connection, 'delete')
+    @mock.patch.object(TaskMonitor, 'wait_for_task')
+    def test_delete_should_invalidate_cached_resource(self, mock_wait4task, mock_delete):
+        cache = self.connection.enable_cache({self.URI: 60})
+        mock_delete.return_value = self.task, self.response_body
+        mock_wait4task.side_effect = lambda task, timeout: cache.store(self.URI + "/1", {"name": "stale"})
+
+        self.resource_client.delete('1')
+
+        self.assertIsNone(cache.lookup(self.URI + "/1"))
+
+    @mock.patch.object(connection, 'patch')
+    def test_patch_should_refresh_cache_with_returned_entity(self, mock_patch):
+        cache = self.connection.enable_cache({self.URI: 60})
+        mock_patch.return_value = None, {"uri": self.URI + "/1", "name": "new"}
+
+        self.resource_client.patch('1', 'replace', '/name', 'new')
+
+        self.assertEqual({"uri": self.URI + "/1", "name": "new"}, cache.lookup(self.URI + "/1").body)
+
+    @mock.patch.object(connection, 'download')
+    def test_download_should_stream_to_file(self, mock_download):
+        mock_download.return_value = True
+
+        result = self.resource_client.download(self.URI + "/1/download", "/tmp/download.bin")
+
+        self.assertTrue(result)
+        mock_download.assert_called_once_with(self.URI + "/1/download", "/tmp/download.bin", chunk_size=1048576,
+                                              resume=False)
+
+    @mock.patch.object(connection, 'get')
+    def test_count_should_request_one_item_and_return_total(self, mock_get):
+        mock_get.return_value = {'total': 42, 'count': 1, 'members': [{'name': 'a'}]}
+
+        result = self.resource_client.count(filter="state='Active'")
+
+        self.assertEqual(42, result)
+        mock_get.assert_called_once_with(self.URI + "?start=0&count=1&filter=state%3D%27Active%27")
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    @mock.patch.object(connection, 'get')
+    def test_count_should_count_collection_when_total_is_not_reported(self, mock_get, mock_get_all):
+        mock_get.return_value = {'members': [{'name': 'a'}]}
+        mock_get_all.return_value = [{'name': 'a'}, {'name': 'b'}]
+
+        result = self.resource_client.count(query="name eq 'a'")
+
+        self.assertEqual(2, result)
+        mock_get_all.assert_called_once_with(filter='', query="name eq 'a'", uri=None)
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_sync_without_since_should_return_all_members_as_added(self, mock_get_all):
+        mock_get_all.return_value = [{'uri': '/rest/testuri/1'}]
+
+        result = self.resource_client.sync()
+
+        self.assertEqual(([{'uri': '/rest/testuri/1'}], [], []), result)
+        mock_get_all.assert_called_once_with(filter='', uri=None)
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_sync_should_request_members_modified_since(self, mock_get_all):
+        mock_get_all.side_effect = [[], []]
+
+        self.resource_client.sync(since='2016-08-01T10:00:00.000Z', known=[], filter="state='Active'")
+
+        mock_get_all.assert_has_calls([
+            mock.call(filter=["modified >= '2016-08-01T10:00:00.000Z'", "state='Active'"], uri=None),
+            mock.call(filter="state='Active'", fields='uri', uri=None)])
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_sync_should_return_added_changed_and_removed(self, mock_get_all):
+        known = {'/rest/testuri/1': '1', '/rest/testuri/2': '1', '/rest/testuri/3': '1'}
+        modified = [{'uri': '/rest/testuri/1', 'eTag': '1'},
+                    {'uri': '/rest/testuri/2', 'eTag': '2'},
+                    {'uri': '/rest/testuri/4', 'eTag': '1'}]
+        listing = [{'uri': '/rest/testuri/1'}, {'uri': '/rest/testuri/2'}, {'uri': '/rest/testuri/4'}]
+        mock_get_all.side_effect = [modified, listing]
+
+        added, changed, removed = self.resource_client.sync(since='2016-08-01T10:00:00.000Z', known=known)
+
+        self.assertEqual([{'uri': '/rest/testuri/4', 'eTag': '1'}], added)
+        self.assertEqual([{'uri': '/rest/testuri/2', 'eTag': '2'}], changed)
+        self.assertEqual(['/rest/testuri/3'], removed)
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_sync_without_since_should_find_removed_members_in_a_single_request(self, mock_get_all):
+        mock_get_all.return_value = [{'uri': '/rest/testuri/1', 'eTag': '1'}]
+
+        added, changed, removed = self.resource_client.sync(known={'/rest/testuri/1': '1', '/rest/testuri/2': '1'})
+
+        self.assertEqual(([], [], ['/rest/testuri/2']), (added, changed, removed))
+        mock_get_all.assert_called_once_with(filter='', uri=None)
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_sync_should_report_known_uris_without_etag_as_changed(self, mock_get_all):
+        mock_get_all.side_effect = [[{'uri': '/rest/testuri/1', 'eTag': '1'}], [{'uri': '/rest/testuri/1'}]]
+
+        added, changed, removed = self.resource_client.sync(since='2016-08-01T10:00:00.000Z',
+                                                            known=['/rest/testuri/1'])
+
+        self.assertEqual(([], [{'uri': '/rest/testuri/1', 'eTag': '1'}], []), (added, changed, removed))
+
+    @mock.patch.object(connection, 'get')
+    def test_exists_should_return_true_when_any_member_matches(self, mock_get):
+        mock_get.return_value = {'total': 1, 'members': [{'name': 'a'}]}
+
+        self.assertTrue(self.resource_client.exists(filter="name='a'"))
+        mock_get.assert_called_once_with(self.URI + "?start=0&count=1&filter=name%3D%27a%27")
+
+    @mock.patch.object(connection, 'get')
+    def test_exists_should_return_false_when_nothing_matches(self, mock_get):
+        mock_get.return_value = {'total': 0, 'members': []}
+
+        self.assertFalse(self.resource_client.exists(filter="name='a'"))
+
     @mock.patch.object(ResourceClient, 'get_by')
     def test_get_by_name_with_result(self, mock_get_by):
         mock_get_by.return_value = [{"name": "value"}]
@@ -341,12 +605,20 @@ class ResourceTest(unittest.TestCase):
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_by_property(self, mock_get_all):
         self.resource_client.get_by('name', 'MyFibreNetwork')
-        mock_get_all.assert_called_once_with(filter="\"'name'='MyFibreNetwork'\"", uri='/rest/testuri')
+        mock_get_all.assert_called_once_with(filter="\"'name'='MyFibreNetwork'\"", uri='/rest/testuri', view='',
+                                             fields='')
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_get_by_property_with_fields(self, mock_get_all):
+        self.resource_client.get_by('name', 'MyFibreNetwork', view='minimal', fields='uri,name')
+        mock_get_all.assert_called_once_with(filter="\"'name'='MyFibreNetwork'\"", uri='/rest/testuri',
+                                             view='minimal', fields='uri,name')
 
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_by_property_with_uri(self, mock_get_all):
         self.resource_client.get_by('name', 'MyFibreNetwork', uri='/rest/testuri/5435534/sub')
-        mock_get_all.assert_called_once_with(filter="\"'name'='MyFibreNetwork'\"", uri='/rest/testuri/5435534/sub')
+        mock_get_all.assert_called_once_with(filter="\"'name'='MyFibreNetwork'\"", uri='/rest/testuri/5435534/sub',
+                                             view='', fields='')
 
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_by_property_with__invalid_uri(self, mock_get_all):
@@ -556,6 +828,98 @@ class ResourceTest(unittest.TestCase):
 
         mock_wait4task.assert_called_once_with({"task": "task"}, 60)
 
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(TaskMonitor, 'wait_for_tasks')
+    def test_create_many_should_return_results_in_input_order(self, mock_wait4tasks, mock_post):
+        tasks = {'r1': {'uri': '/rest/tasks/1'}, 'r2': {'uri': '/rest/tasks/2'}}
+        mock_post.side_effect = lambda uri, resource, custom_headers: (tasks.get(resource['name']), resource)
+        mock_wait4tasks.return_value = iter([(tasks['r2'], {'name': 'created r2'}, None),
+                                             (tasks['r1'], {'name': 'created r1'}, None)])
+
+        result = self.resource_client.create_many([{'name': 'r1'}, {'name': 'r2'}, {'name': 'r3'}])
+
+        self.assertEqual([({'name': 'created r1'}, None), ({'name': 'created r2'}, None), ({'name': 'r3'}, None)],
+                         result)
+        mock_wait4tasks.assert_called_once_with([tasks['r1'], tasks['r2']], -1)
+        mock_post.assert_has_calls([call('/rest/testuri', {'name': 'r1'}, custom_headers=None)], any_order=True)
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(TaskMonitor, 'wait_for_tasks')
+    def test_create_many_should_return_errors_per_item(self, mock_wait4tasks, mock_post):
+        request_error = HPOneViewException({'message': 'Invalid name'})
+        task_error = HPOneViewException('Task failed')
+        task = {'uri': '/rest/tasks/1'}
+        mock_post.side_effect = [(task, {}), request_error]
+        mock_wait4tasks.return_value = iter([(task, None, task_error)])
+
+        result = self.resource_client.create_many([{'name': 'r1'}, {'name': 'r2'}, None], max_workers=1)
+
+        self.assertEqual([(None, task_error), (None, request_error)], result[:2])
+        self.assertIsInstance(result[2][1], ValueError)
+
+    @mock.patch.object(connection, 'put')
+    @mock.patch.object(TaskMonitor, 'wait_for_tasks')
+    def test_update_many_should_put_each_resource_to_its_uri(self, mock_wait4tasks, mock_put):
+        mock_put.return_value = None, {'name': 'updated'}
+        mock_wait4tasks.return_value = iter([])
+
+        result = self.resource_client.update_many([{'uri': '/rest/testuri/1'}, {'uri': '/rest/testuri/2'}],
+                                                  force=True, max_workers=1)
+
+        self.assertEqual([({'name': 'updated'}, None), ({'name': 'updated'}, None)], result)
+        mock_put.assert_has_calls([call('/rest/testuri/1?force=True', {'uri': '/rest/testuri/1'}, custom_headers=None),
+                                   call('/rest/testuri/2?force=True', {'uri': '/rest/testuri/2'}, custom_headers=None)])
+
+    @mock.patch.object(connection, 'delete')
+    @mock.patch.object(TaskMonitor, 'wait_for_tasks')
+    def test_delete_many_should_return_timeout_error_for_pending_tasks(self, mock_wait4tasks, mock_delete):
+        task = {'uri': '/rest/tasks/1'}
+        mock_delete.side_effect = [(task, {}), (None, {})]
+
+        def wait_for_tasks(tasks, timeout):
+            raise HPOneViewTimeout('timeout')
+            yield
+
+        mock_wait4tasks.side_effect = wait_for_tasks
+
+        result = self.resource_client.delete_many(['1', {'uri': '/rest/testuri/2'}], timeout=10, max_workers=1)
+
+        self.assertIsInstance(result[0][1], HPOneViewTimeout)
+        self.assertEqual((True, None), result[1])
+        mock_delete.assert_has_calls([call('/rest/testuri/1', custom_headers=None),
+                                      call('/rest/testuri/2', custom_headers=None)])
+
+    @mock.patch.object(connection, 'put')
+    @mock.patch.object(TaskMonitor, 'wait_for_tasks')
+    def test_update_many_should_return_error_for_resource_without_uri(self, mock_wait4tasks, mock_put):
+        mock_put.return_value = None, {'name': 'updated'}
+        mock_wait4tasks.return_value = iter([])
+
+        result = self.resource_client.update_many([{'name': 'no uri'}, {'uri': '/rest/testuri/2'}], max_workers=1)
+
+        self.assertIsInstance(result[0][1], KeyError)
+        self.assertEqual(({'name': 'updated'}, None), result[1])
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(TaskMonitor, 'wait_for_tasks')
+    def test_create_many_should_return_polling_error_for_pending_tasks(self, mock_wait4tasks, mock_post):
+        tasks = {'r1': {'uri': '/rest/tasks/1'}, 'r2': {'uri': '/rest/tasks/2'}}
+        mock_post.side_effect = lambda uri, resource, custom_headers: (tasks[resource['name']], {})
+        polling_error = socket.error('Connection reset by peer')
+
+        def wait_for_tasks(tasks, timeout):
+            yield tasks[0], {'name': 'created r1'}, None
+            raise polling_error
+
+        mock_wait4tasks.side_effect = wait_for_tasks
+
+        result = self.resource_client.create_many([{'name': 'r1'}, {'name': 'r2'}], max_workers=1)
+
+        self.assertEqual([({'name': 'created r1'}, None), (None, polling_error)], result)
+
+    def test_create_many_with_empty_list(self):
+        self.assertEqual([], self.resource_client.create_many([]))
+
     @mock.patch.object(connection, 'patch')
     def test_patch_request_when_id_is_provided(self, mock_patch):
         request_body = [{
@@ -903,3 +1267,31 @@ class ResourceTest(unittest.TestCase):
             self.assertEqual(RESOURCE_CLIENT_TASK_EXPECTED, exception.args[0])
         else:
             self.fail("Expected Exception was not raised")
+
+    @mock.patch.object(connection, 'get')
+    def test_get_all_should_be_thread_safe(self, mock_get):
+        def get(uri):
+            path, _, query = uri.partition('?')
+            if 'start=0' in query:
+                return {'members': [{'uri': path + '/1'}], 'nextPageUri': path + '?start=1&count=1'}
+            return {'members': [{'uri': path + '/2'}], 'nextPageUri': None}
+
+        mock_get.side_effect = get
+        errors = []
+
+        def read_collection(uri):
+            for i in range(50):
+                try:
+                    items = self.resource_client.get_all(uri=uri)
+                except Exception as e:
+                    items = e
+                if items != [{'uri': uri + '/1'}, {'uri': uri + '/2'}]:
+                    errors.append(uri)
+
+        threads = [threading.Thread(target=read_collection, args=(self.URI + '/%d/items' % i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
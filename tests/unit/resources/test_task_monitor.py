@@ -21,13 +21,15 @@
 # THE SOFTWARE.
 ###
 
+import threading
 import unittest
 from mock import mock, call
 
 from hpOneView.connection import connection
 from hpOneView.resources.task_monitor import TaskMonitor, MSG_UNKNOWN_OBJECT_TYPE, MSG_TASK_TYPE_UNRECONIZED, \
     MSG_TIMEOUT, MSG_UNKNOWN_EXCEPTION, MSG_INVALID_TASK
-from hpOneView.exceptions import HPOneViewUnknownType, HPOneViewInvalidResource, HPOneViewTimeout, HPOneViewTaskError
+from hpOneView.exceptions import HPOneViewUnknownType, HPOneViewInvalidResource, HPOneViewTimeout, HPOneViewTaskError, \
+    HPOneViewException
 
 
 class TaskMonitorTest(unittest.TestCase):
@@ -39,6 +41,19 @@ class TaskMonitorTest(unittest.TestCase):
         self.connection = connection(self.host)
         self.task_monitor = TaskMonitor(self.connection)
 
+    @mock.patch.object(connection, 'do_http')
+    def test_get_associated_resource_should_not_return_stale_cached_copy(self, mock_do_http):
+        cache = self.connection.enable_cache({'/rest/ethernet-networks': 60})
+        cache.store('/rest/ethernet-networks/1', {'name': 'old'})
+        mock_do_http.return_value = (mock.Mock(status=200), {'name': 'new'})
+        task = {'category': 'tasks', 'type': 'TaskResourceV2',
+                'associatedResource': {'resourceUri': '/rest/ethernet-networks/1'}}
+
+        task, entity = self.task_monitor.get_associated_resource(task)
+
+        self.assertEqual({'name': 'new'}, entity)
+        self.assertEqual({'name': 'new'}, cache.lookup('/rest/ethernet-networks/1').body)
+
     @mock.patch.object(connection, 'get')
     def test_get_associated_resource_with_task(self, mock_get):
 
@@ -141,10 +156,10 @@ class TaskMonitorTest(unittest.TestCase):
 
         self.assertFalse(self.task_monitor.is_task_running({"uri": "uri"}))
 
-    @mock.patch.object(TaskMonitor, 'is_task_running')
-    def test_wait_for_task_timeout(self, mock_is_running):
+    @mock.patch.object(TaskMonitor, 'get')
+    def test_wait_for_task_timeout(self, mock_get):
 
-        mock_is_running.return_value = True
+        mock_get.return_value = {"uri": "uri", "taskState": "Running"}
         timeout = 2
 
         try:
@@ -154,11 +169,11 @@ class TaskMonitorTest(unittest.TestCase):
         else:
             self.fail()
 
-    @mock.patch.object(TaskMonitor, 'is_task_running')
+    @mock.patch.object(TaskMonitor, 'get')
     @mock.patch('time.sleep')
-    def test_wait_for_task_increasing_sleep(self, mock_sleep, mock_is_running):
+    def test_wait_for_task_increasing_sleep(self, mock_sleep, mock_get):
 
-        mock_is_running.return_value = True
+        mock_get.return_value = {"uri": "uri", "taskState": "Running"}
         timeout = 0.1
 
         # should call sleep increasing 1 until 10
@@ -274,6 +289,38 @@ class TaskMonitorTest(unittest.TestCase):
 
         self.assertEqual(ret_entity, {"resource": "resource1"})
 
+    @mock.patch.object(connection, 'get')
+    @mock.patch('time.sleep')
+    def test_wait_for_task_should_not_get_completed_task_again(self, mock_sleep, mock_get):
+        task = {"uri": "/rest/tasks/1",
+                "type": "TaskResourceV2",
+                "name": "update",
+                "taskState": "Running",
+                "associatedResource": {"resourceUri": "/rest/associatedresourceuri"},
+                "category": "tasks"}
+        mock_get.side_effect = [task, dict(task, taskState="Completed"), {"resource": "resource1"}]
+
+        ret_entity = self.task_monitor.wait_for_task(task.copy())
+
+        self.assertEqual({"resource": "resource1"}, ret_entity)
+        self.assertEqual([call("/rest/tasks/1"), call("/rest/tasks/1"), call("/rest/associatedresourceuri")],
+                         mock_get.call_args_list)
+
+    @mock.patch.object(connection, 'get')
+    def test_wait_for_task_should_return_resource_uri_when_not_fetching_resource(self, mock_get):
+        task = {"uri": "/rest/tasks/1",
+                "type": "TaskResourceV2",
+                "name": "update",
+                "taskState": "Completed",
+                "associatedResource": {"resourceUri": "/rest/associatedresourceuri"},
+                "category": "tasks"}
+        mock_get.return_value = task
+
+        ret = self.task_monitor.wait_for_task(task.copy(), fetch_resource=False)
+
+        self.assertEqual("/rest/associatedresourceuri", ret)
+        mock_get.assert_called_once_with("/rest/tasks/1")
+
     @mock.patch.object(TaskMonitor, 'is_task_running')
     @mock.patch.object(TaskMonitor, 'get')
     def test_wait_for_task_unexpected_result(self, mock_get, mock_is_running):
@@ -330,3 +377,142 @@ class TaskMonitorTest(unittest.TestCase):
         response = self.task_monitor.get_completed_task(task.copy())
 
         self.assertEqual(task, response)
+
+    @mock.patch.object(TaskMonitor, 'get_associated_resource')
+    @mock.patch.object(connection, 'get')
+    @mock.patch('time.sleep')
+    def test_wait_for_tasks_should_yield_tasks_as_they_complete(self, mock_sleep, mock_get, mock_assoc_res):
+        task_1 = {"uri": "/rest/tasks/1", "type": "TaskResourceV2", "name": "Create", "taskState": "Running"}
+        task_2 = {"uri": "/rest/tasks/2", "type": "TaskResourceV2", "name": "Create", "taskState": "Running"}
+        mock_get.side_effect = [
+            {"members": [task_1, dict(task_2, taskState="Completed")]},
+            {"members": [dict(task_1, taskState="Completed")]},
+        ]
+        mock_assoc_res.side_effect = lambda task, fetch_resource: (task, {"resource": task["uri"]})
+
+        results = list(self.task_monitor.wait_for_tasks([task_1, task_2]))
+
+        self.assertEqual([{"resource": "/rest/tasks/2"}, {"resource": "/rest/tasks/1"}],
+                         [result for task, result, error in results])
+        self.assertEqual([None, None], [error for task, result, error in results])
+        self.assertEqual(1, mock_sleep.call_count)
+
+    @mock.patch.object(connection, 'get')
+    def test_wait_for_tasks_should_query_tasks_in_bulk(self, mock_get):
+        task_1 = {"uri": "/rest/tasks/1", "name": "Delete", "taskState": "Completed"}
+        task_2 = {"uri": "/rest/tasks/2", "name": "Delete", "taskState": "Completed"}
+        mock_get.return_value = {"members": [task_1, task_2]}
+
+        list(self.task_monitor.wait_for_tasks([task_1, task_2]))
+
+        mock_get.assert_called_once_with(
+            "/rest/tasks?filter=%22%27uri%27%3D%27/rest/tasks/1%27%20OR%20%27uri%27%3D%27/rest/tasks/2%27%22&count=2")
+
+    @mock.patch.object(connection, 'get')
+    def test_wait_for_tasks_should_get_tasks_missing_from_bulk_query(self, mock_get):
+        task_1 = {"uri": "/rest/tasks/1", "name": "Delete", "taskState": "Completed"}
+        task_2 = {"uri": "/rest/tasks/2", "name": "Delete", "taskState": "Completed"}
+        mock_get.side_effect = [{"members": [task_1]}, task_2]
+
+        results = list(self.task_monitor.wait_for_tasks([task_1, task_2]))
+
+        self.assertEqual([True, True], [result for task, result, error in results])
+        self.assertEqual(call("/rest/tasks/2"), mock_get.call_args_list[1])
+
+    @mock.patch.object(connection, 'get')
+    def test_wait_for_tasks_should_yield_error_of_task_that_cannot_be_retrieved(self, mock_get):
+        task_1 = {"uri": "/rest/tasks/1", "name": "Delete", "taskState": "Completed"}
+        task_2 = {"uri": "/rest/tasks/2", "name": "Delete", "taskState": "Running"}
+        not_found = HPOneViewException('Not found')
+        mock_get.side_effect = [{"members": [task_1]}, not_found]
+
+        results = list(self.task_monitor.wait_for_tasks([task_1, task_2]))
+
+        self.assertEqual([(task_2, None, not_found), (task_1, True, None)], results)
+
+    @mock.patch.object(connection, 'get')
+    def test_wait_for_tasks_should_yield_task_errors(self, mock_get):
+        task = {"uri": "/rest/tasks/1", "taskState": "Error", "taskErrors": [{"message": "Error Message"}]}
+        mock_get.return_value = {"members": [task]}
+
+        [(ret_task, result, error)] = list(self.task_monitor.wait_for_tasks([task]))
+
+        self.assertIsNone(result)
+        self.assertIsInstance(error, HPOneViewTaskError)
+        self.assertEqual("Error Message", error.msg)
+
+    @mock.patch.object(connection, 'get')
+    def test_wait_for_tasks_should_yield_unexpected_errors_per_task(self, mock_get):
+        malformed_task = {"uri": "/rest/tasks/1", "taskState": "Completed"}
+        task = {"uri": "/rest/tasks/2", "name": "Delete", "taskState": "Completed"}
+        mock_get.return_value = {"members": [malformed_task, task]}
+
+        results = list(self.task_monitor.wait_for_tasks([malformed_task, task]))
+
+        self.assertIsInstance(results[0][2], KeyError)
+        self.assertEqual((task, True, None), results[1])
+
+    @mock.patch.object(connection, 'get')
+    @mock.patch('time.sleep')
+    def test_wait_for_tasks_should_adapt_polling_interval_to_expected_duration(self, mock_sleep, mock_get):
+        task = {"uri": "/rest/tasks/1", "name": "Delete", "taskState": "Running", "expectedDuration": 60,
+                "computedPercentComplete": 90}
+        mock_get.side_effect = [{"members": [task]}, {"members": [dict(task, taskState="Completed")]}]
+
+        list(self.task_monitor.wait_for_tasks([task]))
+
+        interval = mock_sleep.call_args[0][0]
+        self.assertTrue(0.8 <= interval <= 1.2)
+
+    @mock.patch.object(connection, 'get')
+    @mock.patch('time.sleep')
+    def test_wait_for_tasks_timeout(self, mock_sleep, mock_get):
+        task = {"uri": "/rest/tasks/1", "taskState": "Running"}
+        mock_get.return_value = {"members": [task]}
+        timeout = 0.1
+
+        try:
+            list(self.task_monitor.wait_for_tasks([task], timeout))
+        except HPOneViewTimeout as e:
+            self.assertEqual(MSG_TIMEOUT % timeout, e.msg)
+        else:
+            self.fail()
+
+    def test_wait_for_tasks_with_invalid_task(self):
+        try:
+            list(self.task_monitor.wait_for_tasks([{}]))
+        except HPOneViewUnknownType as e:
+            self.assertEqual(MSG_INVALID_TASK, e.msg)
+        else:
+            self.fail()
+
+    @mock.patch('time.sleep')
+    @mock.patch.object(connection, 'get')
+    def test_wait_for_task_should_be_thread_safe(self, mock_get, mock_sleep):
+        def get(uri):
+            if uri.startswith('/rest/tasks/'):
+                resource_uri = uri.replace('/rest/tasks/', '/rest/resources/')
+                return {'uri': uri, 'name': 'Update', 'category': 'tasks', 'type': 'TaskResourceV2',
+                        'taskState': 'Completed', 'associatedResource': {'resourceUri': resource_uri}}
+            return {'uri': uri}
+
+        mock_get.side_effect = get
+        errors = []
+
+        def wait_for_tasks(i):
+            for j in range(50):
+                task_uri = '/rest/tasks/%d-%d' % (i, j)
+                try:
+                    resource = self.task_monitor.wait_for_task({'uri': task_uri})
+                except Exception as e:
+                    resource = e
+                if resource != {'uri': '/rest/resources/%d-%d' % (i, j)}:
+                    errors.append(task_uri)
+
+        threads = [threading.Thread(target=wait_for_tasks, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
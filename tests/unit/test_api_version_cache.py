@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from hpOneView.api_version_cache import ApiVersionCache
+
+
+class ApiVersionCacheTest(unittest.TestCase):
+    def setUp(self):
+        ApiVersionCache.clear()
+        self.path = tempfile.mkdtemp()
+        self.version = {'minimumVersion': 120, 'currentVersion': 300}
+
+    def tearDown(self):
+        ApiVersionCache.clear()
+        shutil.rmtree(self.path)
+
+    def test_get_should_return_none_when_nothing_is_cached(self):
+        self.assertIsNone(ApiVersionCache().get('127.0.0.1'))
+
+    def test_versions_should_be_shared_in_memory(self):
+        ApiVersionCache().store('127.0.0.1', self.version)
+
+        self.assertEqual(self.version, ApiVersionCache().get('127.0.0.1'))
+        self.assertIsNone(ApiVersionCache().get('127.0.0.2'))
+
+    @mock.patch('time.time')
+    def test_get_should_return_none_when_expired(self, mock_time):
+        mock_time.return_value = 100
+        ApiVersionCache(ttl=60).store('127.0.0.1', self.version)
+        mock_time.return_value = 160
+
+        self.assertIsNone(ApiVersionCache().get('127.0.0.1'))
+
+    def test_versions_should_be_shared_on_disk(self):
+        ApiVersionCache(os.path.join(self.path, 'versions')).store('127.0.0.1', self.version)
+        ApiVersionCache.clear()
+
+        self.assertEqual(self.version, ApiVersionCache(os.path.join(self.path, 'versions')).get('127.0.0.1'))
+
+    @mock.patch('time.time')
+    def test_get_should_ignore_expired_file(self, mock_time):
+        mock_time.return_value = 100
+        ApiVersionCache(self.path, ttl=60).store('127.0.0.1', self.version)
+        ApiVersionCache.clear()
+        mock_time.return_value = 200
+
+        self.assertIsNone(ApiVersionCache(self.path).get('127.0.0.1'))
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import unittest
+
+import mock
+
+from hpOneView.connection import connection
+from hpOneView.exceptions import HPOneViewException, HPOneViewTaskError, HPOneViewTimeout
+from hpOneView.resources.task_monitor import TaskMonitor
+
+try:
+    import asyncio
+    from hpOneView.async_oneview_client import AsyncOneViewClient, AsyncResource, AsyncResourceClient
+except ImportError:
+    asyncio = None
+
+
+@unittest.skipIf(asyncio is None, 'asyncio is not available')
+class AsyncOneViewClientTest(unittest.TestCase):
+
+    @mock.patch.object(connection, 'login')
+    def setUp(self, mock_login):
+        super(AsyncOneViewClientTest, self).setUp()
+        self.loop = asyncio.new_event_loop()
+
+        self.config = config = {"ip": "172.16.102.59",
+                                "credentials": {
+                                    "authLoginDomain": "",
+                                    "userName": "administrator",
+                                    "password": ""}}
+
+        self._oneview = AsyncOneViewClient(config, loop=self.loop)
+        self._client = self._oneview.resource_client('/rest/testuri')
+        self.task = {"uri": "/rest/tasks/1", "taskState": "Running"}
+
+    def tearDown(self):
+        self._oneview.close()
+        self.loop.close()
+
+    def test_should_expose_resource_properties_of_oneview_client(self):
+        self.assertIsInstance(self._oneview.server_hardware, AsyncResource)
+        self.assertIs(self._oneview.server_hardware, self._oneview.server_hardware)
+
+    def test_should_raise_attribute_error_for_unknown_property(self):
+        self.assertRaises(AttributeError, getattr, self._oneview, 'from_json_file_unknown')
+
+    @mock.patch.object(connection, 'login')
+    def test_should_defer_login_to_first_request(self, mock_login):
+        client = AsyncOneViewClient(self.config, loop=self.loop)
+        self.addCleanup(client.close)
+
+        mock_login.assert_called_once_with(self.config['credentials'], deferred=True)
+
+    @mock.patch.object(connection, 'login')
+    def test_login_should_run_on_executor(self, mock_login):
+        self.loop.run_until_complete(self._oneview.login())
+
+        mock_login.assert_called_once_with(self.config['credentials'])
+
+    def test_should_not_wrap_methods_that_yield_pages(self):
+        self.assertRaises(AttributeError, getattr, self._oneview.server_hardware, 'iter_all')
+
+    def test_resource_client(self):
+        self.assertIsInstance(self._client, AsyncResourceClient)
+
+    @mock.patch.object(connection, 'get')
+    def test_resource_methods_should_return_futures(self, mock_get):
+        mock_get.return_value = {"members": [{"name": "server"}]}
+
+        result = self.loop.run_until_complete(self._oneview.server_hardware.get_all())
+
+        self.assertEqual([{"name": "server"}], result)
+
+    @mock.patch.object(connection, 'get')
+    def test_get(self, mock_get):
+        mock_get.return_value = {"name": "resource"}
+
+        result = self.loop.run_until_complete(self._client.get('1'))
+
+        self.assertEqual({"name": "resource"}, result)
+        mock_get.assert_called_once_with('/rest/testuri/1')
+
+    @mock.patch.object(connection, 'post')
+    def test_create_should_return_body_when_there_is_no_task(self, mock_post):
+        mock_post.return_value = None, {"name": "created"}
+
+        result = self.loop.run_until_complete(self._client.create({"name": "created"}))
+
+        self.assertEqual({"name": "created"}, result)
+        mock_post.assert_called_once_with('/rest/testuri', {"name": "created"}, custom_headers=None)
+
+    @mock.patch.object(TaskMonitor, 'get_task_response')
+    @mock.patch.object(TaskMonitor, 'get_tasks')
+    @mock.patch.object(connection, 'post')
+    @mock.patch('time.sleep')
+    def test_create_should_wait_for_task(self, mock_sleep, mock_post, mock_get_tasks, mock_get_task_response):
+        mock_post.return_value = self.task, {}
+        mock_get_tasks.side_effect = [([self.task], {}), ([dict(self.task, taskState="Completed")], {})]
+        mock_get_task_response.return_value = {"name": "created"}
+
+        result = self.loop.run_until_complete(self._client.create({"name": "created"}))
+
+        self.assertEqual({"name": "created"}, result)
+        self.assertEqual(2, mock_get_tasks.call_count)
+
+    @mock.patch.object(TaskMonitor, 'get_task_response')
+    @mock.patch.object(TaskMonitor, 'get_tasks')
+    @mock.patch.object(connection, 'post')
+    @mock.patch('time.sleep')
+    def test_create_should_keep_waiting_when_polling_fails(self, mock_sleep, mock_post, mock_get_tasks,
+                                                           mock_get_task_response):
+        mock_post.return_value = self.task, {}
+        mock_get_tasks.side_effect = [HPOneViewException('Service unavailable'),
+                                      ([dict(self.task, taskState="Completed")], {})]
+        mock_get_task_response.return_value = {"name": "created"}
+
+        result = self.loop.run_until_complete(self._client.create({"name": "created"}))
+
+        self.assertEqual({"name": "created"}, result)
+        mock_sleep.assert_called_once_with(1)
+
+    @mock.patch.object(TaskMonitor, 'get_task_response')
+    @mock.patch.object(TaskMonitor, 'get_tasks')
+    @mock.patch.object(connection, 'delete')
+    def test_delete_should_fail_only_task_that_cannot_be_retrieved(self, mock_delete, mock_get_tasks,
+                                                                   mock_get_task_response):
+        purged_task = {"uri": "/rest/tasks/2", "taskState": "Running"}
+        tasks = {'/rest/testuri/1': self.task, '/rest/testuri/2': purged_task}
+        mock_delete.side_effect = lambda uri, custom_headers: (tasks[uri], {})
+        not_found = HPOneViewException('Not found')
+        mock_get_tasks.return_value = [dict(self.task, taskState="Completed")], {purged_task['uri']: not_found}
+        mock_get_task_response.return_value = True
+
+        completed = self._client.delete('1')
+        purged = self._client.delete('2')
+
+        self.assertTrue(self.loop.run_until_complete(completed))
+        self.assertRaises(HPOneViewException, self.loop.run_until_complete, purged)
+
+    @mock.patch.object(TaskMonitor, 'get_tasks')
+    @mock.patch.object(connection, 'put')
+    def test_update_should_raise_task_error(self, mock_put, mock_get_tasks):
+        mock_put.return_value = self.task, {}
+        mock_get_tasks.return_value = [dict(self.task, taskState="Error", taskErrors=[{"message": "Failed"}])], {}
+
+        future = self._client.update({"uri": "/rest/testuri/1"}, force=True)
+
+        self.assertRaises(HPOneViewTaskError, self.loop.run_until_complete, future)
+        mock_put.assert_called_once_with('/rest/testuri/1?force=True', {"uri": "/rest/testuri/1"},
+                                         custom_headers=None)
+
+    @mock.patch.object(connection, 'delete')
+    def test_delete_should_return_true_when_there_is_no_task(self, mock_delete):
+        mock_delete.return_value = None, {}
+
+        result = self.loop.run_until_complete(self._client.delete('1'))
+
+        self.assertTrue(result)
+        mock_delete.assert_called_once_with('/rest/testuri/1', custom_headers=None)
+
+    @mock.patch.object(TaskMonitor, 'get_tasks')
+    @mock.patch.object(connection, 'delete')
+    def test_delete_should_raise_timeout(self, mock_delete, mock_get_tasks):
+        mock_delete.return_value = self.task, {}
+        mock_get_tasks.return_value = [self.task], {}
+
+        future = self._client.delete({"uri": "/rest/testuri/1"}, timeout=0)
+
+        self.assertRaises(HPOneViewTimeout, self.loop.run_until_complete, future)
+
+    def test_create_without_resource_should_fail(self):
+        self.assertRaises(ValueError, self._client.create, None)
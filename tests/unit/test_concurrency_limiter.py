@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import threading
+import unittest
+
+import mock
+
+from hpOneView.concurrency_limiter import AIMDLimiter, TokenBucket
+
+
+class AIMDLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.limiter = AIMDLimiter(initial_limit=4, min_limit=1, max_limit=6)
+
+    @mock.patch('time.time')
+    def test_should_grow_by_one_per_round_while_latency_is_flat(self, mock_time):
+        mock_time.return_value = 0
+        for i in range(5):
+            self.limiter.release(self.limiter.acquire())
+
+        self.assertEqual(5, self.limiter.limit)
+
+    @mock.patch('time.time')
+    def test_should_not_grow_beyond_max_limit(self, mock_time):
+        mock_time.return_value = 0
+        for i in range(100):
+            self.limiter.release(self.limiter.acquire())
+
+        self.assertEqual(6, self.limiter.limit)
+
+    @mock.patch('time.time')
+    def test_should_not_grow_when_latency_rises(self, mock_time):
+        mock_time.side_effect = [0, 1, 10, 15]
+        self.limiter.release(self.limiter.acquire())
+        limit = self.limiter.limit
+
+        self.limiter.release(self.limiter.acquire())
+
+        self.assertEqual(limit, self.limiter.limit)
+        self.assertAlmostEqual(1.04, self.limiter.get_stats()['baseline_latency'])
+
+    def test_should_halve_on_overload(self):
+        self.limiter.release(self.limiter.acquire(), overloaded=True)
+
+        self.assertEqual(2, self.limiter.limit)
+
+    def test_should_not_back_off_below_min_limit(self):
+        for i in range(5):
+            self.limiter.release(self.limiter.acquire(), overloaded=True)
+
+        self.assertEqual(1, self.limiter.limit)
+
+    def test_should_back_off_once_for_requests_sent_before_a_decrease(self):
+        started = [self.limiter.acquire() for i in range(3)]
+
+        for request_started in started:
+            self.limiter.release(request_started, overloaded=True)
+
+        self.assertEqual(2, self.limiter.limit)
+
+    def test_should_block_while_limit_is_reached(self):
+        limiter = AIMDLimiter(initial_limit=1, min_limit=1, max_limit=1)
+        started = limiter.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: acquired.set() if limiter.acquire() else None)
+        thread.start()
+
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release(started)
+        self.assertTrue(acquired.wait(5))
+        thread.join()
+        self.assertEqual(1, limiter.in_flight)
+
+    def test_should_take_a_token_for_each_request(self):
+        token_bucket = mock.Mock()
+        limiter = AIMDLimiter(token_bucket=token_bucket)
+
+        limiter.acquire()
+
+        token_bucket.acquire.assert_called_once_with()
+
+
+class TokenBucketTest(unittest.TestCase):
+    @mock.patch('time.sleep')
+    @mock.patch('time.time')
+    def test_should_allow_burst_then_wait_for_refill(self, mock_time, mock_sleep):
+        mock_time.return_value = 0
+        token_bucket = TokenBucket(rate=2, burst=2)
+
+        token_bucket.acquire()
+        token_bucket.acquire()
+        mock_sleep.side_effect = lambda seconds: setattr(mock_time, 'return_value', mock_time.return_value + seconds)
+        token_bucket.acquire()
+
+        mock_sleep.assert_called_once_with(0.5)
@@ -20,19 +20,31 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 ###
+import http.client
 import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import zlib
 import mock
 import unittest
 
-from http.client import HTTPSConnection
-from hpOneView.connection import connection
-from hpOneView.exceptions import HPOneViewException
+from http.client import HTTPConnection, HTTPSConnection
+from hpOneView.api_version_cache import ApiVersionCache
+from hpOneView.connection import connection, ResumableHTTPSConnection, TLSSessionCache
+from hpOneView.exceptions import HPOneViewException, HPOneViewCircuitOpen
+from hpOneView.json_codec import JSONCodec
+from hpOneView.retry_policy import RetryPolicy
+from hpOneView.session_store import FileSessionStore
 from mock import call
 
 
 class ConnectionTest(unittest.TestCase):
 
     def setUp(self):
+        ApiVersionCache.clear()
         self.host = '127.0.0.1'
         self.connection = connection(self.host)
         self.accept_language_header = {
@@ -41,12 +53,14 @@ class ConnectionTest(unittest.TestCase):
         self.default_headers = {
             'X-API-Version': 200,
             'Accept': 'application/json',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip, deflate'
         }
         self.merged_headers = {
             'X-API-Version': 200,
             'Accept': 'application/json',
             'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
             'Accept-Language': 'en_US'
         }
         self.request_body = {"request body": "content"}
@@ -413,3 +427,1052 @@ class ConnectionTest(unittest.TestCase):
         # verify the result
         self.assertEquals(mockedTaskBody, testTask)
         self.assertEquals(mockedTaskBody, testBody)
+
+    def __make_keep_alive_response(self, will_close=False):
+        mock_response = self.__make_http_response(status=200)
+        mock_response.will_close = will_close
+        return mock_response
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_reuse_keep_alive_connection(self, mock_get_connection):
+        mock_conn = mock.Mock()
+        mock_conn.getresponse.return_value = self.__make_keep_alive_response()
+        mock_get_connection.return_value = mock_conn
+
+        self.connection.get('/path')
+        self.connection.get('/path')
+
+        mock_get_connection.assert_called_once_with()
+        self.assertEqual(2, mock_conn.request.call_count)
+        mock_conn.close.assert_not_called()
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_close_connection_when_server_closes_it(self, mock_get_connection):
+        mock_conn = mock.Mock()
+        mock_conn.getresponse.return_value = self.__make_keep_alive_response(will_close=True)
+        mock_get_connection.return_value = mock_conn
+
+        self.connection.get('/path')
+        self.connection.get('/path')
+
+        self.assertEqual(2, mock_get_connection.call_count)
+        self.assertEqual(2, mock_conn.close.call_count)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_reconnect_when_pooled_connection_is_stale(self, mock_get_connection):
+        stale_conn = mock.Mock()
+        stale_conn.getresponse.side_effect = [self.__make_keep_alive_response(), socket.error('reset')]
+        new_conn = mock.Mock()
+        new_conn.getresponse.return_value = self.__make_keep_alive_response()
+        mock_get_connection.side_effect = [stale_conn, new_conn]
+
+        self.connection.get('/path')
+        result = self.connection.get('/path')
+
+        self.assertEqual(self.expected_response_body, result)
+        stale_conn.close.assert_called_once_with()
+        new_conn.request.assert_called_once_with('GET', '/path', '', self.default_headers)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_reconnect_post_when_stale_connection_fails_while_sending(self, mock_get_connection):
+        stale_conn = mock.Mock()
+        stale_conn.getresponse.return_value = self.__make_keep_alive_response()
+        new_conn = mock.Mock()
+        new_conn.getresponse.return_value = self.__make_keep_alive_response()
+        mock_get_connection.side_effect = [stale_conn, new_conn]
+        self.connection.get('/path')
+        stale_conn.request.side_effect = socket.error('broken pipe')
+
+        self.connection.post('/path', {})
+
+        stale_conn.close.assert_called_once_with()
+        self.assertEqual(1, new_conn.request.call_count)
+
+    @mock.patch('time.sleep')
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_not_resend_post_when_response_fails(self, mock_get_connection, mock_sleep):
+        stale_conn = mock.Mock()
+        stale_conn.getresponse.side_effect = [self.__make_keep_alive_response(), socket.error('reset')]
+        mock_get_connection.side_effect = [stale_conn, mock.Mock()]
+        self.connection.get('/path')
+
+        self.assertRaises(socket.error, self.connection.post, '/path', {})
+        self.assertEqual(2, stale_conn.request.call_count)
+        self.assertEqual(1, mock_get_connection.call_count)
+
+    @mock.patch('time.sleep')
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_not_treat_timeout_as_stale_connection(self, mock_get_connection, mock_sleep):
+        stale_conn = mock.Mock()
+        stale_conn.getresponse.side_effect = [self.__make_keep_alive_response(), socket.timeout('timed out')]
+        new_conn = mock.Mock()
+        new_conn.getresponse.return_value = self.__make_keep_alive_response()
+        mock_get_connection.side_effect = [stale_conn, new_conn]
+        self.connection.get('/path')
+
+        self.connection.get('/path')
+
+        mock_sleep.assert_called_once_with(mock.ANY)
+        new_conn.request.assert_called_once_with('GET', '/path', '', self.default_headers)
+
+    @mock.patch('time.sleep')
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_raise_socket_error_on_new_connection(self, mock_get_connection, mock_sleep):
+        mock_conn = mock.Mock()
+        mock_conn.request.side_effect = socket.error('refused')
+        mock_get_connection.return_value = mock_conn
+
+        self.assertRaises(socket.error, self.connection.get, '/path')
+        self.assertEqual(3, mock_conn.request.call_count)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_evict_idle_connections(self, mock_get_connection):
+        mock_conn = mock.Mock()
+        mock_conn.getresponse.return_value = self.__make_keep_alive_response()
+        mock_get_connection.return_value = mock_conn
+        self.connection.set_connection_pool(idle_timeout=0)
+
+        self.connection.get('/path')
+        self.connection.get('/path')
+
+        self.assertEqual(2, mock_get_connection.call_count)
+        mock_conn.close.assert_called_once_with()
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_discard_pooled_connection_closed_by_appliance(self, mock_get_connection):
+        client_socket, appliance_socket = socket.socketpair()
+        self.addCleanup(client_socket.close)
+        dropped_conn = mock.Mock(sock=client_socket)
+        dropped_conn.getresponse.return_value = self.__make_keep_alive_response()
+        new_conn = mock.Mock()
+        new_conn.getresponse.return_value = self.__make_keep_alive_response()
+        mock_get_connection.side_effect = [dropped_conn, new_conn]
+
+        self.connection.get('/path')
+        appliance_socket.close()
+        self.connection.post('/path', {})
+
+        dropped_conn.close.assert_called_once_with()
+        self.assertEqual(1, dropped_conn.request.call_count)
+        self.assertEqual(1, new_conn.request.call_count)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_reuse_pooled_connection_still_open(self, mock_get_connection):
+        client_socket, appliance_socket = socket.socketpair()
+        self.addCleanup(client_socket.close)
+        self.addCleanup(appliance_socket.close)
+        mock_conn = mock.Mock(sock=client_socket)
+        mock_conn.getresponse.return_value = self.__make_keep_alive_response()
+        mock_get_connection.return_value = mock_conn
+
+        self.connection.get('/path')
+        self.connection.post('/path', {})
+
+        mock_get_connection.assert_called_once_with()
+        self.assertEqual(2, mock_conn.request.call_count)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_not_pool_when_pool_size_is_zero(self, mock_get_connection):
+        mock_conn = mock.Mock()
+        mock_conn.getresponse.return_value = self.__make_keep_alive_response()
+        mock_get_connection.return_value = mock_conn
+        self.connection.set_connection_pool(pool_size=0)
+
+        self.connection.get('/path')
+
+        mock_conn.close.assert_called_once_with()
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_release_concurrency_slot(self, mock_get_connection):
+        mock_get_connection.return_value.getresponse.return_value = self.__make_keep_alive_response()
+        limiter = self.connection.set_concurrency_limit(initial_limit=2)
+
+        self.connection.get('/path')
+
+        self.assertEqual(0, limiter.in_flight)
+        self.assertIs(limiter, self.connection.get_concurrency_limiter())
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_back_off_when_appliance_is_overloaded(self, mock_get_connection):
+        mock_get_connection.return_value.getresponse.return_value = self.__make_http_response(status=503)
+        self.connection.set_retry_policy(None)
+        limiter = self.connection.set_concurrency_limit(initial_limit=8)
+
+        self.connection.do_http('GET', '/path', '')
+
+        self.assertEqual(4, limiter.limit)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_back_off_when_request_times_out(self, mock_get_connection):
+        mock_get_connection.return_value.getresponse.side_effect = socket.timeout('timed out')
+        self.connection.set_retry_policy(None)
+        limiter = self.connection.set_concurrency_limit(initial_limit=8)
+
+        self.assertRaises(socket.timeout, self.connection.get, '/path')
+
+        self.assertEqual(4, limiter.limit)
+        self.assertEqual(0, limiter.in_flight)
+
+    def test_set_concurrency_limit_should_cap_rate_with_token_bucket(self):
+        limiter = self.connection.set_concurrency_limit(rate=10)
+
+        self.assertIsNotNone(limiter._token_bucket)
+
+    @mock.patch('time.sleep')
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_retry_get_when_appliance_is_unavailable(self, mock_get_connection, mock_sleep):
+        mock_get_connection.return_value.getresponse.side_effect = [self.__make_http_response(status=503),
+                                                                    self.__make_http_response(status=200)]
+        self.connection.set_retry_policy(RetryPolicy(jitter=False))
+
+        result = self.connection.get('/path')
+
+        self.assertEqual(self.expected_response_body, result)
+        mock_sleep.assert_called_once_with(0.5)
+
+    @mock.patch('time.sleep')
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_not_replay_post_when_appliance_is_unavailable(self, mock_get_connection, mock_sleep):
+        mock_get_connection.return_value.getresponse.return_value = self.__make_http_response(status=503)
+
+        self.assertRaises(HPOneViewException, self.connection.post, '/path', {})
+
+        self.assertEqual(1, mock_get_connection.return_value.request.call_count)
+        mock_sleep.assert_not_called()
+
+    @mock.patch('time.sleep')
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_stop_retrying_bad_status_line(self, mock_get_connection, mock_sleep):
+        mock_get_connection.return_value.getresponse.side_effect = http.client.BadStatusLine('')
+
+        self.assertRaises(http.client.BadStatusLine, self.connection.get, '/path')
+
+        self.assertEqual(3, mock_get_connection.return_value.request.call_count)
+        self.assertEqual(2, mock_sleep.call_count)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_fail_fast_when_circuit_is_open(self, mock_get_connection):
+        mock_get_connection.return_value.getresponse.return_value = self.__make_http_response(status=503)
+        self.connection.set_retry_policy(None)
+        self.connection.enable_circuit_breaker(failure_threshold=2)
+
+        self.connection.do_http('GET', '/path', '')
+        self.connection.do_http('GET', '/path', '')
+
+        self.assertRaises(HPOneViewCircuitOpen, self.connection.get, '/path')
+        self.assertEqual(2, mock_get_connection.return_value.request.call_count)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_end_circuit_trial_when_request_fails_unexpectedly(self, mock_get_connection):
+        mock_get_connection.return_value.getresponse.side_effect = [self.__make_http_response(status=503),
+                                                                    zlib.error('invalid stored block lengths'),
+                                                                    self.__make_http_response(status=200)]
+        self.connection.set_retry_policy(None)
+        self.connection.enable_circuit_breaker(failure_threshold=1, reset_timeout=0)
+
+        self.connection.do_http('GET', '/path', '')
+        self.assertRaises(zlib.error, self.connection.get, '/path')
+
+        self.assertEqual(self.expected_response_body, self.connection.get('/path'))
+
+    def test_disable_concurrency_limit(self):
+        self.connection.set_concurrency_limit()
+
+        self.connection.disable_concurrency_limit()
+
+        self.assertIsNone(self.connection.get_concurrency_limiter())
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_set_proxy_should_close_pooled_connections(self, mock_get_connection):
+        mock_conn = mock.Mock()
+        mock_conn.getresponse.return_value = self.__make_keep_alive_response()
+        mock_get_connection.return_value = mock_conn
+        self.connection.get('/path')
+
+        self.connection.set_proxy('10.0.0.1', 3128)
+
+        mock_conn.close.assert_called_once_with()
+
+    def test_get_connection_should_use_request_timeout(self):
+        self.connection.set_request_timeout(30)
+
+        self.assertEqual(30, self.connection.get_connection().timeout)
+
+    def test_get_connection_should_not_time_out_by_default(self):
+        self.assertIs(socket._GLOBAL_DEFAULT_TIMEOUT, self.connection.get_connection().timeout)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_set_request_timeout_should_close_pooled_connections(self, mock_get_connection):
+        mock_conn = mock.Mock()
+        mock_conn.getresponse.return_value = self.__make_keep_alive_response()
+        mock_get_connection.return_value = mock_conn
+        self.connection.get('/path')
+
+        self.connection.set_request_timeout(30)
+
+        mock_conn.close.assert_called_once_with()
+
+    def test_get_connection_should_reuse_ssl_context(self):
+        first = self.connection.get_connection()
+        second = self.connection.get_connection()
+
+        self.assertIsInstance(first, ResumableHTTPSConnection)
+        self.assertIs(first._context, second._context)
+
+    @mock.patch('ssl.SSLContext.load_verify_locations')
+    def test_get_connection_should_load_trusted_bundle_once(self, mock_load_verify_locations):
+        self.connection.set_trusted_ssl_bundle('/path/bundle.pem')
+
+        self.connection.get_connection()
+        self.connection.get_connection()
+
+        mock_load_verify_locations.assert_called_once_with('/path/bundle.pem')
+
+    @mock.patch('ssl.SSLContext.load_verify_locations')
+    def test_set_trusted_ssl_bundle_should_rebuild_ssl_context(self, mock_load_verify_locations):
+        context = self.connection.get_connection()._context
+
+        self.connection.set_trusted_ssl_bundle('/path/bundle.pem')
+
+        self.assertIsNot(context, self.connection.get_connection()._context)
+
+    def test_get_connection_should_tunnel_through_proxy(self):
+        self.connection.set_proxy('10.0.0.1', 3128)
+
+        conn = self.connection.get_connection()
+
+        self.assertEqual(('10.0.0.1', 3128), (conn.host, conn.port))
+        self.assertEqual(self.host, conn._tunnel_host)
+
+    @mock.patch.object(HTTPConnection, 'connect')
+    def test_resumable_connection_should_offer_cached_tls_session(self, mock_connect):
+        session_cache = TLSSessionCache()
+        session_cache.session = 'previous session'
+        context = mock.Mock()
+        context.wrap_socket.return_value = mock.Mock(session='new session')
+        conn = ResumableHTTPSConnection(self.host, context=context, session_cache=session_cache)
+
+        conn.connect()
+
+        context.wrap_socket.assert_called_once_with(mock.ANY, server_hostname=self.host, session='previous session')
+        self.assertEqual('new session', session_cache.session)
+
+    def __make_cache_response(self, status=200, etag=None):
+        mock_response = mock.Mock(status=status)
+        mock_response.getheader.return_value = etag
+        return mock_response
+
+    @mock.patch.object(connection, 'do_http')
+    def test_get_should_not_cache_when_cache_is_disabled(self, mock_do_http):
+        mock_do_http.return_value = (self.__make_cache_response(), {'name': 'type'})
+
+        self.connection.get('/rest/server-hardware-types/1')
+        self.connection.get('/rest/server-hardware-types/1')
+
+        self.assertEqual(2, mock_do_http.call_count)
+
+    @mock.patch.object(connection, 'do_http')
+    def test_get_should_serve_fresh_response_from_cache(self, mock_do_http):
+        mock_do_http.return_value = (self.__make_cache_response(etag='1'), {'name': 'type'})
+        self.connection.enable_cache({'/rest/server-hardware-types': 60})
+
+        self.connection.get('/rest/server-hardware-types/1')
+        result = self.connection.get('/rest/server-hardware-types/1')
+
+        mock_do_http.assert_called_once_with('GET', '/rest/server-hardware-types/1', '')
+        self.assertEqual({'name': 'type'}, result)
+
+    @mock.patch.object(connection, 'do_http')
+    def test_get_should_not_cache_uris_without_ttl(self, mock_do_http):
+        mock_do_http.return_value = (self.__make_cache_response(), {'taskState': 'Running'})
+        self.connection.enable_cache({'/rest/server-hardware-types': 60})
+
+        self.connection.get('/rest/tasks/1')
+        self.connection.get('/rest/tasks/1')
+
+        self.assertEqual(2, mock_do_http.call_count)
+
+    @mock.patch.object(connection, 'do_http')
+    def test_get_should_revalidate_expired_response_with_etag(self, mock_do_http):
+        mock_do_http.side_effect = [(self.__make_cache_response(etag='"1"'), {'name': 'type'}),
+                                    (self.__make_cache_response(status=304), '')]
+        self.connection.enable_cache({'/rest/server-hardware-types': 0})
+
+        self.connection.get('/rest/server-hardware-types/1')
+        result = self.connection.get('/rest/server-hardware-types/1')
+
+        mock_do_http.assert_called_with('GET', '/rest/server-hardware-types/1', '', {'If-None-Match': '"1"'})
+        self.assertEqual({'name': 'type'}, result)
+
+    @mock.patch.object(connection, 'do_http')
+    def test_get_should_replace_cached_response_when_modified(self, mock_do_http):
+        mock_do_http.side_effect = [(self.__make_cache_response(etag='"1"'), {'name': 'old'}),
+                                    (self.__make_cache_response(etag='"2"'), {'name': 'new'}),
+                                    (self.__make_cache_response(status=304), '')]
+        self.connection.enable_cache({'/rest/server-hardware-types': 0})
+
+        self.connection.get('/rest/server-hardware-types/1')
+        self.connection.get('/rest/server-hardware-types/1')
+        result = self.connection.get('/rest/server-hardware-types/1')
+
+        mock_do_http.assert_called_with('GET', '/rest/server-hardware-types/1', '', {'If-None-Match': '"2"'})
+        self.assertEqual({'name': 'new'}, result)
+
+    @mock.patch.object(connection, 'do_http')
+    def test_get_should_return_copy_of_cached_response(self, mock_do_http):
+        mock_do_http.return_value = (self.__make_cache_response(), {'name': 'type'})
+        self.connection.enable_cache({'/rest/server-hardware-types': 60})
+
+        self.connection.get('/rest/server-hardware-types/1')['name'] = 'changed'
+        result = self.connection.get('/rest/server-hardware-types/1')
+
+        self.assertEqual({'name': 'type'}, result)
+
+    @mock.patch.object(connection, 'do_http')
+    def test_disable_cache_should_drop_cached_responses(self, mock_do_http):
+        mock_do_http.return_value = (self.__make_cache_response(), {'name': 'type'})
+        self.connection.enable_cache({'/rest/server-hardware-types': 60})
+        self.connection.get('/rest/server-hardware-types/1')
+
+        self.connection.disable_cache()
+        self.connection.get('/rest/server-hardware-types/1')
+
+        self.assertIsNone(self.connection.get_cache())
+        self.assertEqual(2, mock_do_http.call_count)
+
+    @mock.patch.object(connection, 'do_http')
+    def test_put_should_invalidate_cached_resource_and_listings(self, mock_do_http):
+        self.connection.enable_cache({'/rest/server-profiles': 60})
+        cache = self.connection.get_cache()
+        cache.store('/rest/server-profiles/1', {'name': 'old'})
+        cache.store('/rest/server-profiles?start=0&count=-1', {'members': [{'name': 'old'}]})
+        cache.store('/rest/server-profiles/2', {'name': 'other'})
+        mock_do_http.return_value = (self.__make_cache_response(), {'name': 'new'})
+
+        self.connection.put('/rest/server-profiles/1?force=True', {'name': 'new'})
+
+        self.assertIsNone(cache.lookup('/rest/server-profiles/1'))
+        self.assertIsNone(cache.lookup('/rest/server-profiles?start=0&count=-1'))
+        self.assertIsNotNone(cache.lookup('/rest/server-profiles/2'))
+
+    @mock.patch.object(connection, 'do_http')
+    def test_post_should_invalidate_listings_and_keep_cached_members(self, mock_do_http):
+        self.connection.enable_cache({'/rest/server-profiles': 60})
+        cache = self.connection.get_cache()
+        cache.store('/rest/server-profiles/1', {'name': 'existing'})
+        cache.store('/rest/server-profiles?start=0&count=-1', {'members': [{'name': 'existing'}]})
+        mock_do_http.return_value = (self.__make_cache_response(), {'name': 'new'})
+
+        self.connection.post('/rest/server-profiles', {'name': 'new'})
+
+        self.assertIsNotNone(cache.lookup('/rest/server-profiles/1'))
+        self.assertIsNone(cache.lookup('/rest/server-profiles?start=0&count=-1'))
+
+    @mock.patch.object(connection, 'do_http')
+    def test_post_should_invalidate_cache_when_request_fails(self, mock_do_http):
+        self.connection.enable_cache({'/rest/server-profiles': 60})
+        cache = self.connection.get_cache()
+        cache.store('/rest/server-profiles?start=0&count=-1', {'members': []})
+        mock_do_http.return_value = (self.__make_cache_response(status=500), {'message': 'error'})
+
+        self.assertRaises(HPOneViewException, self.connection.post, '/rest/server-profiles', {})
+        self.assertIsNone(cache.lookup('/rest/server-profiles?start=0&count=-1'))
+
+    def __make_upload_file(self, content):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        file_path = os.path.join(directory, 'spp.iso')
+        with open(file_path, 'wb') as upload_file:
+            upload_file.write(content)
+        return file_path
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_post_multipart_should_stream_file_between_boundaries(self, mock_get_connection):
+        file_path = self.__make_upload_file(b'0123456789')
+        mock_conn = mock_get_connection.return_value
+        mock_conn.getresponse.return_value = self.__make_http_response(status=202)
+        self.connection._headers['auth'] = 'LTIxNjUzMjc0OTUzzHoF7eEkZLEUWVA-fuOZP4VGA3U8e67E'
+
+        self.connection.post_multipart('/rest/firmware-bundles', None, file_path, 'spp.iso', chunk_size=4)
+
+        sent = b''.join(c[0][0] for c in mock_conn.send.call_args_list)
+        expected = (b'--' + b'----------ThIs_Is_tHe_bouNdaRY_$\r\n'
+                    b'Content-Disposition: form-data; name="file"; filename="spp.iso"\r\n'
+                    b'Content-Type: application/octet-stream\r\n\r\n'
+                    b'0123456789\r\n'
+                    b'------------ThIs_Is_tHe_bouNdaRY_$--\r\n\r\n')
+        self.assertEqual(expected, sent)
+        self.assertEqual(5, mock_conn.send.call_count)
+        mock_conn.putheader.assert_any_call('Content-Length', len(expected))
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_post_multipart_should_not_write_temporary_file(self, mock_get_connection):
+        file_path = self.__make_upload_file(b'0123456789')
+        mock_get_connection.return_value.getresponse.return_value = self.__make_http_response(status=202)
+        self.connection._headers['auth'] = 'LTIxNjUzMjc0OTUzzHoF7eEkZLEUWVA-fuOZP4VGA3U8e67E'
+
+        self.connection.post_multipart('/rest/firmware-bundles', None, file_path, 'spp.iso')
+
+        self.assertEqual(['spp.iso'], os.listdir(os.path.dirname(file_path)))
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_post_multipart_should_report_progress(self, mock_get_connection):
+        file_path = self.__make_upload_file(b'0123456789')
+        mock_get_connection.return_value.getresponse.return_value = self.__make_http_response(status=202)
+        self.connection._headers['auth'] = 'LTIxNjUzMjc0OTUzzHoF7eEkZLEUWVA-fuOZP4VGA3U8e67E'
+        progress_callback = mock.Mock()
+
+        self.connection.post_multipart('/rest/firmware-bundles', None, file_path, 'spp.iso', chunk_size=6,
+                                       progress_callback=progress_callback)
+
+        (first_sent, total, _), _ = progress_callback.call_args_list[0]
+        (last_sent, _, throughput), _ = progress_callback.call_args_list[1]
+        self.assertEqual(2, progress_callback.call_count)
+        self.assertEqual(4, last_sent - first_sent)
+        self.assertLess(last_sent, total)
+        self.assertGreater(throughput, 0)
+
+    @mock.patch('time.sleep')
+    @mock.patch.object(connection, 'get_connection')
+    def test_post_multipart_should_restart_upload_when_connection_drops(self, mock_get_connection, mock_sleep):
+        file_path = self.__make_upload_file(b'0123456789')
+        dropped_conn = mock.Mock()
+        dropped_conn.send.side_effect = [None, socket.error('Connection reset by peer')]
+        conn = mock.Mock()
+        conn.getresponse.return_value = self.__make_http_response(status=202)
+        mock_get_connection.side_effect = [dropped_conn, conn]
+        self.connection._headers['auth'] = 'LTIxNjUzMjc0OTUzzHoF7eEkZLEUWVA-fuOZP4VGA3U8e67E'
+
+        response, body = self.connection.post_multipart('/rest/firmware-bundles', None, file_path, 'spp.iso',
+                                                        max_retries=1)
+
+        self.assertEqual(202, response.status)
+        dropped_conn.close.assert_called_once_with()
+        self.assertIn(call(b'0123456789'), conn.send.call_args_list)
+        mock_sleep.assert_called_once_with(2)
+
+    @mock.patch('time.sleep')
+    @mock.patch.object(connection, 'get_connection')
+    def test_post_multipart_should_raise_when_retries_are_exhausted(self, mock_get_connection, mock_sleep):
+        file_path = self.__make_upload_file(b'0123456789')
+        mock_get_connection.return_value.send.side_effect = socket.error('Connection reset by peer')
+        self.connection._headers['auth'] = 'LTIxNjUzMjc0OTUzzHoF7eEkZLEUWVA-fuOZP4VGA3U8e67E'
+
+        self.assertRaises(socket.error, self.connection.post_multipart, '/rest/firmware-bundles', None, file_path,
+                          'spp.iso', max_retries=2)
+        self.assertEqual(3, mock_get_connection.call_count)
+
+    @mock.patch('time.sleep')
+    @mock.patch.object(connection, 'get_connection')
+    def test_post_multipart_should_not_restart_upload_when_file_was_sent(self, mock_get_connection, mock_sleep):
+        file_path = self.__make_upload_file(b'0123456789')
+        mock_conn = mock_get_connection.return_value
+        mock_conn.getresponse.side_effect = socket.timeout('timed out')
+        self.connection._headers['auth'] = 'LTIxNjUzMjc0OTUzzHoF7eEkZLEUWVA-fuOZP4VGA3U8e67E'
+
+        self.assertRaises(socket.timeout, self.connection.post_multipart, '/rest/firmware-bundles', None, file_path,
+                          'spp.iso', max_retries=2)
+        mock_get_connection.assert_called_once_with()
+        mock_conn.close.assert_called_once_with()
+        mock_sleep.assert_not_called()
+
+    def test_adapt_chunk_size_should_follow_link_speed(self):
+        adapt_chunk_size = self.connection._connection__adapt_chunk_size
+
+        self.assertEqual(2097152, adapt_chunk_size(1048576, 0.1))
+        self.assertEqual(524288, adapt_chunk_size(1048576, 5))
+        self.assertEqual(1048576, adapt_chunk_size(1048576, 1))
+        self.assertEqual(16777216, adapt_chunk_size(16777216, 0.1))
+        self.assertEqual(65536, adapt_chunk_size(65536, 5))
+
+    def __make_download_response(self, status, chunks):
+        mock_response = mock.Mock(status=status, will_close=False)
+        mock_response.read.side_effect = list(chunks) + [b'']
+        return mock_response
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_download_should_write_chunks_to_file(self, mock_get_connection):
+        dest = self.__make_upload_file(b'')
+        mock_conn = mock_get_connection.return_value
+        mock_conn.getresponse.return_value = self.__make_download_response(200, [b'0123', b'4567', b'89'])
+
+        result = self.connection.download('/rest/backups/archive/1', dest, chunk_size=4)
+
+        self.assertTrue(result)
+        mock_conn.request.assert_called_once_with('GET', '/rest/backups/archive/1', '', self.default_headers)
+        mock_conn.getresponse.return_value.read.assert_called_with(4)
+        with open(dest, 'rb') as f:
+            self.assertEqual(b'0123456789', f.read())
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_download_should_resume_from_existing_file(self, mock_get_connection):
+        dest = self.__make_upload_file(b'01234')
+        mock_conn = mock_get_connection.return_value
+        mock_conn.getresponse.return_value = self.__make_download_response(206, [b'56789'])
+
+        self.connection.download('/rest/backups/archive/1', dest, resume=True)
+
+        expected_headers = dict(self.default_headers, Range='bytes=5-')
+        del expected_headers['Accept-Encoding']
+        mock_conn.request.assert_called_once_with('GET', '/rest/backups/archive/1', '', expected_headers)
+        with open(dest, 'rb') as f:
+            self.assertEqual(b'0123456789', f.read())
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_download_should_restart_when_range_is_ignored(self, mock_get_connection):
+        dest = self.__make_upload_file(b'01234')
+        mock_get_connection.return_value.getresponse.return_value = self.__make_download_response(200, [b'0123456789'])
+
+        self.connection.download('/rest/backups/archive/1', dest, resume=True)
+
+        with open(dest, 'rb') as f:
+            self.assertEqual(b'0123456789', f.read())
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_download_should_succeed_when_file_is_complete(self, mock_get_connection):
+        dest = self.__make_upload_file(b'0123456789')
+        mock_get_connection.return_value.getresponse.return_value = self.__make_download_response(416, [])
+
+        self.assertTrue(self.connection.download('/rest/backups/archive/1', dest, resume=True))
+        with open(dest, 'rb') as f:
+            self.assertEqual(b'0123456789', f.read())
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_download_should_raise_exception_when_status_not_found(self, mock_get_connection):
+        dest = self.__make_upload_file(b'')
+        mock_conn = mock_get_connection.return_value
+        mock_conn.getresponse.return_value = self.__make_download_response(404, [b'{"message": "Not found"}'])
+
+        self.assertRaises(HPOneViewException, self.connection.download, '/rest/backups/archive/1', dest)
+        mock_conn.close.assert_called_once_with()
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_download_should_follow_redirect(self, mock_get_connection):
+        dest = self.__make_upload_file(b'')
+        redirect = self.__make_download_response(302, [])
+        redirect.getheader.return_value = '/rest/backups/archive/2'
+        redirected_conn = mock.Mock()
+        redirected_conn.getresponse.return_value = self.__make_download_response(200, [b'0123456789'])
+        mock_get_connection.side_effect = [mock.Mock(**{'getresponse.return_value': redirect}), redirected_conn]
+
+        self.connection.download('/rest/backups/archive/1', dest)
+
+        redirected_conn.request.assert_called_once_with('GET', '/rest/backups/archive/2', '', self.default_headers)
+        with open(dest, 'rb') as f:
+            self.assertEqual(b'0123456789', f.read())
+
+    def __make_typed_response(self, content_type, content):
+        mock_response = mock.Mock(status=200, will_close=False)
+        mock_response.getheader.side_effect = lambda name: content_type if name == 'Content-Type' else None
+        mock_response.read.return_value = content
+        return mock_response
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_decode_json_content_with_codec(self, mock_get_connection):
+        codec = mock.Mock()
+        codec.loads.return_value = {'name': 'decoded'}
+        self.connection.set_json_codec(codec)
+        mock_get_connection.return_value.getresponse.return_value = self.__make_typed_response(
+            'application/json;charset=UTF-8', b'{"name": "value"}')
+
+        response, body = self.connection.do_http('GET', '/rest/server-hardware', '')
+
+        codec.loads.assert_called_once_with(b'{"name": "value"}')
+        self.assertEqual({'name': 'decoded'}, body)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_return_binary_content_as_bytes(self, mock_get_connection):
+        mock_get_connection.return_value.getresponse.return_value = self.__make_typed_response(
+            'application/octet-stream', b'{"looks": "like json"}')
+
+        response, body = self.connection.do_http('GET', '/rest/backups/archive/1', '')
+
+        self.assertEqual(b'{"looks": "like json"}', body)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_return_text_content_as_text(self, mock_get_connection):
+        mock_get_connection.return_value.getresponse.return_value = self.__make_typed_response(
+            'text/plain', b'["not parsed"]')
+
+        response, body = self.connection.do_http('GET', '/rest/appliance/nodeinfo/version', '')
+
+        self.assertEqual('["not parsed"]', body)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_return_text_when_json_content_is_invalid(self, mock_get_connection):
+        self.connection.set_json_codec(JSONCodec())
+        mock_get_connection.return_value.getresponse.return_value = self.__make_typed_response(
+            'application/json', b'Internal error')
+
+        response, body = self.connection.do_http('GET', '/rest/server-hardware', '')
+
+        self.assertEqual('Internal error', body)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_detect_json_without_content_type(self, mock_get_connection):
+        mock_get_connection.return_value.getresponse.return_value = self.__make_typed_response(
+            None, b'{"name": "value"}')
+
+        response, body = self.connection.do_http('GET', '/rest/server-hardware', '')
+
+        self.assertEqual({'name': 'value'}, body)
+
+    def __make_compressed_response(self, encoding, content, wbits):
+        compressor = zlib.compressobj(9, zlib.DEFLATED, wbits)
+        compressed = compressor.compress(content) + compressor.flush()
+        chunks = [compressed[i:i + 7] for i in range(0, len(compressed), 7)] + [b'']
+        mock_response = mock.Mock(status=200, will_close=False)
+        mock_response.getheader.side_effect = lambda name: {'Content-Encoding': encoding,
+                                                            'Content-Type': 'application/json'}.get(name)
+        mock_response.read.side_effect = chunks
+        return mock_response, len(compressed)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_decompress_gzip_response(self, mock_get_connection):
+        content = json.dumps({'members': [self.response_body] * 50}).encode('utf-8')
+        response, compressed_size = self.__make_compressed_response('gzip', content, 16 + zlib.MAX_WBITS)
+        mock_get_connection.return_value.getresponse.return_value = response
+
+        response, body = self.connection.do_http('GET', '/rest/server-hardware', '')
+
+        self.assertEqual({'members': [self.response_body] * 50}, body)
+        self.assertEqual({'compressed_responses': 1,
+                          'compressed_bytes': compressed_size,
+                          'uncompressed_bytes': len(content),
+                          'bytes_saved': len(content) - compressed_size},
+                         self.connection.get_compression_stats())
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_decompress_deflate_response(self, mock_get_connection):
+        content = json.dumps(self.response_body).encode('utf-8')
+        response, _ = self.__make_compressed_response('deflate', content, zlib.MAX_WBITS)
+        mock_get_connection.return_value.getresponse.return_value = response
+
+        response, body = self.connection.do_http('GET', '/rest/server-hardware', '')
+
+        self.assertEqual(self.response_body, body)
+
+    def test_set_compression_should_toggle_accept_encoding(self):
+        self.connection.set_compression(False)
+        self.assertNotIn('Accept-Encoding', self.connection._headers)
+
+        self.connection.set_compression(True)
+        self.assertEqual('gzip, deflate', self.connection._headers['Accept-Encoding'])
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_download_should_decompress_to_file(self, mock_get_connection):
+        dest = self.__make_upload_file(b'')
+        content = b'audit log line\n' * 100
+        response, _ = self.__make_compressed_response('gzip', content, 16 + zlib.MAX_WBITS)
+        mock_get_connection.return_value.getresponse.return_value = response
+
+        self.connection.download('/rest/audit-logs/download', dest, chunk_size=7)
+
+        with open(dest, 'rb') as f:
+            self.assertEqual(content, f.read())
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(connection, 'get')
+    def test_login_should_reuse_stored_session(self, mock_get, mock_post):
+        session_store = mock.Mock()
+        session_store.get.return_value = {'sessionID': 'stored', 'apiVersion': 200}
+        self.connection.set_session_store(session_store)
+
+        self.connection.login({'userName': 'administrator', 'password': ''})
+
+        self.assertEqual('stored', self.connection._headers['auth'])
+        mock_get.assert_not_called()
+        mock_post.assert_not_called()
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(connection, 'get')
+    def test_login_should_store_new_session(self, mock_get, mock_post):
+        cred = {'userName': 'administrator', 'password': ''}
+        mock_get.return_value = {}
+        mock_post.return_value = None, {'sessionID': 'new'}
+        session_store = mock.Mock()
+        session_store.get.return_value = {'sessionID': 'stored', 'apiVersion': 300}
+        self.connection.set_session_store(session_store)
+
+        self.connection.login(cred)
+
+        self.assertEqual('new', self.connection._headers['auth'])
+        mock_get.assert_called_once_with('/rest/version')
+        session_store.save.assert_called_once_with('127.0.0.1', cred, 'new', 200)
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(connection, 'get_connection')
+    def test_do_http_should_login_again_when_session_expired(self, mock_get_connection, mock_post):
+        mock_get_connection.return_value.getresponse.side_effect = [self.__make_http_response(status=401),
+                                                                    self.__make_http_response(status=200)]
+        mock_post.return_value = None, {'sessionID': 'new'}
+        self.connection._cred = {'userName': 'administrator', 'password': ''}
+        self.connection._headers['auth'] = 'expired'
+
+        result = self.connection.get('/path')
+
+        self.assertEqual(self.expected_response_body, result)
+        mock_post.assert_called_once_with('/rest/login-sessions', self.connection._cred)
+        self.assertEqual('new', mock_get_connection.return_value.request.call_args[0][3]['auth'])
+
+    @mock.patch.object(connection, 'post')
+    def test_renew_session_should_login_once_for_concurrent_requests(self, mock_post):
+        mock_post.return_value = None, {'sessionID': 'new'}
+        self.connection._cred = {'userName': 'administrator', 'password': ''}
+        self.connection._headers['auth'] = 'expired'
+
+        self.connection._connection__renew_session('expired')
+        self.connection._connection__renew_session('expired')
+
+        mock_post.assert_called_once_with('/rest/login-sessions', self.connection._cred)
+
+    @mock.patch.object(connection, 'post')
+    def test_renew_session_should_reuse_session_renewed_by_another_process(self, mock_post):
+        session_store = mock.Mock()
+        session_store.get.return_value = {'sessionID': 'renewed', 'apiVersion': 200}
+        self.connection.set_session_store(session_store)
+        self.connection._cred = {'userName': 'administrator', 'password': ''}
+        self.connection._headers['auth'] = 'expired'
+
+        self.connection._connection__renew_session('expired')
+
+        self.assertEqual('renewed', self.connection._headers['auth'])
+        session_store.delete.assert_called_once_with('127.0.0.1', self.connection._cred, 'expired')
+        mock_post.assert_not_called()
+
+    @mock.patch.object(connection, 'delete')
+    def test_logout_should_remove_stored_session(self, mock_delete):
+        session_store = mock.Mock()
+        self.connection.set_session_store(session_store)
+        self.connection._cred = {'userName': 'administrator', 'password': ''}
+        self.connection._headers['auth'] = 'session'
+
+        self.connection.logout()
+
+        session_store.delete.assert_called_once_with('127.0.0.1', self.connection._cred, 'session')
+
+    @mock.patch.object(connection, 'get')
+    def test_validate_version_should_check_each_appliance_once(self, mock_get):
+        mock_get.return_value = {'minimumVersion': 120, 'currentVersion': 300}
+
+        self.connection.validateVersion()
+        connection(self.host).validateVersion()
+
+        mock_get.assert_called_once_with('/rest/version')
+
+    @mock.patch.object(connection, 'get')
+    def test_validate_version_should_raise_unsupported_version(self, mock_get):
+        mock_get.return_value = {'minimumVersion': 300, 'currentVersion': 500}
+
+        self.assertRaises(HPOneViewException, self.connection.validateVersion)
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(connection, 'get')
+    def test_login_should_check_version_and_login_at_the_same_time(self, mock_get, mock_post):
+        both_requests_sent = threading.Barrier(2, timeout=5) if hasattr(threading, 'Barrier') else None
+        if both_requests_sent is None:
+            self.skipTest('threading.Barrier is not available')
+        mock_get.side_effect = lambda uri: (both_requests_sent.wait(), {})[1]
+        mock_post.side_effect = lambda uri, cred: (both_requests_sent.wait(), {'sessionID': 'new'})
+
+        self.connection.login({'userName': 'administrator', 'password': ''})
+
+        self.assertEqual('new', self.connection._headers['auth'])
+        self.assertTrue(self.connection._validateVersion)
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(connection, 'get')
+    @mock.patch.object(connection, 'delete')
+    def test_login_should_drop_session_when_version_is_unsupported(self, mock_delete, mock_get, mock_post):
+        mock_get.return_value = {'minimumVersion': 300, 'currentVersion': 500}
+        mock_post.return_value = None, {'sessionID': 'new'}
+        session_store = mock.Mock()
+        session_store.get.return_value = None
+        self.connection.set_session_store(session_store)
+
+        self.assertRaises(HPOneViewException, self.connection.login, {'userName': 'administrator', 'password': ''})
+
+        self.assertNotIn('auth', self.connection._headers)
+        session_store.save.assert_not_called()
+        session_store.delete.assert_called_once_with('127.0.0.1', {'userName': 'administrator', 'password': ''}, 'new')
+        mock_delete.assert_called_once_with('/rest/login-sessions')
+
+    @mock.patch.object(connection, 'delete')
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(connection, 'get')
+    def test_login_should_not_reuse_session_of_unsupported_version(self, mock_get, mock_post, mock_delete):
+        session_store = FileSessionStore(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, session_store._path)
+        self.connection.set_session_store(session_store)
+        mock_get.return_value = {'minimumVersion': 300, 'currentVersion': 500}
+        mock_post.return_value = None, {'sessionID': 'new'}
+        cred = {'userName': 'administrator', 'password': ''}
+        self.assertRaises(HPOneViewException, self.connection.login, cred)
+
+        self.assertIsNone(session_store.get(self.host, cred))
+        other_connection = connection(self.host)
+        other_connection.set_session_store(session_store)
+
+        self.assertRaises(HPOneViewException, other_connection.login, cred)
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(connection, 'get_connection')
+    def test_deferred_login_should_login_on_first_request(self, mock_get_connection, mock_post):
+        ApiVersionCache().store(self.host, {'minimumVersion': 120, 'currentVersion': 300})
+        mock_get_connection.return_value.getresponse.return_value = self.__make_http_response(status=200)
+        mock_post.return_value = None, {'sessionID': 'new'}
+
+        self.connection.login({'userName': 'administrator', 'password': ''}, deferred=True)
+        mock_post.assert_not_called()
+
+        self.connection.get('/path')
+        self.connection.get('/path')
+
+        mock_post.assert_called_once_with('/rest/login-sessions', {'userName': 'administrator', 'password': ''})
+        self.assertEqual('new', mock_get_connection.return_value.request.call_args[0][3]['auth'])
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(connection, 'get_connection')
+    def test_deferred_login_should_login_before_upload(self, mock_get_connection, mock_post):
+        ApiVersionCache().store(self.host, {'minimumVersion': 120, 'currentVersion': 300})
+        file_path = self.__make_upload_file(b'0123456789')
+        mock_conn = mock_get_connection.return_value
+        mock_conn.getresponse.return_value = self.__make_http_response(status=202)
+        mock_post.return_value = None, {'sessionID': 'new'}
+        self.connection.login({'userName': 'administrator', 'password': ''}, deferred=True)
+
+        self.connection.post_multipart('/rest/firmware-bundles', None, file_path, 'spp.iso')
+
+        mock_post.assert_called_once_with('/rest/login-sessions', {'userName': 'administrator', 'password': ''})
+        mock_conn.putheader.assert_any_call('auth', 'new')
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(connection, 'get_connection')
+    def test_deferred_login_should_login_before_download(self, mock_get_connection, mock_post):
+        ApiVersionCache().store(self.host, {'minimumVersion': 120, 'currentVersion': 300})
+        dest = self.__make_upload_file(b'')
+        mock_conn = mock_get_connection.return_value
+        mock_conn.getresponse.return_value = self.__make_download_response(200, [b'0123456789'])
+        mock_post.return_value = None, {'sessionID': 'new'}
+        self.connection.login({'userName': 'administrator', 'password': ''}, deferred=True)
+
+        self.connection.download('/rest/backups/archive/1', dest)
+
+        mock_post.assert_called_once_with('/rest/login-sessions', {'userName': 'administrator', 'password': ''})
+        self.assertEqual('new', mock_conn.request.call_args[0][3]['auth'])
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(connection, 'get_connection')
+    def test_post_multipart_should_login_again_when_session_expired(self, mock_get_connection, mock_post):
+        file_path = self.__make_upload_file(b'0123456789')
+        mock_conn = mock_get_connection.return_value
+        mock_conn.getresponse.side_effect = [self.__make_http_response(status=401),
+                                             self.__make_http_response(status=202)]
+        mock_post.return_value = None, {'sessionID': 'new'}
+        self.connection._cred = {'userName': 'administrator', 'password': ''}
+        self.connection._headers['auth'] = 'expired'
+
+        response, body = self.connection.post_multipart('/rest/firmware-bundles', None, file_path, 'spp.iso')
+
+        self.assertEqual(202, response.status)
+        mock_post.assert_called_once_with('/rest/login-sessions', self.connection._cred)
+        self.assertEqual([call('auth', 'expired'), call('auth', 'new')],
+                         [c for c in mock_conn.putheader.call_args_list if c[0][0] == 'auth'])
+
+    @mock.patch.object(connection, 'post')
+    @mock.patch.object(connection, 'get_connection')
+    def test_download_should_login_again_when_session_expired(self, mock_get_connection, mock_post):
+        dest = self.__make_upload_file(b'')
+        mock_conn = mock_get_connection.return_value
+        mock_conn.getresponse.side_effect = [self.__make_download_response(401, []),
+                                             self.__make_download_response(200, [b'0123456789'])]
+        mock_post.return_value = None, {'sessionID': 'new'}
+        self.connection._cred = {'userName': 'administrator', 'password': ''}
+        self.connection._headers['auth'] = 'expired'
+
+        self.assertTrue(self.connection.download('/rest/backups/archive/1', dest))
+
+        mock_post.assert_called_once_with('/rest/login-sessions', self.connection._cred)
+        self.assertEqual('new', mock_conn.request.call_args[0][3]['auth'])
+        with open(dest, 'rb') as f:
+            self.assertEqual(b'0123456789', f.read())
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_download_should_raise_exception_when_session_cannot_be_renewed(self, mock_get_connection):
+        dest = self.__make_upload_file(b'')
+        mock_get_connection.return_value.getresponse.return_value = self.__make_download_response(
+            401, [b'{"message": "Unauthorized"}'])
+        self.connection._headers['auth'] = 'expired'
+
+        self.assertRaises(HPOneViewException, self.connection.download, '/rest/backups/archive/1', dest)
+
+    @mock.patch.object(connection, 'do_http')
+    def test_pagination_state_should_be_kept_per_thread(self, mock_do_http):
+        def do_http(method, path, body, custom_headers=None):
+            return mock.Mock(status=200), {'members': [], 'nextPageUri': path + '?start=1', 'total': len(path)}
+
+        mock_do_http.side_effect = do_http
+        all_threads_read = threading.Barrier(8, timeout=5) if hasattr(threading, 'Barrier') else None
+        if all_threads_read is None:
+            self.skipTest('threading.Barrier is not available')
+        errors = []
+
+        def read_collection(uri):
+            for i in range(20):
+                try:
+                    self.connection.get(uri)
+                    # Every thread reads its collection before any thread checks its pagination state
+                    all_threads_read.wait()
+                except Exception as e:
+                    errors.append(e)
+                if self.connection._nextPage != uri + '?start=1' or self.connection._numTotalRecords != len(uri):
+                    errors.append(uri)
+                all_threads_read.wait()
+
+        threads = [threading.Thread(target=read_collection, args=('/rest/collection' + 'x' * i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+
+    @mock.patch.object(connection, 'get_connection')
+    def test_headers_should_be_consistent_while_changed_concurrently(self, mock_get_connection):
+        sent_headers = []
+
+        def make_connection():
+            conn = mock.Mock()
+            conn.request.side_effect = lambda method, path, body, headers: sent_headers.append(headers)
+            conn.getresponse.side_effect = lambda: self.__make_keep_alive_response()
+            return conn
+
+        mock_get_connection.side_effect = make_connection
+        errors = []
+
+        def send_requests():
+            for i in range(200):
+                self.connection.do_http('GET', '/path', '')
+
+        def change_headers():
+            for i in range(200):
+                self.connection.set_compression(i % 2 == 0)
+                self.connection._connection__set_headers({'auth': 'session%d' % i})
+
+        def run(function):
+            try:
+                function()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(function,))
+                   for function in [send_requests] * 4 + [change_headers]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(800, len(sent_headers))
+        for headers in sent_headers:
+            self.assertEqual(200, headers['X-API-Version'])
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import mock
+import unittest
+
+from hpOneView import json_codec
+from hpOneView.json_codec import JSONCodec, OrjsonCodec, UjsonCodec, get_default_codec
+
+
+class JSONCodecTest(unittest.TestCase):
+    def test_loads_should_parse_bytes(self):
+        self.assertEqual({'name': 'ção'}, JSONCodec().loads('{"name": "ção"}'.encode('utf-8')))
+
+    def test_loads_should_parse_text(self):
+        self.assertEqual({'name': 'value'}, JSONCodec().loads('{"name": "value"}'))
+
+    def test_loads_should_raise_value_error_when_invalid(self):
+        self.assertRaises(ValueError, JSONCodec().loads, b'not json')
+
+    def test_dumps_should_use_standard_library_format(self):
+        self.assertEqual('{"name": "value"}', JSONCodec().dumps({'name': 'value'}))
+
+    @unittest.skipIf(json_codec.orjson is None, 'orjson is not installed')
+    def test_orjson_codec_should_parse_bytes(self):
+        codec = OrjsonCodec()
+
+        self.assertEqual({'name': 'value'}, codec.loads(b'{"name": "value"}'))
+        self.assertRaises(ValueError, codec.loads, b'not json')
+        self.assertEqual('{"name": "value"}', codec.dumps({'name': 'value'}))
+
+    @unittest.skipIf(json_codec.ujson is None, 'ujson is not installed')
+    def test_ujson_codec_should_parse_bytes(self):
+        codec = UjsonCodec()
+
+        self.assertEqual({'name': 'value'}, codec.loads(b'{"name": "value"}'))
+        self.assertRaises(ValueError, codec.loads, b'not json')
+
+    @mock.patch.object(json_codec, 'ujson', None)
+    @mock.patch.object(json_codec, 'orjson', None)
+    def test_get_default_codec_should_fall_back_to_standard_library(self):
+        self.assertIs(JSONCodec, type(get_default_codec()))
+
+    @mock.patch.object(json_codec, 'ujson', mock.Mock())
+    @mock.patch.object(json_codec, 'orjson', None)
+    def test_get_default_codec_should_use_ujson_when_installed(self):
+        self.assertIsInstance(get_default_codec(), UjsonCodec)
+
+    @mock.patch.object(json_codec, 'orjson', mock.Mock())
+    def test_get_default_codec_should_prefer_orjson(self):
+        self.assertIsInstance(get_default_codec(), OrjsonCodec)
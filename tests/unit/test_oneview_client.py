@@ -28,6 +28,7 @@ import mock
 
 from hpOneView.connection import connection
 from hpOneView.oneview_client import OneViewClient
+from hpOneView.session_store import FileSessionStore
 from hpOneView.resources.data_services.metric_streaming import MetricStreaming
 from hpOneView.resources.facilities.power_devices import PowerDevices
 from hpOneView.resources.facilities.racks import Racks
@@ -86,6 +87,49 @@ class OneViewClientTest(unittest.TestCase):
         else:
             self.fail()
 
+    @mock.patch.object(connection, 'login')
+    def test_deferred_login(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "deferred_login": True,
+                  "credentials": {
+                      "authLoginDomain": "",
+                      "userName": "administrator",
+                      "password": ""}}
+
+        OneViewClient(config)
+
+        mock_login.assert_called_once_with(config["credentials"], deferred=True)
+
+    @mock.patch.object(connection, 'set_version_cache')
+    @mock.patch.object(connection, 'login')
+    def test_version_cache(self, mock_login, mock_set_version_cache):
+        config = {"ip": "172.16.102.59",
+                  "version_cache": "/tmp/versions",
+                  "credentials": {
+                      "authLoginDomain": "",
+                      "userName": "administrator",
+                      "password": ""}}
+
+        OneViewClient(config)
+
+        mock_set_version_cache.assert_called_once_with("/tmp/versions")
+
+    @mock.patch.object(connection, 'set_session_store')
+    @mock.patch.object(connection, 'login')
+    def test_session_store(self, mock_login, mock_set_session_store):
+        config = {"ip": "172.16.102.59",
+                  "session_store": "/tmp/sessions",
+                  "credentials": {
+                      "authLoginDomain": "",
+                      "userName": "administrator",
+                      "password": ""}}
+
+        OneViewClient(config)
+
+        session_store = mock_set_session_store.call_args[0][0]
+        self.assertIsInstance(session_store, FileSessionStore)
+        self.assertEqual("/tmp/sessions", session_store._path)
+
     @mock.patch.object(connection, 'login')
     @mock.patch(mock_builtin('open'))
     def test_from_json_file(self, mock_open, mock_login):
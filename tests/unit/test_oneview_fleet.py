@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import io
+import threading
+import unittest
+
+import mock
+
+from hpOneView.connection import connection
+from hpOneView.exceptions import HPOneViewException
+from hpOneView.oneview_client import OneViewClient
+from hpOneView.oneview_fleet import OneViewFleet, FleetResource, FleetResult
+from hpOneView.resources.servers.server_hardware import ServerHardware
+from tests.test_utils import mock_builtin
+
+
+class OneViewFleetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.configs = [self.__make_config("172.16.102.1"), self.__make_config("172.16.102.2")]
+
+    def __make_config(self, ip):
+        return {"ip": ip,
+                "credentials": {
+                    "authLoginDomain": "",
+                    "userName": "administrator",
+                    "password": ""}}
+
+    @mock.patch.object(connection, 'login')
+    def test_should_login_to_all_appliances(self, mock_login):
+        fleet = OneViewFleet(self.configs)
+
+        self.assertEqual(["172.16.102.1", "172.16.102.2"], list(fleet.clients))
+        self.assertIsInstance(fleet.clients["172.16.102.1"], OneViewClient)
+        self.assertEqual(2, mock_login.call_count)
+        self.assertEqual({}, fleet.login_errors)
+
+    @mock.patch.object(connection, 'login')
+    def test_should_raise_value_error_for_duplicate_appliance(self, mock_login):
+        self.assertRaises(ValueError, OneViewFleet, self.configs + [self.__make_config("172.16.102.1")])
+        mock_login.assert_not_called()
+
+    @mock.patch.object(connection, 'login')
+    def test_should_login_concurrently(self, mock_login):
+        both_logging_in = threading.Barrier(2, timeout=5) if hasattr(threading, 'Barrier') else None
+        if both_logging_in is None:
+            self.skipTest('threading.Barrier is not available')
+        mock_login.side_effect = lambda credentials, deferred: both_logging_in.wait()
+
+        fleet = OneViewFleet(self.configs)
+
+        self.assertEqual(2, len(fleet.clients))
+
+    @mock.patch.object(connection, 'login')
+    def test_should_keep_appliances_that_failed_to_login_out_of_the_fleet(self, mock_login):
+        error = HPOneViewException("Unauthorized")
+        mock_login.side_effect = [None, error]
+
+        fleet = OneViewFleet(self.configs, max_workers=1)
+
+        self.assertEqual(["172.16.102.1"], list(fleet.clients))
+        self.assertEqual({"172.16.102.2": error}, fleet.login_errors)
+
+    @mock.patch.object(connection, 'login')
+    def test_should_expose_resource_properties_of_oneview_client(self, mock_login):
+        fleet = OneViewFleet(self.configs)
+
+        self.assertIsInstance(fleet.server_hardware, FleetResource)
+        self.assertIs(fleet.server_hardware, fleet.server_hardware)
+
+    @mock.patch.object(connection, 'login')
+    def test_should_raise_attribute_error_for_unknown_property(self, mock_login):
+        fleet = OneViewFleet(self.configs)
+
+        self.assertRaises(AttributeError, getattr, fleet, 'from_json_file_unknown')
+
+    @mock.patch.object(ServerHardware, 'get_all')
+    @mock.patch.object(connection, 'login')
+    def test_resource_call_should_run_on_all_appliances(self, mock_login, mock_get_all):
+        mock_get_all.side_effect = [[{"name": "server1"}], [{"name": "server2"}, {"name": "server3"}]]
+        fleet = OneViewFleet(self.configs, max_workers=1)
+
+        result = fleet.server_hardware.get_all(filter="powerState='On'")
+
+        self.assertIsInstance(result, FleetResult)
+        self.assertEqual([("172.16.102.1", {"name": "server1"}),
+                          ("172.16.102.2", {"name": "server2"}),
+                          ("172.16.102.2", {"name": "server3"})], result.merged())
+        mock_get_all.assert_called_with(filter="powerState='On'")
+        self.assertEqual(2, mock_get_all.call_count)
+
+    @mock.patch.object(ServerHardware, 'get')
+    @mock.patch.object(connection, 'login')
+    def test_resource_call_should_keep_errors_per_appliance(self, mock_login, mock_get):
+        error = HPOneViewException("Not found")
+        mock_get.side_effect = [{"name": "server1"}, error]
+        fleet = OneViewFleet(self.configs, max_workers=1)
+
+        result = fleet.server_hardware.get("1")
+
+        self.assertEqual({"172.16.102.1": {"name": "server1"}}, result.results)
+        self.assertEqual({"172.16.102.2": error}, result.errors)
+        self.assertEqual([("172.16.102.1", {"name": "server1"})], result.merged())
+        self.assertEqual(2, len(result))
+
+    @mock.patch.object(connection, 'login')
+    def test_run_should_call_function_with_each_client(self, mock_login):
+        fleet = OneViewFleet(self.configs)
+
+        result = fleet.run(lambda client: client.connection.get_host())
+
+        self.assertEqual({"172.16.102.1": "172.16.102.1", "172.16.102.2": "172.16.102.2"}, result.results)
+
+    @mock.patch.object(connection, 'close_connections')
+    @mock.patch.object(connection, 'login')
+    def test_close_should_close_connections_of_all_appliances(self, mock_login, mock_close_connections):
+        fleet = OneViewFleet(self.configs)
+
+        fleet.close()
+
+        self.assertEqual(2, mock_close_connections.call_count)
+
+    @mock.patch.object(connection, 'login')
+    @mock.patch(mock_builtin('open'))
+    def test_from_json_file(self, mock_open, mock_login):
+        json_config_content = u"""[{
+          "ip": "172.16.102.1",
+          "credentials": {
+            "userName": "administrator",
+            "authLoginDomain": "",
+            "password": ""
+          }
+        }]"""
+        mock_open.return_value = io.StringIO(json_config_content)
+        fleet = OneViewFleet.from_json_file("config.json")
+
+        self.assertEqual(["172.16.102.1"], list(fleet.clients))
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import mock
+import unittest
+
+from hpOneView.response_cache import ResponseCache
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(max_size=2, ttls={'/rest/switch-types': 60, '/rest/switch-types/fixed': 0})
+
+    def test_get_ttl_should_match_longest_prefix(self):
+        self.assertEqual(60, self.cache.get_ttl('/rest/switch-types/1'))
+        self.assertEqual(0, self.cache.get_ttl('/rest/switch-types/fixed?count=1'))
+
+    def test_get_ttl_should_not_match_partial_segment(self):
+        self.assertIsNone(self.cache.get_ttl('/rest/switch-types-other'))
+
+    def test_store_should_ignore_uri_without_ttl(self):
+        self.cache.store('/rest/tasks/1', {'name': 'task'})
+
+        self.assertIsNone(self.cache.lookup('/rest/tasks/1'))
+
+    def test_store_should_take_etag_from_body(self):
+        self.cache.store('/rest/switch-types/1', {'eTag': '1'})
+
+        self.assertEqual('1', self.cache.lookup('/rest/switch-types/1').etag)
+
+    def test_store_should_prefer_etag_header(self):
+        self.cache.store('/rest/switch-types/1', {'eTag': '1'}, etag='"2"')
+
+        self.assertEqual('"2"', self.cache.lookup('/rest/switch-types/1').etag)
+
+    def test_store_should_evict_least_recently_used(self):
+        self.cache.store('/rest/switch-types/1', {'name': '1'})
+        self.cache.store('/rest/switch-types/2', {'name': '2'})
+        self.cache.lookup('/rest/switch-types/1')
+
+        self.cache.store('/rest/switch-types/3', {'name': '3'})
+
+        self.assertIsNone(self.cache.lookup('/rest/switch-types/2'))
+        self.assertIsNotNone(self.cache.lookup('/rest/switch-types/1'))
+        self.assertEqual(2, len(self.cache))
+
+    @mock.patch('time.time')
+    def test_entry_should_expire_after_ttl(self, mock_time):
+        mock_time.return_value = 100.0
+        self.cache.store('/rest/switch-types/1', {'name': '1'})
+        entry = self.cache.lookup('/rest/switch-types/1')
+
+        self.assertTrue(entry.is_fresh())
+        mock_time.return_value = 160.0
+        self.assertFalse(entry.is_fresh())
+
+    @mock.patch('time.time')
+    def test_refresh_should_restart_ttl(self, mock_time):
+        mock_time.return_value = 100.0
+        self.cache.store('/rest/switch-types/1', {'name': '1'})
+        mock_time.return_value = 160.0
+
+        self.cache.refresh('/rest/switch-types/1')
+
+        self.assertTrue(self.cache.lookup('/rest/switch-types/1').is_fresh())
+
+    def test_invalidate_should_remove_entry(self):
+        self.cache.store('/rest/switch-types/1', {'name': '1'})
+
+        self.cache.invalidate('/rest/switch-types/1')
+
+        self.assertIsNone(self.cache.lookup('/rest/switch-types/1'))
+
+    def test_invalidate_should_remove_query_variants_and_sub_resources(self):
+        self.cache = ResponseCache(ttls={'/rest/switch-types': 60})
+        self.cache.store('/rest/switch-types/1?view=expand', {'name': '1'})
+        self.cache.store('/rest/switch-types/1/ports', {'name': 'ports'})
+        self.cache.store('/rest/switch-types/10', {'name': '10'})
+
+        self.cache.invalidate('/rest/switch-types/1')
+
+        self.assertIsNone(self.cache.lookup('/rest/switch-types/1?view=expand'))
+        self.assertIsNone(self.cache.lookup('/rest/switch-types/1/ports'))
+        self.assertIsNotNone(self.cache.lookup('/rest/switch-types/10'))
+
+    def test_invalidate_listings_should_keep_members(self):
+        self.cache.store('/rest/switch-types?start=0&count=-1', {'members': []})
+        self.cache.store('/rest/switch-types/1', {'name': '1'})
+
+        self.cache.invalidate_listings('/rest/switch-types')
+
+        self.assertIsNone(self.cache.lookup('/rest/switch-types?start=0&count=-1'))
+        self.assertIsNotNone(self.cache.lookup('/rest/switch-types/1'))
+
+    def test_clear_should_remove_all_entries(self):
+        self.cache.store('/rest/switch-types/1', {'name': '1'})
+
+        self.cache.clear()
+
+        self.assertEqual(0, len(self.cache))
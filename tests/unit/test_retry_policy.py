@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import errno
+import socket
+import unittest
+
+import mock
+
+from hpOneView.exceptions import HPOneViewCircuitOpen
+from hpOneView.retry_policy import RetryPolicy, CircuitBreaker
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=3, backoff_base=1, backoff_max=3, jitter=False)
+
+    def test_should_retry_idempotent_request_on_retryable_status(self):
+        self.assertTrue(self.policy.should_retry('GET', 1, status=503))
+        self.assertTrue(self.policy.should_retry('PUT', 2, status=502))
+
+    def test_should_not_retry_on_other_status(self):
+        self.assertFalse(self.policy.should_retry('GET', 1, status=500))
+        self.assertFalse(self.policy.should_retry('GET', 1, status=404))
+
+    def test_should_not_retry_when_attempts_are_exhausted(self):
+        self.assertFalse(self.policy.should_retry('GET', 3, status=503))
+
+    def test_should_not_replay_post_that_may_have_been_processed(self):
+        self.assertFalse(self.policy.should_retry('POST', 1, status=503))
+        self.assertFalse(self.policy.should_retry('PATCH', 1, error=socket.error(errno.ECONNRESET, 'reset')))
+
+    def test_should_retry_post_that_was_not_processed(self):
+        self.assertTrue(self.policy.should_retry('POST', 1, status=429))
+        self.assertTrue(self.policy.should_retry('POST', 1, error=socket.error(errno.ECONNREFUSED, 'refused')))
+
+    def test_should_retry_idempotent_request_on_connection_error(self):
+        self.assertTrue(self.policy.should_retry('DELETE', 1, error=socket.timeout('timed out')))
+
+    def test_get_backoff_should_grow_exponentially_up_to_max(self):
+        self.assertEqual([1, 2, 3], [self.policy.get_backoff(attempt) for attempt in (1, 2, 3)])
+
+    def test_get_backoff_should_honor_retry_after(self):
+        self.assertEqual(2, self.policy.get_backoff(1, retry_after='2'))
+        self.assertEqual(3, self.policy.get_backoff(1, retry_after='120'))
+        self.assertEqual(1, self.policy.get_backoff(1, retry_after='Wed, 21 Oct 2015 07:28:00 GMT'))
+
+    @mock.patch('random.uniform')
+    def test_get_backoff_should_add_jitter(self, mock_uniform):
+        mock_uniform.return_value = 0.7
+
+        self.assertEqual(0.7, RetryPolicy(backoff_base=1).get_backoff(2))
+        mock_uniform.assert_called_once_with(0, 2)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.circuit_breaker = CircuitBreaker('127.0.0.1', failure_threshold=2, reset_timeout=30)
+
+    def test_should_open_after_consecutive_failures(self):
+        self.circuit_breaker.record(failed=True)
+        self.circuit_breaker.record(failed=True)
+
+        self.assertTrue(self.circuit_breaker.is_open)
+        self.assertRaises(HPOneViewCircuitOpen, self.circuit_breaker.before_request)
+
+    def test_should_reset_failures_on_success(self):
+        self.circuit_breaker.record(failed=True)
+        self.circuit_breaker.record(failed=False)
+        self.circuit_breaker.record(failed=True)
+
+        self.assertFalse(self.circuit_breaker.is_open)
+        self.circuit_breaker.before_request()
+
+    @mock.patch('time.time')
+    def test_should_let_one_request_through_after_reset_timeout(self, mock_time):
+        mock_time.return_value = 100
+        self.circuit_breaker.record(failed=True)
+        self.circuit_breaker.record(failed=True)
+        mock_time.return_value = 130
+
+        self.circuit_breaker.before_request()
+
+        self.assertRaises(HPOneViewCircuitOpen, self.circuit_breaker.before_request)
+
+    @mock.patch('time.time')
+    def test_should_close_when_trial_request_succeeds(self, mock_time):
+        mock_time.return_value = 100
+        self.circuit_breaker.record(failed=True)
+        self.circuit_breaker.record(failed=True)
+        mock_time.return_value = 130
+        self.circuit_breaker.before_request()
+
+        self.circuit_breaker.record(failed=False)
+
+        self.assertFalse(self.circuit_breaker.is_open)
+
+    @mock.patch('time.time')
+    def test_should_open_again_when_trial_request_fails(self, mock_time):
+        mock_time.return_value = 100
+        self.circuit_breaker.record(failed=True)
+        self.circuit_breaker.record(failed=True)
+        mock_time.return_value = 130
+        self.circuit_breaker.before_request()
+
+        self.circuit_breaker.record(failed=True)
+
+        self.assertRaises(HPOneViewCircuitOpen, self.circuit_breaker.before_request)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from hpOneView.session_store import FileSessionStore, write_private_file
+
+
+class FileSessionStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.session_store = FileSessionStore(os.path.join(self.path, 'sessions'))
+        self.cred = {'userName': 'administrator', 'password': 'secret', 'authLoginDomain': ''}
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_get_should_return_none_when_nothing_is_stored(self):
+        self.assertIsNone(self.session_store.get('127.0.0.1', self.cred))
+
+    def test_save_and_get(self):
+        self.session_store.save('127.0.0.1', self.cred, 'abc', 200)
+
+        session = self.session_store.get('127.0.0.1', self.cred)
+
+        self.assertEqual('abc', session['sessionID'])
+        self.assertEqual(200, session['apiVersion'])
+
+    def test_save_should_not_store_password(self):
+        self.session_store.save('127.0.0.1', self.cred, 'abc', 200)
+
+        for file_name in os.listdir(os.path.join(self.path, 'sessions')):
+            with open(os.path.join(self.path, 'sessions', file_name)) as session_file:
+                self.assertNotIn('secret', session_file.read())
+
+    def test_sessions_should_be_kept_per_appliance_and_user(self):
+        self.session_store.save('127.0.0.1', self.cred, 'abc', 200)
+
+        self.assertIsNone(self.session_store.get('127.0.0.2', self.cred))
+        self.assertIsNone(self.session_store.get('127.0.0.1', {'userName': 'operator'}))
+
+    @unittest.skipUnless(os.name == 'posix', 'file modes are only checked on POSIX')
+    def test_save_should_protect_session_files(self):
+        self.session_store.save('127.0.0.1', self.cred, 'abc', 200)
+
+        sessions_path = os.path.join(self.path, 'sessions')
+        self.assertEqual(0o700, stat.S_IMODE(os.stat(sessions_path).st_mode))
+        for file_name in os.listdir(sessions_path):
+            self.assertEqual(0o600, stat.S_IMODE(os.stat(os.path.join(sessions_path, file_name)).st_mode))
+
+    @unittest.skipUnless(os.name == 'posix', 'file modes are only checked on POSIX')
+    def test_get_should_ignore_files_readable_by_others(self):
+        self.session_store.save('127.0.0.1', self.cred, 'abc', 200)
+        sessions_path = os.path.join(self.path, 'sessions')
+        for file_name in os.listdir(sessions_path):
+            os.chmod(os.path.join(sessions_path, file_name), 0o644)
+
+        self.assertIsNone(self.session_store.get('127.0.0.1', self.cred))
+
+    def test_delete_should_keep_session_renewed_by_another_process(self):
+        self.session_store.save('127.0.0.1', self.cred, 'renewed', 200)
+
+        self.session_store.delete('127.0.0.1', self.cred, 'expired')
+
+        self.assertEqual('renewed', self.session_store.get('127.0.0.1', self.cred)['sessionID'])
+
+    def test_delete(self):
+        self.session_store.save('127.0.0.1', self.cred, 'abc', 200)
+
+        self.session_store.delete('127.0.0.1', self.cred, 'abc')
+
+        self.assertIsNone(self.session_store.get('127.0.0.1', self.cred))
+
+
+class WritePrivateFileTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.file_name = os.path.join(self.path, 'private', 'file.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_should_replace_file_content(self):
+        write_private_file(os.path.join(self.path, 'private'), self.file_name, 'old')
+        write_private_file(os.path.join(self.path, 'private'), self.file_name, 'new')
+
+        with open(self.file_name) as private_file:
+            self.assertEqual('new', private_file.read())
+        self.assertEqual(['file.json'], os.listdir(os.path.join(self.path, 'private')))
+
+    def test_should_remove_temporary_file_when_write_fails(self):
+        self.assertRaises(TypeError, write_private_file, os.path.join(self.path, 'private'), self.file_name, None)
+
+        self.assertEqual([], os.listdir(os.path.join(self.path, 'private')))